@@ -12,14 +12,6 @@ from core.form_filler import (
 from core.form_filler.models import FormFillError
 from core.logger import get_structured_logger
 from config import config
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_log,
-    after_log,
-)
 import types
 from core.resilience import get_resilience_executor, get_selector_executor  # for test patch compatibility
 
@@ -115,21 +107,19 @@ async def click_easy_apply_button(page: Page) -> None:
             )
             element_locator = locator.last
         
-        # Wait for the selected element to be visible and clickable
-        logger.debug("Waiting for selected button to be visible and clickable...")
-        await element_locator.wait_for(state="visible", timeout=timeout)
-        
-        # Get button text for logging
-        try:
-            button_text = await element_locator.text_content()
-            if button_text:
-                logger.info(f"Button text: '{button_text.strip()}'")
-        except Exception:
-            pass
+        # Get button text for logging; a browser round trip, so only when it is logged
+        if logger.isEnabledFor(logging.INFO):
+            try:
+                button_text = await element_locator.text_content()
+                if button_text:
+                    logger.info(f"Button text: '{button_text.strip()}'")
+            except Exception:
+                pass
         
-        # Click the element
+        # Click the element. The click itself waits for the button to be
+        # visible and clickable, so no separate wait_for round trip precedes it.
         logger.info("Clicking Easy Apply button...")
-        await element_locator.click()
+        await element_locator.click(timeout=timeout)
         logger.info("Easy Apply button clicked successfully")
         structured_logger.info("easy_apply_button_clicked_successfully")
         
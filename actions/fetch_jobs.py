@@ -6,11 +6,12 @@ from playwright.async_api import (
 )
 import re
 import logging
-from urllib.parse import urlencode
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from core.selectors import selectors
 from core.utils import (
     wait_for_any_selector,
     construct_full_url,
+    selector_cache,
 )
 from config import config  # Import new config object
 from core import database
@@ -20,6 +21,14 @@ from config import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# LinkedIn renders 25 job cards per search results page
+JOBS_PER_PAGE = 25
+# Number of pages used to prefetch search result pages concurrently
+PAGINATION_WORKERS = 4
+# How long a scrolled-to list item may take to render its job card. Items
+# without a card (e.g. promotions) give up after this.
+CARD_RENDER_TIMEOUT_MS = 1000
+
 
 async def _ensure_all_jobs_are_loaded(page: Page) -> None:
     """
@@ -40,7 +49,16 @@ async def _ensure_all_jobs_are_loaded(page: Page) -> None:
             try:
                 await item.scroll_into_view_if_needed()
                 logger.debug(f"Scrolled to item {i + 1}/{len(list_items)}")
-                await page.wait_for_timeout(200)  # Небольшая пауза после каждой прокрутки
+                # Ждем, пока карточка отрисуется, вместо фиксированной паузы;
+                # уже отрисованные карточки не ждут вовсе
+                try:
+                    await item.wait_for_selector(
+                        selectors["job_card_container"],
+                        state="attached",
+                        timeout=CARD_RENDER_TIMEOUT_MS,
+                    )
+                except PlaywrightTimeoutError:
+                    logger.debug(f"Item {i + 1} rendered no job card.")
             except Exception as e:
                 logger.warning(f"Could not scroll to item {i + 1}. It might have been removed from DOM. Error: {e}")
 
@@ -48,13 +66,20 @@ async def _ensure_all_jobs_are_loaded(page: Page) -> None:
         job_list_container = page.locator(selectors["job_search_results_container"]).first
         if await job_list_container.is_visible():
             await job_list_container.evaluate("element => element.scrollTop = element.scrollHeight")
-            await page.wait_for_timeout(1000)
 
         show_more_button_selector = selectors["show_more_button"]
         if await page.is_visible(show_more_button_selector, timeout=1000):
             logger.info("'Show more' button found after scrolling. Clicking it...")
             await page.click(show_more_button_selector)
-            await page.wait_for_timeout(2000) # Даем время на загрузку
+            # Ждем появления новых элементов списка вместо фиксированной паузы
+            try:
+                await page.wait_for_function(
+                    "([selector, count]) => document.querySelectorAll(selector).length > count",
+                    arg=[list_item_selector, len(list_items)],
+                    timeout=config.performance.max_wait_ms,
+                )
+            except PlaywrightTimeoutError:
+                logger.debug("No additional list items appeared after clicking 'Show more'.")
 
     except Exception as e:
         logger.error(f"An error occurred during the scrolling process: {e}")
@@ -106,21 +131,25 @@ async def _get_total_job_count(page: Page, url: str) -> int:
         return 0
 
 
-async def _extract_job_data_from_page(page: Page) -> list:
+async def _extract_job_data_from_page(page: Page) -> dict[int, dict]:
     """
     Scrapes the job_id, link, title, and company from all
     job cards on the currently loaded page using a simplified and direct approach.
+
+    Returns:
+        A dict keyed by job_id with {"link", "title", "company"} values, so
+        duplicate cards collapse while scraping.
     """
-    job_listings_data = []
+    job_listings_data: dict[int, dict] = {}
     # list_item_selector = ".scaffold-layout__list-item"
     list_item_selector = selectors["job_card_container_in_list"]
 
     logger.info(f"Scraping job links using selector: '{list_item_selector}'")
-    job_listings = await page.query_selector_all(list_item_selector)
+    job_listings = await selector_cache.get(page, "job_card_container_in_list").element_handles()
 
     if not job_listings:
         logger.warning("No job listings found on the current page with the specified selector.")
-        return []
+        return {}
 
     logger.info(f"Found {len(job_listings)} job list items to process.")
 
@@ -150,7 +179,7 @@ async def _extract_job_data_from_page(page: Page) -> list:
             title = (await title_element.inner_text()).strip()
             company_name = (await company_element.inner_text()).strip()
 
-            job_listings_data.append((job_id, link, title, company_name))
+            job_listings_data[job_id] = {"link": link, "title": title, "company": company_name}
 
         except Exception as e:
             logger.error(
@@ -162,6 +191,58 @@ async def _extract_job_data_from_page(page: Page) -> list:
     return job_listings_data
 
 
+def _page_url_prefix(initial_url: str) -> str:
+    """Returns `initial_url` without its `start` param, ready for `start=N` to be appended.
+
+    Computed once per search so each result page URL is a plain string concat
+    instead of a re-parse and full urlencode per page.
+    """
+    parts = urlsplit(initial_url)
+    query = urlencode([(key, value) for key, value in parse_qsl(parts.query) if key != "start"])
+    return urlunsplit(parts._replace(query=query)) + ("&" if query else "?")
+
+
+async def _scrape_loaded_results_page(page: Page) -> dict[int, dict]:
+    """Loads every job card on the current search results page and scrapes it."""
+    # Вызываем скроллинг здесь, чтобы подгрузить все вакансии на текущей странице
+    await _ensure_all_jobs_are_loaded(page)
+
+    # Wait for any job listing to appear (robust to DOM variations)
+    # Use optimized parallel selector waiting instead of networkidle + polling
+    logger.debug("Waiting for job listings to appear...")
+
+    listing_selectors = [
+        # selectors['search_result_list_item'],
+        # selectors['search_result_list_item_guest'],
+        selectors['job_card_container']
+    ]
+
+    result = await wait_for_any_selector(
+        page,
+        listing_selectors,
+        timeout=config.performance.max_wait_ms
+    )
+
+    if not result:
+        logger.error("Timeout waiting for job listings")
+        # Continue anyway - let scraping function handle empty results
+    else:
+        matched_selector, _ = result
+        logger.debug(f"Found job listings with selector: {matched_selector}")
+
+    return await _extract_job_data_from_page(page)
+
+
+async def _scrape_results_page_at(page: Page, url: str) -> dict[int, dict]:
+    """Navigates a pagination worker page to `url` and scrapes its job cards."""
+    try:
+        await get_resilience_executor(page).navigate(url, wait_until="load")
+        return await _scrape_loaded_results_page(page)
+    except Exception as e:
+        logger.warning(f"Could not scrape result page {url}. Exception: {e}")
+        return {}
+
+
 async def fetch_job_links_user(
     page: Page, app_config: AppConfig, db_conn: sqlite3.Connection
 ) -> list:
@@ -184,6 +265,7 @@ async def fetch_job_links_user(
     
     if app_config.job_search.custom_job_search_url:
         initial_url = app_config.job_search.custom_job_search_url
+        page_url_prefix = _page_url_prefix(initial_url)
         logger.info(f"Using custom job search URL from config: {initial_url}")
     else:
         # Calculate f_tpr from config
@@ -216,7 +298,9 @@ async def fetch_job_links_user(
             "f_AL": "true",
             "sortBy": app_config.job_search.sort_by,
         }
-        initial_url = f"{base_url}?{urlencode(initial_params)}&start=0"
+        # Only `start` changes between result pages, so encode the rest once
+        page_url_prefix = f"{base_url}?{urlencode(initial_params)}&"
+        initial_url = f"{page_url_prefix}start=0"
         logger.info(f"Navigating to initial search URL: {initial_url}")
 
     executor = get_resilience_executor(page)
@@ -226,7 +310,8 @@ async def fetch_job_links_user(
     if num_available_jobs == 0:
         return []
 
-    unseen_collected = []
+    # Unseen jobs keyed by job_id, deduplicated as pages are accumulated
+    unseen_collected: dict[int, dict] = {}
 
     if max_jobs_to_fetch and max_jobs_to_fetch < num_available_jobs:
         logger.info(
@@ -237,52 +322,23 @@ async def fetch_job_links_user(
     job_title_pattern = re.compile(config.job_search.job_title_regex, re.IGNORECASE)
     logger.debug(f"Using JOB_TITLE filter pattern: {config.job_search.job_title_regex}")
 
-    while True:
-        # Вызываем скроллинг здесь, чтобы подгрузить все вакансии на текущей странице
-        await _ensure_all_jobs_are_loaded(page)
-
-        # Wait for any job listing to appear (robust to DOM variations)
-        # Use optimized parallel selector waiting instead of networkidle + polling
-        logger.debug("Waiting for job listings to appear...")
-        
-        listing_selectors = [
-            # selectors['search_result_list_item'],
-            # selectors['search_result_list_item_guest'],
-            selectors['job_card_container']
-        ]
-        
-        result = await wait_for_any_selector(
-            page,
-            listing_selectors,
-            timeout=config.performance.max_wait_ms
-        )
-        
-        if not result:
-            logger.error("Timeout waiting for job listings")
-            # Continue anyway - let scraping function handle empty results
-        else:
-            matched_selector, _ = result
-            logger.debug(f"Found job listings with selector: {matched_selector}")
-
-        page_results = await _extract_job_data_from_page(page)
-        if not page_results:
-            logger.warning("Scraping returned no results for a page, breaking loop.")
-            break
-
+    def _accumulate(page_results: dict[int, dict]) -> bool:
+        """Filters one page of results into unseen_collected; returns True once the limit is reached."""
         # Filter out already existing vacancies to accumulate only unseen
-        candidate_ids = [jid for jid, *_ in page_results]
-        existing_ids = database.get_existing_vacancy_ids(candidate_ids, db_conn)
-        page_unseen = [job for job in page_results if job[0] not in existing_ids]
+        existing_ids = database.get_existing_vacancy_ids(list(page_results), db_conn)
+        page_unseen = [
+            (job_id, job) for job_id, job in page_results.items()
+            if job_id not in existing_ids and job_id not in unseen_collected
+        ]
 
         # Filter by JOB_TITLE regex pattern
         page_title_filtered = []
-        for job in page_unseen:
-            job_id, link, title, company_name = job
-            if job_title_pattern.search(title):
-                page_title_filtered.append(job)
+        for job_id, job in page_unseen:
+            if job_title_pattern.search(job["title"]):
+                page_title_filtered.append((job_id, job))
             else:
-                logger.debug(f"Filtered out '{title}' - doesn't match JOB_TITLE pattern")
-        
+                logger.debug(f"Filtered out '{job['title']}' - doesn't match JOB_TITLE pattern")
+
         # Log filtering statistics for this page
         if page_unseen:
             filtered_count = len(page_unseen) - len(page_title_filtered)
@@ -292,73 +348,124 @@ async def fetch_job_links_user(
             )
 
         # Accumulate filtered jobs until we reach the configured limit
-        for job in page_title_filtered:
+        for job_id, job in page_title_filtered:
             if max_jobs_to_fetch and len(unseen_collected) >= max_jobs_to_fetch:
                 break
-            unseen_collected.append(job)
+            unseen_collected[job_id] = job
 
         if max_jobs_to_fetch and len(unseen_collected) >= max_jobs_to_fetch:
             logger.info(
                 f"Reached configured limit of {max_jobs_to_fetch} unseen jobs. Stopping discovery."
             )
-            break
-
-        # Check for and click the 'Next' pagination button
-        next_button_selector = selectors["pagination_next_button"]
-        if await page.is_visible(next_button_selector, timeout=2000):
-            logger.info("Found 'Next' pagination button. Clicking it...")
-            await page.click(next_button_selector)
-            await page.wait_for_timeout(2000) # Give some time for the next page to load
-            # After clicking next, we need to continue the loop to process the new page
-        else:
-            logger.info("No 'Next' pagination button found. Reached the end of pagination.")
-            break # Break the loop if no next button
+            return True
+        return False
+
+    # The first page is already loaded on the main page
+    first_page_results = await _scrape_loaded_results_page(page)
+    if not first_page_results:
+        logger.warning("Scraping returned no results for a page, breaking loop.")
+    elif not _accumulate(first_page_results):
+        # The total count is known up front, so the remaining pages are addressed
+        # directly by their `start` offset and fetched in parallel waves.
+        page_starts = list(range(JOBS_PER_PAGE, num_available_jobs, JOBS_PER_PAGE))
+        if page_starts:
+            worker_pages = [
+                await page.context.new_page()
+                for _ in range(min(PAGINATION_WORKERS, len(page_starts)))
+            ]
+            try:
+                for wave_offset in range(0, len(page_starts), len(worker_pages)):
+                    wave = page_starts[wave_offset:wave_offset + len(worker_pages)]
+                    logger.info(f"Prefetching result pages at offsets {wave}...")
+                    wave_results = await asyncio.gather(
+                        *(
+                            _scrape_results_page_at(worker_page, f"{page_url_prefix}start={start}")
+                            for worker_page, start in zip(worker_pages, wave)
+                        )
+                    )
+                    # Consume pages in offset order so the limit is applied deterministically
+                    stop = False
+                    for page_results in wave_results:
+                        if not page_results:
+                            logger.warning("Scraping returned no results for a page, breaking loop.")
+                            stop = True
+                            break
+                        if _accumulate(page_results):
+                            stop = True
+                            break
+                    if stop:
+                        break
+                else:
+                    logger.info("Reached the end of pagination.")
+            finally:
+                for worker_page in worker_pages:
+                    await worker_page.close()
 
     # Persist newly discovered unseen jobs
-    if unseen_collected:
-        database.save_discovered_jobs(unseen_collected, db_conn)
+    # The database layer and callers consume (job_id, link, title, company) tuples
+    unique_jobs = [
+        (job_id, job["link"], job["title"], job["company"])
+        for job_id, job in unseen_collected.items()
+    ]
+    if unique_jobs:
+        database.save_discovered_jobs(unique_jobs, db_conn)
 
-    unique_jobs = list({job[0]: job for job in unseen_collected}.values())
     logger.info(
         f"Extracted {len(unique_jobs)} unique new job links in total."
     )
     return unique_jobs
 
 
-async def _scrape_job_page_details(page: Page, link: str) -> dict:
-    """Scrapes details from the main job listing page."""
-    logger.debug(f"Scraping job details for {link}...")
-    executor = get_resilience_executor(page)
-    details = {}
-    description_element_selector = selectors["job_description"]
-    logger.debug(f"For description_element from job page using selector: {description_element_selector}")
-    description_locator = page.locator(description_element_selector).first
-    description_locator_ready = True
+async def _locator_ready(locator, selector: str, label: str, visible: bool = True) -> bool:
+    """Waits for `locator` to attach (and become visible); returns False on timeout."""
     try:
-        await description_locator.wait_for(
+        await locator.wait_for(
             state="attached",
             timeout=config.performance.max_wait_ms,
         )
-        await description_locator.wait_for(
-            state="visible",
-            timeout=config.performance.max_wait_ms,
-        )
+        if visible:
+            await locator.wait_for(
+                state="visible",
+                timeout=config.performance.max_wait_ms,
+            )
+        return True
     except PlaywrightTimeoutError:
         logger.warning(
-            "Job description locator `%s` did not become ready within %s ms.",
-            description_element_selector,
+            "%s locator `%s` did not become ready within %s ms.",
+            label,
+            selector,
             config.performance.max_wait_ms,
         )
-        description_locator_ready = False
+        return False
 
-    if description_locator_ready:
+
+async def _scrape_job_page_details(page: Page, link: str) -> dict:
+    """Scrapes details from the main job listing page.
+
+    The description, company description and employment type are read
+    concurrently from the already-loaded DOM, so a missing section costs one
+    readiness timeout for the page rather than one per section.
+    """
+    logger.debug(f"Scraping job details for {link}...")
+    executor = get_resilience_executor(page)
+
+    async def read_description() -> dict:
+        description_element_selector = selectors["job_description"]
+        logger.debug(f"For description_element from job page using selector: {description_element_selector}")
+        description_locator = page.locator(description_element_selector).first
+        if not await _locator_ready(description_locator, description_element_selector, "Job description"):
+            logger.warning(
+                "Job description selector did not find any element. Selector: %s",
+                description_element_selector,
+            )
+            return {}
         try:
             description_text = await executor.extract_text_with_retry(
                 description_locator,
                 "Job description",
             )
-            details["description"] = description_text
             logger.debug(f"Found job description: {description_text[:100]}...")
+            return {"description": description_text}
         except TimeoutError:
             logger.error("Timed out waiting for non-empty job description text.")
             raise
@@ -367,40 +474,24 @@ async def _scrape_job_page_details(page: Page, link: str) -> dict:
                 f"Could not fetch job description for {link}. Exception: {e}",
                 exc_info=True,
             )
-    else:
-        logger.warning(
-            "Job description selector did not find any element. Selector: %s",
-            description_element_selector,
-        )
-
-    company_description_selector = selectors["company_description"]
-    company_description_locator = page.locator(company_description_selector).first
-    company_description_ready = True
-    try:
-        await company_description_locator.wait_for(
-            state="attached",
-            timeout=config.performance.max_wait_ms,
-        )
-        await company_description_locator.wait_for(
-            state="visible",
-            timeout=config.performance.max_wait_ms,
-        )
-    except PlaywrightTimeoutError:
-        logger.warning(
-            "Company description locator `%s` did not become ready within %s ms.",
-            company_description_selector,
-            config.performance.max_wait_ms,
-        )
-        company_description_ready = False
+        return {}
 
-    if company_description_ready:
+    async def read_company_description() -> dict:
+        company_description_selector = selectors["company_description"]
+        company_description_locator = page.locator(company_description_selector).first
+        if not await _locator_ready(company_description_locator, company_description_selector, "Company description"):
+            logger.warning(
+                "Company description selector did not find any element. Selector: %s",
+                company_description_selector,
+            )
+            return {}
         try:
             company_description_text = await executor.extract_text_with_retry(
                 company_description_locator,
                 "Company description",
             )
-            details["company_description"] = company_description_text
             logger.debug(f"Found company description: {company_description_text[:100]}...")
+            return {"company_description": company_description_text}
         except TimeoutError:
             logger.warning("Timed out waiting for company description text.")
         except Exception as e:
@@ -408,69 +499,112 @@ async def _scrape_job_page_details(page: Page, link: str) -> dict:
                 f"Could not fetch company description on job page for {link}. Exception: {e}",
                 exc_info=True,
             )
-    else:
-        logger.warning(
-            "Company description selector did not find any element. Selector: %s",
-            company_description_selector,
-        )
+        return {}
 
-    try:
-        # Note: query_selector_all doesn't have retry wrapper, but individual elements are non-critical
-        employment_type_elements = await page.query_selector_all(
-            selectors["employment_type_details"]
-        )
-        if employment_type_elements:
-            employment_types = [
-                (await el.inner_text()).strip() for el in employment_type_elements
-            ]
-            details["employment_type"] = ", ".join(employment_types[:2])
-            logger.debug(f"Found employment type: {details['employment_type']}")
-        else:
+    async def read_employment_type() -> dict:
+        try:
+            # One round-trip for all employment type chips; they are non-critical
+            employment_types = await page.locator(
+                selectors["employment_type_details"]
+            ).all_inner_texts()
+            if employment_types:
+                employment_type = ", ".join(text.strip() for text in employment_types[:2])
+                logger.debug(f"Found employment type: {employment_type}")
+                return {"employment_type": employment_type}
             logger.warning(f"Employment type selector did not find any elements. Selector: {selectors['employment_type_details']}")
-    except Exception as e:
-        logger.warning(
-            f"Could not fetch employment type for {link}. Exception: {e}",
-            exc_info=True,
-        )
-        
+        except Exception as e:
+            logger.warning(
+                f"Could not fetch employment type for {link}. Exception: {e}",
+                exc_info=True,
+            )
+        return {}
+
+    results = await asyncio.gather(
+        read_description(),
+        read_company_description(),
+        read_employment_type(),
+        return_exceptions=True,
+    )
+    details = {}
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        details.update(result)
     return details
 
 
+# Maps <dt> terms of the company "About" details list to vacancy fields
+COMPANY_DETAIL_TERMS = {
+    "website": "company_website",
+    "industry": "company_industry",
+    "company size": "company_size",
+    "headquarters": "company_headquarters",
+    "specialties": "company_specialties",
+}
+
+# Reads the <dl> in a single round-trip, scoped to the list itself, and returns
+# {term: first meaningful definition}. Link text is preferred for <dd> values.
+COMPANY_DETAILS_LIST_SCRIPT = """(node) => {
+    const details = {};
+    const dts = Array.from(node.querySelectorAll('dt'));
+
+    for (let i = 0; i < dts.length; i += 1) {
+        const dt = dts[i];
+        const term = dt.innerText.trim().toLowerCase();
+        if (!term || term in details) {
+            continue;
+        }
+
+        // Only the dd elements between this dt and the next one belong to it
+        const nextDt = i + 1 < dts.length ? dts[i + 1] : null;
+        let currentElement = dt.nextElementSibling;
+
+        while (currentElement && currentElement !== nextDt) {
+            if (currentElement.tagName === 'DD') {
+                const link = currentElement.querySelector('a');
+                const definition = (link ? link.innerText : currentElement.innerText).trim();
+                // Skip empty definitions and secondary "associated members" information
+                if (definition &&
+                    !definition.includes('LinkedIn members who') &&
+                    !definition.includes('associated members')) {
+                    details[term] = definition;
+                    break;
+                }
+            }
+            currentElement = currentElement.nextElementSibling;
+        }
+    }
+
+    return details;
+}"""
+
+
 async def _scrape_company_about_page(page: Page, about_url: str) -> dict:
-    """Scrapes details from the company's 'About' page."""
+    """Scrapes details from the company's 'About' page.
+
+    The overview and the details list are read concurrently once the page has
+    loaded.
+    """
     executor = get_resilience_executor(page)
-    details = {}
     logger.info(f"Navigating to company 'About' page: {about_url}")
     await executor.navigate(about_url, wait_until="load")
 
-    overview_selector = selectors["company_about_overview"]
-    overview_locator = page.locator(overview_selector).first
-    overview_ready = True
-    try:
-        await overview_locator.wait_for(
-            state="attached",
-            timeout=config.performance.max_wait_ms,
-        )
-        await overview_locator.wait_for(
-            state="visible",
-            timeout=config.performance.max_wait_ms,
-        )
-    except PlaywrightTimeoutError:
-        logger.warning(
-            "Company overview locator `%s` did not become ready within %s ms.",
-            overview_selector,
-            config.performance.max_wait_ms,
-        )
-        overview_ready = False
-
-    if overview_ready:
+    async def read_overview() -> dict:
+        overview_selector = selectors["company_about_overview"]
+        overview_locator = page.locator(overview_selector).first
+        if not await _locator_ready(overview_locator, overview_selector, "Company overview"):
+            logger.warning(
+                "Company overview selector did not find any element. Selector: %s",
+                overview_selector,
+            )
+            return {}
         try:
             overview_text = await executor.extract_text_with_retry(
                 overview_locator,
                 "Company overview",
             )
-            details["company_overview"] = overview_text
             logger.debug(f"Found company overview: {overview_text[:100]}...")
+            return {"company_overview": overview_text}
         except TimeoutError:
             logger.warning(
                 "Timed out waiting for company overview text."
@@ -480,29 +614,22 @@ async def _scrape_company_about_page(page: Page, about_url: str) -> dict:
                 f"Could not fetch company overview. Exception: {e}",
                 exc_info=True,
             )
-    else:
-        logger.warning(
-            "Company overview selector did not find any element. Selector: %s",
-            overview_selector,
-        )
+        return {}
+
+    async def read_details_list() -> dict:
+        details_list_selector = selectors["company_about_details_list"]
+        details_list_locator = page.locator(details_list_selector).first
+        if not await _locator_ready(
+            details_list_locator, details_list_selector, "Company details list", visible=False
+        ):
+            logger.warning(
+                "Company details list selector did not find any element. Selector: %s",
+                details_list_selector,
+            )
+            return {}
 
-    details_list_selector = selectors["company_about_details_list"]
-    details_list_locator = page.locator(details_list_selector).first
-    details_list_ready = True
-    try:
-        await details_list_locator.wait_for(
-            state="attached",
-            timeout=config.performance.max_wait_ms,
-        )
-    except PlaywrightTimeoutError:
-        logger.warning(
-            "Company details list locator `%s` did not attach within %s ms.",
-            details_list_selector,
-            config.performance.max_wait_ms,
-        )
-        details_list_ready = False
+        details = {}
 
-    if details_list_ready:
         try:
             try:
                 await details_list_locator.scroll_into_view_if_needed()
@@ -512,53 +639,17 @@ async def _scrape_company_about_page(page: Page, about_url: str) -> dict:
                     scroll_error,
                 )
 
-            detail_pairs = []
+            company_details = {}
             text_extraction_delays = config.resilience.text_extraction_delays
-            for delay in text_extraction_delays:
-                await asyncio.sleep(delay)
+            # Read the list right away and only wait (with the configured
+            # delays) while it is still empty.
+            for delay in (0, *text_extraction_delays):
+                if delay:
+                    await asyncio.sleep(delay)
                 try:
-                    evaluation_result = await details_list_locator.evaluate(
-                        """(node) => {
-                            const pairs = [];
-                            const dts = Array.from(node.querySelectorAll('dt'));
-                            
-                            for (let i = 0; i < dts.length; i += 1) {
-                                const dt = dts[i];
-                                const term = dt.innerText.trim().toLowerCase();
-                                
-                                // Find the next dt (if exists) to know where to stop looking for dd elements
-                                const nextDt = i + 1 < dts.length ? dts[i + 1] : null;
-                                
-                                // Find all dd elements that come after this dt but before the next dt
-                                let currentElement = dt.nextElementSibling;
-                                const definitions = [];
-                                
-                                while (currentElement && currentElement !== nextDt) {
-                                    if (currentElement.tagName === 'DD') {
-                                        const definition = currentElement.innerText.trim();
-                                        // Skip empty definitions and tooltip/button content
-                                        // Filter out "associated members" and similar secondary information
-                                        if (definition && 
-                                            !definition.includes('LinkedIn members who') &&
-                                            !definition.includes('associated members')) {
-                                            definitions.push(definition);
-                                        }
-                                    }
-                                    currentElement = currentElement.nextElementSibling;
-                                }
-                                
-                                // Use the first non-empty definition (skip additional dd elements like "associated members")
-                                if (definitions.length > 0 && term) {
-                                    // For "company size", prefer the first definition (employee count)
-                                    // For other fields, use the first definition
-                                    const definition = definitions[0];
-                                    pairs.push([term, definition]);
-                                }
-                            }
-                            
-                            return pairs;
-                        }"""
-                    )
+                    company_details = await details_list_locator.evaluate(
+                        COMPANY_DETAILS_LIST_SCRIPT
+                    ) or {}
                 except PlaywrightError as eval_error:
                     logger.debug(
                         "Failed to evaluate company details list (delay %s): %s",
@@ -567,8 +658,7 @@ async def _scrape_company_about_page(page: Page, about_url: str) -> dict:
                     )
                     continue
 
-                detail_pairs = evaluation_result or []
-                if detail_pairs:
+                if company_details:
                     break
 
                 logger.debug(
@@ -576,23 +666,12 @@ async def _scrape_company_about_page(page: Page, about_url: str) -> dict:
                     delay,
                 )
 
-            if detail_pairs:
-                for term, definition in detail_pairs:
-                    if term == "website":
-                        details["company_website"] = definition
-                        logger.debug(f"Found company website: {definition}")
-                    elif term == "industry":
-                        details["company_industry"] = definition
-                        logger.debug(f"Found company industry: {definition}")
-                    elif term == "company size":
-                        details["company_size"] = definition
-                        logger.debug(f"Found company size: {definition}")
-                    elif term == "headquarters":
-                        details["company_headquarters"] = definition
-                        logger.debug(f"Found company headquarters: {definition}")
-                    elif term == "specialties":
-                        details["company_specialties"] = definition
-                        logger.debug(f"Found company specialties: {definition}")
+            if company_details:
+                for term, definition in company_details.items():
+                    detail_key = COMPANY_DETAIL_TERMS.get(term)
+                    if detail_key:
+                        details[detail_key] = definition
+                        logger.debug(f"Found {detail_key}: {definition}")
                     elif term == "founded":
                         # Try to extract year from the definition
                         try:
@@ -622,12 +701,18 @@ async def _scrape_company_about_page(page: Page, about_url: str) -> dict:
                 f"Could not fetch company details list. Exception: {e}",
                 exc_info=True,
             )
-    else:
-        logger.warning(
-            "Company details list selector did not find any element. Selector: %s",
-            details_list_selector,
-        )
+        return details
 
+    results = await asyncio.gather(
+        read_overview(),
+        read_details_list(),
+        return_exceptions=True,
+    )
+    details = {}
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+        details.update(result)
     return details
 
 
@@ -46,9 +46,8 @@ async def login(page: Page) -> None:
     await executor.navigate("https://www.linkedin.com/login", wait_until="load")
 
     logger.debug("Entering login credentials.")
-    # Ensure inputs are present and visible before interacting
-    await executor.wait_for_selector("email_input", selectors["email_input"], timeout=config.performance.selector_timeout)
-    await executor.wait_for_selector("password_input", selectors["password_input"], timeout=config.performance.selector_timeout)
+    # fill() waits for each input itself and sets the value in a single call
+    # (no per-keystroke events), so no separate wait round-trips are needed.
     await executor.fill("email_input", config.login.email, css_selector=selectors["email_input"])
     await executor.fill("password_input", config.login.password, css_selector=selectors["password_input"])
 
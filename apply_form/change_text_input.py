@@ -2,12 +2,19 @@ from playwright.async_api import Page, ElementHandle
 
 
 async def change_text_input(
-    container: Page | ElementHandle, selector: str, value: str
+    container: Page | ElementHandle,
+    selector: str,
+    value: str,
+    use_keyboard: bool = False,
 ) -> None:
     """
     Changes the text of an input field. If a selector is provided,
     it finds the element within the container.
     Otherwise, the container itself is treated as the input element.
+
+    By default the value is set with a single fill() call. Pass
+    use_keyboard=True for inputs (e.g. autocomplete combos) whose listeners
+    need real key events; the text is then selected and typed instead.
     """
     input_element: ElementHandle  # Declare the variable and its expected type
 
@@ -28,9 +35,15 @@ async def change_text_input(
     # Get the current value of the input
     previous_value = await input_element.input_value()
 
-    # Only change the value if it's different
-    if previous_value != value:
+    # Only change the value if it's different (ignoring trailing whitespace)
+    if previous_value.rstrip() == value.rstrip():
+        return
+
+    if use_keyboard:
         # Click the input 3 times to select all text (similar to Ctrl+A)
         await input_element.click(click_count=3)
         # Type the new value
         await input_element.type(value)
+    else:
+        # Clear and set the value in one call
+        await input_element.fill(value)
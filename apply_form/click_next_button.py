@@ -5,13 +5,25 @@ from core.selectors import selectors
 from core.resilience import get_resilience_executor
 from core.logger import get_structured_logger
 
+# Resolves only once the footer button is actually enabled (both the native
+# `disabled` property and the ARIA flag LinkedIn toggles while validating).
+BUTTON_ENABLED_PREDICATE = """(sel) => {
+    const button = document.querySelector(sel);
+    return !!button && button.disabled === false && button.getAttribute('aria-disabled') !== 'true';
+}"""
+
+# Safety net only: the wait returns as soon as the predicate holds.
+BUTTON_ENABLED_TIMEOUT_MS = 5000
+
 
 async def click_next_button(page: Page, job_id: str = None, job_title: str = None) -> None:
     """
     Clicks the 'Next' or 'Review' button in the application form with resilience.
-    
+
     This function uses retry and circuit breaker patterns for reliable operation.
-    
+    After the click it waits on the DOM condition (submit/next button enabled)
+    instead of a fixed timeout.
+
     Args:
         page: Playwright page instance
         job_id: Optional job ID for context
@@ -19,29 +31,35 @@ async def click_next_button(page: Page, job_id: str = None, job_title: str = Non
     """
     logger = get_structured_logger(__name__)
     executor = get_resilience_executor(page)
-    
+
     # Create context for logging and metrics
     context = {}
     if job_id:
         context["job_id"] = job_id
     if job_title:
         context["job_title"] = job_title
-        
+
     # Log the operation
     logger.debug("clicking_next_button", **context)
-    
+
     # Click the next button with retry and circuit breaker protection
     await executor.click(
         selector_name="next_button",
         context=context
     )
-    
+
     # Wait for the next/submit button to be enabled before proceeding
-    await executor.wait_for_selector(
+    async def wait_until_enabled():
+        await page.wait_for_function(
+            BUTTON_ENABLED_PREDICATE,
+            arg=selectors["submit_or_next_button"],
+            timeout=BUTTON_ENABLED_TIMEOUT_MS,
+        )
+
+    await executor.execute_operation(
         selector_name="enabled_submit_or_next_button",
-        css_selector=selectors["enabled_submit_or_next_button"],
+        operation=wait_until_enabled,
         context=context,
-        timeout=3000  # Increased timeout for more reliability
     )
-    
+
     logger.debug("next_button_clicked_successfully", **context)
@@ -1,117 +1,152 @@
-from playwright.async_api import Page, ElementHandle
+from playwright.async_api import Locator, Page
 import logging
-import re
 from core.selectors import selectors
+from core.utils import selector_cache
+from .label_rules import match_label_rule
 
 logger = logging.getLogger(__name__)
 
 
-async def _process_single_radio_fieldset(fieldset: ElementHandle, booleans: dict):
-    """Processes a single fieldset to find and click a matching radio button."""
+# Attribute used to tag matching fieldsets so they can be addressed by selector
+RADIO_FIELDSET_INDEX_ATTRIBUTE = "data-boolean-radio-idx"
+
+# Runs the 2-option filter in the browser and returns only the groups worth
+# matching, so Python never round-trips through fieldsets it would discard.
+# Tags left by an earlier scan are cleared first: a fieldset that survives into
+# a later step may have moved, and a stale index would then be shared by two
+# fieldsets.
+TWO_OPTION_RADIO_FIELDSETS_SCRIPT = """(sels) => {
+    document.querySelectorAll(`[${sels.indexAttribute}]`).forEach((el) => {
+        el.removeAttribute(sels.indexAttribute);
+    });
+    const out = [];
+    document.querySelectorAll(sels.fieldset).forEach((fieldset, idx) => {
+        if (fieldset.querySelectorAll(sels.radio).length !== 2) return;
+        const legend = fieldset.querySelector(sels.legend);
+        if (!legend) return;
+        fieldset.setAttribute(sels.indexAttribute, String(idx));
+        out.push({ idx, text: legend.innerText });
+    });
+    return out;
+}"""
+
+
+async def _process_single_radio_fieldset(page: Page, candidate: dict, booleans: dict):
+    """Clicks the matching radio button of a 2-option fieldset found in the page."""
     try:
-        radio_inputs = await fieldset.query_selector_all(selectors["radio_input"])
-        if len(radio_inputs) != 2:
-            return  # Not a 2-option radio group
-
-        legend_element = await fieldset.query_selector(selectors["legend"])
-        if not legend_element:
-            return  # No legend found to match against
-
-        label_text = await legend_element.inner_text()
-        for label_regex, value in booleans.items():
-            if re.search(label_regex, label_text, re.IGNORECASE):
-                radio_value_to_click = "Yes" if value else "No"
-                radio_selector = (
-                    f"{selectors['radio_input']}[value='{radio_value_to_click}']"
-                )
-                radio_button = await fieldset.query_selector(radio_selector)
-                if radio_button:
-                    await radio_button.click()
-                    logger.debug(
-                        f"Selected '{radio_value_to_click}' for "
-                        + f"radio group '{label_text}'."
-                    )
-                break  # Exit inner loop once a match is found
+        label_text = candidate["text"]
+        matched_rule = match_label_rule(label_text, booleans)
+        if not matched_rule:
+            return
+
+        _, value = matched_rule
+        radio_value_to_click = "Yes" if value else "No"
+        radio_selector = (
+            f"fieldset[{RADIO_FIELDSET_INDEX_ATTRIBUTE}='{candidate['idx']}'] "
+            f"{selectors['radio_input']}[value='{radio_value_to_click}']"
+        )
+        radio_button = page.locator(radio_selector).first
+        if await radio_button.count():
+            await radio_button.click()
+            logger.debug(
+                f"Selected '{radio_value_to_click}' for "
+                + f"radio group '{label_text}'."
+            )
     except Exception as e:
         logger.warning(f"Could not process a radio button fieldset: {e}", exc_info=True)
 
 
 async def _fill_radio_buttons(page: Page, booleans: dict):
-    """Finds all radio button fieldsets and processes them one by one."""
-    fieldsets = await page.query_selector_all(selectors["fieldset"])
-    for fieldset in fieldsets:
-        await _process_single_radio_fieldset(fieldset, booleans)
+    """Finds all 2-option radio fieldsets in one call and processes them one by one."""
+    candidates = await page.evaluate(
+        TWO_OPTION_RADIO_FIELDSETS_SCRIPT,
+        {
+            "fieldset": selectors["fieldset"],
+            "radio": selectors["radio_input"],
+            "legend": selectors["legend"],
+            "indexAttribute": RADIO_FIELDSET_INDEX_ATTRIBUTE,
+        },
+    )
+    for candidate in candidates:
+        await _process_single_radio_fieldset(page, candidate, booleans)
+
+
+# Reads the element's own `labels` list, so no label[for='<id>'] selector has
+# to be built and resolved per field.
+ELEMENT_LABEL_TEXT_SCRIPT = """(el) => (el.labels && el.labels[0] ? el.labels[0].innerText : '')"""
+
+SELECT_OPTION_PAIRS_SCRIPT = """(el) => Array.from(el.options).map((o) => [o.value, o.text])"""
+
+
+async def _read_label_text(element: Locator) -> str:
+    """Returns the text of the first label associated with `element`, or ''."""
+    return await element.evaluate(ELEMENT_LABEL_TEXT_SCRIPT)
 
 
-async def _process_single_checkbox(page: Page, checkbox: ElementHandle, booleans: dict):
+async def _process_single_checkbox(page: Page, checkbox: Locator, booleans: dict):
     """Processes a single checkbox element."""
     try:
-        checkbox_id = await checkbox.get_attribute("id")
-        if not checkbox_id:
+        label_text = await _read_label_text(checkbox)
+        if not label_text:
             return
 
-        label_selector = selectors["label_for"].format(id=checkbox_id)
-        label_element = await page.query_selector(label_selector)
-        if not label_element:
+        matched_rule = match_label_rule(label_text, booleans)
+        if not matched_rule:
             return
 
-        label_text = await label_element.inner_text()
-        for label_regex, value in booleans.items():
-            if re.search(label_regex, label_text, re.IGNORECASE):
-                is_checked = await checkbox.is_checked()
-                if is_checked != value:
-                    await checkbox.click()
-                    logger.debug(f"Set checkbox '{label_text}' to {value}.")
-                break
+        _, value = matched_rule
+        is_checked = await checkbox.is_checked()
+        if is_checked != value:
+            await checkbox.click()
+            logger.debug(f"Set checkbox '{label_text}' to {value}.")
     except Exception as e:
         logger.warning(f"Could not process a checkbox: {e}", exc_info=True)
 
 
 async def _fill_checkboxes(page: Page, booleans: dict):
     """Finds all checkboxes and processes them one by one."""
-    checkboxes = await page.query_selector_all(selectors["checkbox"])
+    # Locators are lightweight references: unlike element handles they do not
+    # pin DOM nodes in the browser after the form is gone.
+    checkboxes = await selector_cache.get(page, "checkbox").all()
     for checkbox in checkboxes:
         await _process_single_checkbox(page, checkbox, booleans)
 
 
 async def _process_single_select(
-    page: Page, select_element: ElementHandle, booleans: dict
+    page: Page, select_element: Locator, booleans: dict
 ):
     """Processes a single 2-option select dropdown."""
     try:
-        options = await select_element.query_selector_all(selectors["select_option"])
-        if options and "select" in (await options[0].inner_text()).lower():
+        # [value, text] for every option in one call, without per-option
+        # inner_text() round-trips
+        options = await select_element.evaluate(SELECT_OPTION_PAIRS_SCRIPT)
+        if options and "select" in options[0][1].lower():
             options.pop(0)  # Remove placeholder option
 
         if len(options) != 2:
             return  # Skip selects that are not 2-option
 
-        select_id = await select_element.get_attribute("id")
-        if not select_id:
+        label_text = await _read_label_text(select_element)
+        if not label_text:
             return
 
-        label_selector = selectors["label_for"].format(id=select_id)
-        label_element = await page.query_selector(label_selector)
-        if not label_element:
+        matched_rule = match_label_rule(label_text, booleans)
+        if not matched_rule:
             return
 
-        label_text = await label_element.inner_text()
-        for label_regex, value in booleans.items():
-            if re.search(label_regex, label_text, re.IGNORECASE):
-                option_to_select = (
-                    options[1] if value else options[0]
-                )  # Corrected logic
-                option_value = await option_to_select.get_attribute("value")
-                await select_element.select_option(value=option_value)
-                logger.debug(f"Selected option for '{label_text}'.")
-                break
+        _, value = matched_rule
+        option_value, _ = (
+            options[1] if value else options[0]
+        )  # Corrected logic
+        await select_element.select_option(value=option_value)
+        logger.debug(f"Selected option for '{label_text}'.")
     except Exception as e:
         logger.warning(f"Could not process a select dropdown: {e}", exc_info=True)
 
 
 async def _fill_two_option_selects(page: Page, booleans: dict):
     """Finds all select dropdowns and processes them one by one."""
-    selects = await page.query_selector_all(selectors["select"])
+    selects = await selector_cache.get(page, "select").all()
     for select_element in selects:
         await _process_single_select(page, select_element, booleans)
 
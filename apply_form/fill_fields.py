@@ -1,3 +1,4 @@
+import asyncio
 from playwright.async_api import Page
 from typing import Optional
 from pathlib import Path
@@ -5,6 +6,7 @@ from pathlib import Path
 from config import AppConfig # Import AppConfig
 from .fill_multiple_choice_fields import fill_multiple_choice_fields
 from .fill_boolean import fill_boolean
+from .form_snapshot import capture_form_snapshot
 from .fill_text_fields import fill_text_fields
 from .insert_home_city import insert_home_city
 from .insert_phone import insert_phone
@@ -20,24 +22,36 @@ async def fill_fields(
     """
     Orchestrates filling with all types of fields in the application form.
     """
-    await insert_home_city(page, app_config.form_data.home_city)
-    await insert_phone(page, app_config.form_data.phone)
-    await uncheck_follow_company(page)
+    # Merged rule sets are computed once on the config and reused per form
+    text_fields = app_config.form_data.merged_text_fields
+    booleans = app_config.form_data.merged_booleans
+    multiple_choice_fields = app_config.form_data.merged_multiple_choice_fields
 
-    await upload_docs(page, app_config.form_data.cv_path, cover_letter_path)
+    # Read every field the helpers below match against in one round-trip
+    snapshot = await capture_form_snapshot(page)
 
-    # Combine text fields and years of experience into one dictionary
-    text_fields = {**app_config.form_data.text_fields, **app_config.form_data.years_of_experience}
-    await fill_text_fields(page, text_fields)
+    async def fill_focus_dependent_fields() -> None:
+        # Typing, fill() and clicks all go through the focused element, so these
+        # steps stay sequential to keep keystrokes from landing in another field.
+        # Multiple choice runs after the booleans: both set selects, and for a
+        # select matched by both rule sets the multiple choice answer must win.
+        await insert_home_city(page, app_config.form_data.home_city)
+        await insert_phone(page, app_config.form_data.phone)
+        await uncheck_follow_company(page, snapshot.follow_checked)
+        await fill_text_fields(
+            page,
+            text_fields,
+            snapshot.texts,
+            short_circuit=app_config.performance.short_circuit_text_fields,
+        )
+        await fill_boolean(page, booleans)
+        await fill_multiple_choice_fields(page, multiple_choice_fields, snapshot.selects)
 
-    # Add the visa sponsorship requirement to the booleans dict
-    booleans = app_config.form_data.booleans.copy()
-    booleans["sponsorship"] = app_config.form_data.requires_visa_sponsorship
-    await fill_boolean(page, booleans)
-
-    # Combine language proficiency and other multiple choice fields
-    multiple_choice_fields = {
-        **app_config.form_data.language_proficiency,
-        **app_config.form_data.multiple_choice_fields,
-    }
-    await fill_multiple_choice_fields(page, multiple_choice_fields)
+    # File uploads do not move focus or touch other fields, so their
+    # round-trips overlap with the sequential steps above.
+    await asyncio.gather(
+        fill_focus_dependent_fields(),
+        upload_docs(
+            page, app_config.form_data.cv_path, cover_letter_path, snapshot.uploads
+        ),
+    )
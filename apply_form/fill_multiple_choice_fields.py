@@ -1,45 +1,88 @@
-from playwright.async_api import Page, ElementHandle
+from functools import lru_cache
+from playwright.async_api import Page
 import logging
-import re
+from typing import Optional, Tuple
 
 from core.selectors import selectors
+from .label_rules import iter_label_rules
 
 logger = logging.getLogger(__name__)
 
+# Reads every labelled select with its options in a single round-trip, so the
+# label/option matching below runs purely in Python. An aria-label is used as
+# is; otherwise the select's own `labels` list gives its label directly.
+SELECT_FIELDS_SCRIPT = """(sels) => {
+    const out = [];
+    document.querySelectorAll(sels.select).forEach((el) => {
+        if (!el.id) return;
+        let text = el.getAttribute('aria-label');
+        if (!text) {
+            if (!el.labels || !el.labels[0]) return;
+            text = el.labels[0].innerText;
+        }
+        out.push({
+            id: el.id,
+            label: text,
+            options: Array.from(el.querySelectorAll(sels.option)).map((o) => ({
+                value: o.value,
+                text: o.text,
+            })),
+        });
+    });
+    return out;
+}"""
+
+SELECT_FIELDS_ARGS = {
+    "select": selectors["select"],
+    "option": selectors["select_option"],
+}
+
+
+@lru_cache(maxsize=256)
+def _find_option_value(
+    options: Tuple[Tuple[str, str], ...], desired_option_text: str
+) -> Optional[Tuple[str, str]]:
+    """
+    Returns (value, text) of the option whose text matches the desired text.
+
+    The same option sets (language proficiency, yes/no, ...) recur on most
+    Easy Apply forms, so the match is memoized by the option set itself
+    rather than by the select id, which is unique per job posting.
+    """
+    desired = desired_option_text.lower()
+    for value, text in options:
+        # Use strip() and lower() for a more robust comparison
+        if text.strip().lower() == desired:
+            return value, text
+    return None
+
 
 async def _process_select_element(
-    page: Page, select_element: ElementHandle, multiple_choice_fields: dict
+    page: Page, select_field: dict, multiple_choice_fields: dict
 ):
-    """Processes a single select element to find a match and fill it."""
+    """Processes a single select field to find a match and fill it."""
     try:
-        select_id = await select_element.get_attribute("id")
-        if not select_id:
-            return
-
-        label_selector = selectors["label_for"].format(id=select_id)
-        label_element = await page.query_selector(label_selector)
-        if not label_element:
-            return
-
-        label_text = await label_element.inner_text()
+        label_text = select_field["label"]
+        # The options were read together with the label, so trying further
+        # matching rules costs no extra DOM queries.
+        options = tuple((option["value"], option["text"]) for option in select_field["options"])
 
-        for label_regex, desired_option_text in multiple_choice_fields.items():
-            if re.search(label_regex, label_text, re.IGNORECASE):
+        for label_regex, desired_option_text in iter_label_rules(label_text, multiple_choice_fields):
+            logger.debug(
+                f"Found select field '{label_text}' matching regex '{label_regex}'."
+            )
+            matched_option = _find_option_value(options, desired_option_text)
+            if matched_option:
+                option_value, option_text = matched_option
+                await page.select_option(
+                    selectors["element_by_id"].format(id=select_field["id"]),
+                    value=option_value,
+                )
                 logger.debug(
-                    f"Found select field '{label_text}' matching regex '{label_regex}'."
+                    f"Selected option '{option_text}' "
+                    + f"for select field '{label_text}'."
                 )
-                options = await select_element.query_selector_all(selectors["select_option"])
-                for option_element in options:
-                    option_text = await option_element.inner_text()
-                    # Use strip() and lower() for a more robust comparison
-                    if option_text.strip().lower() == desired_option_text.lower():
-                        option_value = await option_element.get_attribute("value")
-                        await select_element.select_option(value=option_value)
-                        logger.debug(
-                            f"Selected option '{option_text}' "
-                            + f"for select field '{label_text}'."
-                        )
-                        return  # Exit after successfully filling the field
+                return  # Exit after successfully filling the field
 
     except Exception as e:
         logger.warning(
@@ -47,12 +90,20 @@ async def _process_select_element(
         )
 
 
-async def fill_multiple_choice_fields(page: Page, multiple_choice_fields: dict) -> None:
+async def fill_multiple_choice_fields(
+    page: Page,
+    multiple_choice_fields: dict,
+    select_fields: Optional[list[dict]] = None,
+) -> None:
     """
     Orchestrates filling multiple-choice select fields by processing them one by one.
+
+    `select_fields` are the entries from a form snapshot; when omitted they
+    are read from the page.
     """
     logger.debug("Starting to fill multiple choice fields...")
-    selects = await page.query_selector_all(selectors["select"])
-    for select_element in selects:
-        await _process_select_element(page, select_element, multiple_choice_fields)
+    if select_fields is None:
+        select_fields = await page.evaluate(SELECT_FIELDS_SCRIPT, SELECT_FIELDS_ARGS)
+    for select_field in select_fields:
+        await _process_select_element(page, select_field, multiple_choice_fields)
     logger.debug("Finished filling multiple choice fields.")
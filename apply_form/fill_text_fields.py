@@ -1,44 +1,96 @@
+import asyncio
 from playwright.async_api import Page
 import logging
-import re
+from typing import Optional
 
 from core.selectors import selectors
-from .change_text_input import change_text_input
+from .label_rules import label_rules_combined, match_label_rules
 
 
 logger = logging.getLogger(__name__)
 
+# Pairs every text input with its label text in a single round-trip. Cheap
+# attribute reads (aria-label, placeholder) come first; otherwise the input's
+# own `labels` list is used, which the browser keeps without a selector scan.
+# Inputs without an id cannot be filled by id and are skipped.
+TEXT_INPUT_LABELS_SCRIPT = """(sels) => {
+    const out = [];
+    document.querySelectorAll(sels.input).forEach((el) => {
+        if (!el.id) return;
+        let text = el.getAttribute('aria-label') || el.placeholder || '';
+        if (!text && el.labels && el.labels[0]) text = el.labels[0].innerText;
+        out.push({ id: el.id, label: text });
+    });
+    return out;
+}"""
 
-async def fill_text_fields(page: Page, text_fields: dict):
+TEXT_INPUT_LABELS_ARGS = {"input": selectors["text_input"]}
+
+# Years-of-experience answers are small ints; their strings are prebuilt once.
+_INT_STR = [str(i) for i in range(100)]
+
+
+def _format_value(value) -> str:
+    """Returns the text typed into an input for a configured rule value."""
+    # type() rather than isinstance() so booleans keep their "True"/"False" text
+    if type(value) is int and 0 <= value < 100:
+        return _INT_STR[value]
+    return str(value)
+
+
+async def fill_text_fields(
+    page: Page,
+    text_fields: dict,
+    pairs: Optional[list[dict]] = None,
+    short_circuit: bool = False,
+):
     """
     Fills text input fields based on a label regex match.
-    """
-    inputs = await page.query_selector_all(selectors["text_input"])
 
-    for input_element in inputs:
-        label_text = ""
+    `pairs` are the {id, label} entries from a form snapshot; when omitted
+    they are read from the page. With `short_circuit`, scanning stops once
+    every rule has filled at least one input; until then a rule still fills
+    each input it matches. Inputs after that point are left untouched. With
+    many rules (e.g. years of experience merged in) every rule rarely matches,
+    so the scan usually runs to the end anyway.
+    """
+    if pairs is None:
         try:
-            # Get the ID of the input to find its associated label
-            input_id = await input_element.get_attribute("id")
-            if input_id:
-                label_selector = selectors["label_for"].format(id=input_id)
-                label_element = await page.query_selector(label_selector)
-                if label_element:
-                    label_text = await label_element.inner_text()
+            pairs = await page.evaluate(TEXT_INPUT_LABELS_SCRIPT, TEXT_INPUT_LABELS_ARGS)
         except Exception as e:
-            # If label lookup fails, log it and continue to the next input
             logger.warning(
-                f"Could not find label for an input field. Exception: {e}",
+                f"Could not read labels for text input fields. Exception: {e}",
                 exc_info=True,
             )
+            return
+
+    labels = [pair["label"] for pair in pairs]
+    if label_rules_combined(text_fields):
+        # One combined regex pass per label; too cheap to be worth a thread hop
+        matches = match_label_rules(labels, text_fields)
+    else:
+        # Rule-by-rule scanning of every label can take a while with the
+        # years-of-experience rules merged in, so keep it off the event loop.
+        matches = await asyncio.to_thread(match_label_rules, labels, text_fields)
+
+    remaining = set(text_fields)
+
+    for pair, matched_rule in zip(pairs, matches):
+        if not matched_rule:
             continue
 
-        # Check if any of the provided regex keys match the label
-        for label_regex, value in text_fields.items():
-            if label_text and re.search(label_regex, label_text, re.IGNORECASE):
-                logger.debug(
-                    f"Found text field matching regex '{label_regex}'. "
-                    + "Filling with value."
-                )
-                await change_text_input(input_element, "", str(value))
-                break  # Move to the next input after a match is found and filled
+        label_regex, value = matched_rule
+        logger.debug(
+            f"Found text field matching regex '{label_regex}'. "
+            + "Filling with value."
+        )
+        # The input is known to exist, so a locator fill() sets it in a
+        # single call without acquiring a handle or reading its value first.
+        await page.locator(selectors["element_by_id"].format(id=pair["id"])).fill(
+            _format_value(value)
+        )
+
+        remaining.discard(label_regex)
+        if short_circuit and not remaining:
+            logger.debug("All text field rules matched; skipping remaining inputs.")
+            break
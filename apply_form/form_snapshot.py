@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from playwright.async_api import Page
+
+from core.selectors import selectors
+from .fill_multiple_choice_fields import SELECT_FIELDS_ARGS, SELECT_FIELDS_SCRIPT
+from .fill_text_fields import TEXT_INPUT_LABELS_ARGS, TEXT_INPUT_LABELS_SCRIPT
+from .uncheck_follow_company import FOLLOW_COMPANY_CHECKED_SCRIPT
+from .upload_docs import DOCUMENT_UPLOAD_LABELS_ARGS, DOCUMENT_UPLOAD_LABELS_SCRIPT
+
+# Runs the per-field discovery scripts back to back inside the page, so the
+# whole form is read in a single round-trip.
+FORM_SNAPSHOT_SCRIPT = f"""(args) => ({{
+    texts: ({TEXT_INPUT_LABELS_SCRIPT})(args.texts),
+    selects: ({SELECT_FIELDS_SCRIPT})(args.selects),
+    uploads: ({DOCUMENT_UPLOAD_LABELS_SCRIPT})(args.uploads),
+    followChecked: ({FOLLOW_COMPANY_CHECKED_SCRIPT})(args.follow),
+}})"""
+
+FORM_SNAPSHOT_ARGS = {
+    "texts": TEXT_INPUT_LABELS_ARGS,
+    "selects": SELECT_FIELDS_ARGS,
+    "uploads": DOCUMENT_UPLOAD_LABELS_ARGS,
+    "follow": selectors["follow_company_checkbox"],
+}
+
+
+@dataclass
+class FormSnapshot:
+    """Everything the fill helpers need to decide their actions locally."""
+
+    texts: list[dict] = field(default_factory=list)
+    selects: list[dict] = field(default_factory=list)
+    uploads: list[dict] = field(default_factory=list)
+    follow_checked: bool = False
+
+
+async def capture_form_snapshot(page: Page) -> FormSnapshot:
+    """
+    Reads text inputs, selects, upload fields and the follow-company checkbox
+    of the current form with one page.evaluate.
+    """
+    snapshot = await page.evaluate(FORM_SNAPSHOT_SCRIPT, FORM_SNAPSHOT_ARGS)
+    return FormSnapshot(
+        texts=snapshot["texts"],
+        selects=snapshot["selects"],
+        uploads=snapshot["uploads"],
+        follow_checked=snapshot["followChecked"],
+    )
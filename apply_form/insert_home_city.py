@@ -8,4 +8,5 @@ async def insert_home_city(page: Page, home_city: str) -> None:
     """
     Inserts the home city into the appropriate field.
     """
-    await change_text_input(page, selectors["home_city"], home_city)
+    # The city field is a typeahead whose suggestions are driven by key events
+    await change_text_input(page, selectors["home_city"], home_city, use_keyboard=True)
@@ -0,0 +1,85 @@
+from functools import lru_cache
+import logging
+import re
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_GROUP_PREFIX = "_rule"
+
+
+@lru_cache(maxsize=32)
+def _compile_label_rules(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Fuses label patterns into one regex that reports the first matching rule.
+
+    Each pattern sits in an anchored lookahead, so the alternation is tried in
+    dict order and the winning branch is the first rule that matches anywhere
+    in the label - the same result as scanning the rules one by one, but in a
+    single search. Returns None if the patterns cannot be combined (e.g. they
+    use global inline flags), in which case callers scan rule by rule.
+    """
+    branches = "|".join(
+        f"(?=[\\s\\S]*?(?P<{_GROUP_PREFIX}{index}>{pattern}))"
+        for index, pattern in enumerate(patterns)
+    )
+    try:
+        return re.compile(f"(?:{branches})", re.IGNORECASE)
+    except re.error as e:
+        logger.debug(f"Could not combine label patterns into one regex: {e}")
+        return None
+
+
+def match_label_rule(label_text: str, rules: dict) -> Optional[Tuple[str, Any]]:
+    """
+    Returns (label_regex, value) for the first rule whose regex matches the label.
+
+    Rules are matched case-insensitively in dict order. The combined pattern is
+    compiled once per distinct rule set and reused across fields and forms.
+    """
+    if not label_text or not rules:
+        return None
+
+    patterns = tuple(rules)
+    combined = _compile_label_rules(patterns)
+    if combined is None:
+        for label_regex, value in rules.items():
+            if re.search(label_regex, label_text, re.IGNORECASE):
+                return label_regex, value
+        return None
+
+    match = combined.match(label_text)
+    if not match:
+        return None
+    label_regex = patterns[int(match.lastgroup[len(_GROUP_PREFIX):])]
+    return label_regex, rules[label_regex]
+
+
+def label_rules_combined(rules: dict) -> bool:
+    """Returns True if the rules fuse into one regex (see _compile_label_rules)."""
+    return bool(rules) and _compile_label_rules(tuple(rules)) is not None
+
+
+def match_label_rules(
+    labels: Sequence[str], rules: dict
+) -> List[Optional[Tuple[str, Any]]]:
+    """Classifies a batch of labels, returning match_label_rule() for each one."""
+    return [match_label_rule(label, rules) for label in labels]
+
+
+def iter_label_rules(label_text: str, rules: dict) -> Iterator[Tuple[str, Any]]:
+    """
+    Yields every (label_regex, value) whose regex matches the label, in dict order.
+
+    The first hit comes from the combined pattern; later rules are only scanned
+    if the caller asks for more (e.g. when the first rule's value is unusable).
+    """
+    first_match = match_label_rule(label_text, rules)
+    if first_match is None:
+        return
+    yield first_match
+
+    patterns = list(rules)
+    for label_regex in patterns[patterns.index(first_match[0]) + 1:]:
+        if re.search(label_regex, label_text, re.IGNORECASE):
+            yield label_regex, rules[label_regex]
@@ -1,16 +1,33 @@
 from playwright.async_api import Page
+from typing import Optional
 
 from core.selectors import selectors
 
+# True only if the checkbox exists and is checked
+FOLLOW_COMPANY_CHECKED_SCRIPT = """(sel) => {
+    const el = document.querySelector(sel);
+    return !!(el && el.checked);
+}"""
 
-async def uncheck_follow_company(page: Page) -> None:
+# Reads and unchecks in one call, so nothing can change between the two
+UNCHECK_FOLLOW_COMPANY_SCRIPT = """(sel) => {
+    const el = document.querySelector(sel);
+    if (el && el.checked) {
+        el.click();
+        return true;
+    }
+    return false;
+}"""
+
+
+async def uncheck_follow_company(page: Page, is_checked: Optional[bool] = None) -> None:
     """
     Unchecks the 'Follow company' checkbox if it exists and is checked.
+
+    `is_checked` is the checkbox state from a form snapshot; an unchecked
+    snapshot skips the page entirely.
     """
-    checkbox_element = await page.query_selector(selectors["follow_company_checkbox"])
-    if checkbox_element:
-        # Check if the checkbox is currently checked using evaluate
-        is_checked = await page.evaluate("el => el.checked", checkbox_element)
-        if is_checked:
-            # Click the checkbox to uncheck it
-            await checkbox_element.click()
+    if is_checked is False:
+        return
+
+    await page.evaluate(UNCHECK_FOLLOW_COMPANY_SCRIPT, selectors["follow_company_checkbox"])
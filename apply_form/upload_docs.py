@@ -1,25 +1,62 @@
 from playwright.async_api import Page
+from typing import Optional
 
 from core.selectors import selectors
 
+# Returns {idx, label} for every upload div that has both a label and a file
+# input, so choosing which documents to upload takes a single round-trip.
+DOCUMENT_UPLOAD_LABELS_SCRIPT = """(sels) => {
+    const out = [];
+    document.querySelectorAll(sels.upload).forEach((div, idx) => {
+        const label = div.querySelector(sels.label);
+        const input = div.querySelector(sels.input);
+        if (label && input) {
+            out.push({ idx, label: label.innerText.toLowerCase() });
+        }
+    });
+    return out;
+}"""
 
-async def upload_docs(page: Page, cv_path: str, cover_letter_path: str) -> None:
+DOCUMENT_UPLOAD_LABELS_ARGS = {
+    "upload": selectors["document_upload"],
+    "label": selectors["document_upload_label"],
+    "input": selectors["document_upload_input"],
+}
+
+
+async def upload_docs(
+    page: Page,
+    cv_path: str,
+    cover_letter_path: str,
+    upload_fields: Optional[list[dict]] = None,
+) -> None:
     """
     Uploads CV and Cover Letter if the corresponding upload fields are present.
+
+    `upload_fields` are the {idx, label} entries from a form snapshot; when
+    omitted they are read from the page.
     """
-    # Find all document upload divs
-    doc_divs = await page.query_selector_all(selectors["document_upload"])
-
-    for doc_div in doc_divs:
-        # Find the label and input elements within the div
-        label_element = await doc_div.query_selector(selectors["document_upload_label"])
-        input_element = await doc_div.query_selector(selectors["document_upload_input"])
-
-        if label_element and input_element:
-            # Get the text content of the label to determine the type of document
-            label_text = await label_element.inner_text()
-
-            if "resume" in label_text.lower() and cv_path:
-                await input_element.set_input_files(cv_path)
-            elif "cover" in label_text.lower() and cover_letter_path:
-                await input_element.set_input_files(cover_letter_path)
+    if not cv_path and not cover_letter_path:
+        return
+
+    if upload_fields is None:
+        upload_fields = await page.evaluate(
+            DOCUMENT_UPLOAD_LABELS_SCRIPT, DOCUMENT_UPLOAD_LABELS_ARGS
+        )
+
+    for upload_field in upload_fields:
+        # The label text determines the type of document
+        label_text = upload_field["label"]
+        if "resume" in label_text and cv_path:
+            file_path = cv_path
+        elif "cover" in label_text and cover_letter_path:
+            file_path = cover_letter_path
+        else:
+            continue
+
+        input_locator = (
+            page.locator(selectors["document_upload"])
+            .nth(upload_field["idx"])
+            .locator(selectors["document_upload_input"])
+        )
+        await input_locator.set_input_files(file_path)
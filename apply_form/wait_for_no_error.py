@@ -1,17 +1,55 @@
-from playwright.async_api import Page
+from playwright.async_api import (
+    Error as PlaywrightError,
+    Page,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+# Error block LinkedIn renders under an invalid form field
+ERROR_SELECTOR = 'div[id*="error"] div[class*="error"]'
+
+# The original timeout was 1000ms.
+NO_ERROR_TIMEOUT_MS = 1000
+
+# Resolves as soon as no error element exists. A MutationObserver re-checks on
+# every DOM change instead of re-evaluating the predicate on a polling interval.
+NO_ERROR_SCRIPT = """([selector, timeout]) => new Promise((resolve, reject) => {
+    let timer = null;
+    const observer = new MutationObserver(() => check());
+    const check = () => {
+        if (!document.querySelector(selector)) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+            return true;
+        }
+        return false;
+    };
+    if (check()) return;
+    observer.observe(document.documentElement, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+    });
+    timer = setTimeout(() => {
+        observer.disconnect();
+        reject(new Error('wait_for_no_error timeout'));
+    }, timeout);
+})"""
 
 
 async def wait_for_no_error(page: Page) -> None:
     """
     Waits for a short time to ensure no error messages appear.
+
+    Raises:
+        playwright.async_api.TimeoutError: If an error element is still present
+            after NO_ERROR_TIMEOUT_MS.
     """
-    # Wait for a function to evaluate to true,
-    # checking for the absence of error elements.
-    # This translates the original JS condition:
-    # !document.querySelector("div[id*='error'] div[class*='error']")
-    # We wait for an element matching the error selector NOT to exist.
-    # The original timeout was 1000ms.
-    await page.wait_for_function(
-        '() => !document.querySelector(\'div[id*="error"] div[class*="error"]\')',
-        timeout=1000,
-    )
+    try:
+        await page.evaluate(NO_ERROR_SCRIPT, [ERROR_SELECTOR, NO_ERROR_TIMEOUT_MS])
+    except PlaywrightError as e:
+        if "wait_for_no_error timeout" in str(e):
+            raise PlaywrightTimeoutError(
+                f"Form error element still present after {NO_ERROR_TIMEOUT_MS}ms"
+            ) from e
+        raise
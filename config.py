@@ -1,5 +1,6 @@
 import json
 import sqlite3
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -22,6 +23,8 @@ class SessionConfig(BaseSettings):
 
     user_data_dir: Path = Path("./linkedin_session")
     db_file: Optional[str] = "jobs.db"
+    # Skip fsync on commit; a power loss can corrupt the db (test runs only)
+    db_synchronous_off: bool = False
     db_conn: Optional[sqlite3.Connection] = Field(None, exclude=True)
 
     class Config:
@@ -62,6 +65,15 @@ class CircuitBreakerConfig(BaseSettings):
     class Config:
         arbitrary_types_allowed = True
 
+    # Built once per config and shared by every selector breaker, instead of
+    # a fresh single-item list per breaker.
+    @cached_property
+    def excluded_exceptions(self) -> Tuple[type, ...]:
+        """Exception types that do not count as breaker failures."""
+        if isinstance(self.expected_exception, tuple):
+            return self.expected_exception
+        return (self.expected_exception,)
+
 
 class SelectorRetryOverrideConfig(BaseSettings):
     """Configuration for per-selector retry overrides."""
@@ -144,6 +156,23 @@ class FormDataConfig(BaseSettings):
     booleans: Dict[str, bool] = {"bachelhor|bacharelado": True, "authorized": True}
     multiple_choice_fields: Dict[str, str] = {"pronouns": "He/him"}
 
+    # The merged rule sets are built once per config; handing the same dict to
+    # every form also lets the label matchers reuse their compiled patterns.
+    @cached_property
+    def merged_text_fields(self) -> Dict[str, Any]:
+        """Text field rules combined with years of experience."""
+        return {**self.text_fields, **self.years_of_experience}
+
+    @cached_property
+    def merged_booleans(self) -> Dict[str, bool]:
+        """Boolean rules plus the visa sponsorship answer."""
+        return {**self.booleans, "sponsorship": self.requires_visa_sponsorship}
+
+    @cached_property
+    def merged_multiple_choice_fields(self) -> Dict[str, str]:
+        """Language proficiency combined with other multiple choice rules."""
+        return {**self.language_proficiency, **self.multiple_choice_fields}
+
 
 class GeneralSettingsConfig(BaseSettings):
     """Other general settings for the bot."""
@@ -194,6 +223,11 @@ class PerformanceConfig(BaseSettings):
     poll_interval_ms: int = 200  # ms
     selector_timeout: int = 20000  # ms
     max_noncritical_consecutive_errors: int = 5
+    # Skip per-call frame collection in Playwright (traces lose source locations)
+    lightweight_playwright_stacks: bool = False
+    # Stop scanning text inputs once every text field rule has filled at least
+    # one input; only pays off when forms match all of the configured rules
+    short_circuit_text_fields: bool = False
 
 
 class DiagnosticsConfig(BaseSettings):
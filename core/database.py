@@ -1,20 +1,309 @@
+import atexit
+import json
 import sqlite3
 import datetime
 import logging
 import contextlib
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 
 
 logger = logging.getLogger(__name__)
 
+# sqlite3 keeps compiled statements per connection, keyed by SQL text. Sized to
+# hold every query in this module, including the bucketed IN (...) variants.
+STATEMENT_CACHE_SIZE = 256
+
+# Smallest number of placeholders in a bucketed IN (...) clause
+_MIN_IN_CLAUSE_SIZE = 8
+
+# Larger id sets are passed as one JSON array and expanded with json_each, so
+# they need neither more statement shapes nor one parameter per id.
+_MAX_IN_CLAUSE_PLACEHOLDERS = 32
+
+
+class Vacancy(NamedTuple):
+    """
+    A full row of the vacancies table, in column order.
+
+    Timestamps are Unix epoch seconds (see _store_timestamps_as_epoch).
+    """
+
+    id: int
+    title: str
+    company: str
+    link: str
+    status: str
+    created_at: int
+    description: Optional[str]
+    company_description: Optional[str]
+    employment_type: Optional[str]
+    company_overview: Optional[str]
+    company_website: Optional[str]
+    company_industry: Optional[str]
+    company_size: Optional[str]
+    company_headquarters: Optional[str]
+    company_specialties: Optional[str]
+    company_founded: int
+    match_percentage: Optional[int]
+    analysis: Optional[str]
+    applide_at: Optional[int]
+
+    def get(self, column: str, default: Any = None) -> Any:
+        """Dict-style lookup, so callers can take a Vacancy or a plain mapping."""
+        if column in self._fields:
+            return getattr(self, column)
+        return default
+
+
+# Listed explicitly: migrated databases may order the columns differently
+_VACANCY_COLUMNS = ", ".join(Vacancy._fields)
+
+# Statements used at runtime, defined once so every call presents the same
+# text to the per-connection statement cache (and is easy to EXPLAIN).
+_SQL_SAVE_DISCOVERED = """
+    INSERT INTO vacancies (id, title, company, link, status, created_at)
+    SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'),
+           json_extract(value, '$[2]'), json_extract(value, '$[3]'),
+           'discovered', ?
+    FROM json_each(?) WHERE true
+    ON CONFLICT(id) DO NOTHING
+    RETURNING id
+"""
+_SQL_GET_JOBS_TO_ENRICH = (
+    "SELECT id, link, title, company FROM vacancies "
+    "WHERE status = 'discovered' OR status = 'enrichment_error' ORDER BY id DESC"
+)
+_SQL_SAVE_ENRICHMENT = """
+    UPDATE vacancies SET
+        status = 'enriched',
+        description = ?,
+        company_description = ?,
+        employment_type = ?,
+        company_overview = ?,
+        company_website = ?,
+        company_industry = ?,
+        company_size = ?,
+        company_headquarters = ?,
+        company_specialties = ?,
+        company_founded = ?,
+        match_percentage = ?,
+        analysis = ?
+    WHERE id = ?
+"""
+_SQL_SAVE_SKILL_MATCH = """
+    UPDATE vacancies SET
+        match_percentage = ?,
+        analysis = ?
+    WHERE id = ?
+"""
+_SQL_GET_ENRICHED_JOBS = (
+    "SELECT id, link, title, company, description FROM vacancies "
+    "WHERE status = 'enriched' ORDER BY id DESC"
+)
+_SQL_GET_ERROR_JOBS = (
+    "SELECT id, link, title, company, description FROM vacancies "
+    "WHERE status = 'error' ORDER BY id DESC"
+)
+_SQL_UPDATE_STATUS_APPLIED = "UPDATE vacancies SET status = ?, applide_at = ? WHERE id = ?"
+_SQL_UPDATE_STATUS = "UPDATE vacancies SET status = ? WHERE id = ?"
+_SQL_GET_LAST_RUN = "SELECT run_timestamp FROM run_history ORDER BY run_timestamp DESC LIMIT 1"
+_SQL_RECORD_RUN = "INSERT INTO run_history (run_timestamp) VALUES (?)"
+_SQL_COUNT_APPLIED_BETWEEN = (
+    "SELECT COUNT(*) FROM vacancies "
+    "WHERE status = 'applied' AND applide_at >= ? AND applide_at < ?"
+)
+_SQL_GET_VACANCY = f"SELECT {_VACANCY_COLUMNS} FROM vacancies WHERE id = ?"
+# Completed with an IN (...) right-hand side from _in_clause
+_SQL_GET_VACANCIES_IN = f"SELECT {_VACANCY_COLUMNS} FROM vacancies WHERE id IN "
+_SQL_GET_IDS_IN = "SELECT id FROM vacancies WHERE id IN "
+
+
+# Connection pragmas for a single-process, write-mostly workload: WAL turns
+# commits into appends, and NORMAL sync is durable across application crashes
+# (only an OS crash can lose the last commits).
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+
+def _configure_connection(conn: sqlite3.Connection, synchronous_off: bool = False):
+    """
+    Switches the database to WAL and applies CONNECTION_PRAGMAS.
+
+    `synchronous_off` skips fsync entirely; a power loss can then corrupt the
+    database, so it is only meant for throwaway databases such as test runs.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    if synchronous_off:
+        conn.execute("PRAGMA synchronous=OFF")
+
+
+# Long-lived connections handed out by get_db_connection, one per db file
+_shared_connections: dict[str, sqlite3.Connection] = {}
+
+
+def close_shared_connections():
+    """Closes the connections opened by get_db_connection (run at exit)."""
+    while _shared_connections:
+        _, conn = _shared_connections.popitem()
+        conn.close()
+
+
+atexit.register(close_shared_connections)
+
 
 @contextlib.contextmanager
 def get_db_connection(db_file: str):
-    """Контекстный менеджер для соединения с базой данных."""
-    conn = sqlite3.connect(db_file)
+    """
+    Контекстный менеджер для соединения с базой данных.
+
+    The connection is opened and configured once per db file and reused by
+    later calls, so short operations do not pay for opening the file and
+    re-reading the schema each time. Uncommitted work is rolled back if the
+    block raises, as closing the connection used to do.
+    """
+    conn = _shared_connections.get(db_file)
+    if conn is None:
+        conn = sqlite3.connect(
+            db_file, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        _configure_connection(conn)
+        _shared_connections[db_file] = conn
     try:
         yield conn
-    finally:
-        conn.close()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
+@contextlib.contextmanager
+def _write_transaction(conn: sqlite3.Connection):
+    """
+    Runs the block's writes in one BEGIN IMMEDIATE ... COMMIT and yields a cursor.
+
+    Taking the write lock up front avoids the deferred transaction's later
+    read-to-write lock upgrade. If the caller already has a transaction open,
+    the block joins it and commits at the end, like a plain conn.commit().
+    Only a transaction started here is rolled back when the block raises.
+    """
+    began = not conn.in_transaction
+    if began:
+        conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn.cursor()
+    except BaseException:
+        if began and conn.in_transaction:
+            conn.rollback()
+        raise
+    conn.commit()
+
+
+def _pad_in_clause_params(values: list) -> list:
+    """
+    Pads IN (...) parameters to the next power-of-two length (at least
+    _MIN_IN_CLAUSE_SIZE) by repeating the last value.
+
+    Every distinct placeholder count is a distinct SQL text, so without
+    padding each batch size would compile and cache its own statement.
+    Repeated values do not change the result of an IN test.
+    """
+    size = _MIN_IN_CLAUSE_SIZE
+    while size < len(values):
+        size *= 2
+    return list(values) + [values[-1]] * (size - len(values))
+
+
+@lru_cache(maxsize=None)
+def _placeholders(count: int) -> str:
+    """Returns "(?,?,...)" with `count` placeholders."""
+    return f"({','.join(['?'] * count)})"
+
+
+def _in_clause(values: list) -> tuple[str, list]:
+    """
+    Returns the right-hand side of an `IN` test for `values` and its params.
+
+    Small sets use bucketed placeholders; larger ones a single JSON parameter
+    expanded by json_each, which also stays clear of sqlite's parameter limit.
+    """
+    if len(values) > _MAX_IN_CLAUSE_PLACEHOLDERS:
+        return "(SELECT value FROM json_each(?))", [json.dumps(list(values))]
+    params = _pad_in_clause_params(values)
+    return _placeholders(len(params)), params
+
+
+# Columns added to `vacancies` after its first release
+_COMPANY_DETAIL_COLUMNS = (
+    ("company_headquarters", "TEXT"),
+    ("company_specialties", "TEXT"),
+    ("company_founded", "INTEGER NOT NULL DEFAULT 0"),
+    ("applide_at", "INTEGER"),
+)
+
+
+def _add_company_detail_columns(cursor: sqlite3.Cursor):
+    """Adds the company detail columns missing from databases created before them."""
+    existing = {row[1] for row in cursor.execute("PRAGMA table_info(vacancies)")}
+    for name, definition in _COMPANY_DETAIL_COLUMNS:
+        if name not in existing:
+            cursor.execute(f"ALTER TABLE vacancies ADD COLUMN {name} {definition}")
+            logger.debug(f"Added column {name}")
+
+
+def _create_status_indexes(cursor: sqlite3.Cursor):
+    """
+    Indexes the status scans: the per-phase job lists (WHERE status = ?
+    ORDER BY id DESC) and the daily application count by applide_at range.
+    """
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_vacancies_status_id ON vacancies(status, id DESC)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_vacancies_status_applied_at ON vacancies(status, applide_at)"
+    )
+
+
+_TIMESTAMP_COLUMNS = (
+    ("vacancies", "created_at"),
+    ("vacancies", "applide_at"),
+    ("run_history", "run_timestamp"),
+)
+
+
+def _store_timestamps_as_epoch(cursor: sqlite3.Cursor):
+    """
+    Rewrites the local-time ISO text timestamps of older versions as Unix
+    epoch seconds: integers take fewer bytes in rows and index pages, compare
+    without collation and need no datetime adapter when read.
+    """
+    for table, column in _TIMESTAMP_COLUMNS:
+        cursor.execute(
+            f"UPDATE {table} SET {column} = CAST(strftime('%s', {column}, 'utc') AS INTEGER) "
+            f"WHERE typeof({column}) = 'text'"
+        )
+
+
+# Schema migrations in order; PRAGMA user_version records how many have run,
+# so each one executes once per database instead of on every startup.
+_MIGRATIONS = (
+    _add_company_detail_columns,
+    _create_status_indexes,
+    _store_timestamps_as_epoch,
+)
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+
+def _epoch_now() -> int:
+    """Current time in the Unix epoch seconds stored in timestamp columns."""
+    return int(datetime.datetime.now().timestamp())
 
 
 def init_db(conn: sqlite3.Connection):
@@ -22,8 +311,14 @@ def init_db(conn: sqlite3.Connection):
     Creates the database tables on the given connection.
     """
     logger.debug("Setting up database tables...")
-    cursor = conn.cursor()
+    # One transaction for all DDL instead of an implicit commit per statement
+    with _write_transaction(conn) as cursor:
+        _create_tables(cursor)
+    logger.info("Database setup complete.")
+
 
+def _create_tables(cursor: sqlite3.Cursor):
+    """Creates missing tables and applies pending migrations (see init_db)."""
     # Vacancies table with job_id as the PRIMARY KEY
     cursor.execute(
         """
@@ -33,7 +328,7 @@ def init_db(conn: sqlite3.Connection):
             company TEXT NOT NULL,
             link TEXT NOT NULL,
             status TEXT NOT NULL DEFAULT 'discovered',
-            created_at TIMESTAMP NOT NULL,
+            created_at INTEGER NOT NULL,
             description TEXT,
             company_description TEXT,
             employment_type TEXT,
@@ -46,80 +341,76 @@ def init_db(conn: sqlite3.Connection):
             company_founded INTEGER NOT NULL DEFAULT 0,
             match_percentage INTEGER,
             analysis TEXT,
-            applide_at TIMESTAMP
+            applide_at INTEGER
         )
     """
     )
-    
-    # Migration: Add new columns if they don't exist (for existing databases)
-    try:
-        cursor.execute("ALTER TABLE vacancies ADD COLUMN company_headquarters TEXT")
-        logger.debug("Added column company_headquarters")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-    
-    try:
-        cursor.execute("ALTER TABLE vacancies ADD COLUMN company_specialties TEXT")
-        logger.debug("Added column company_specialties")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-    
-    try:
-        cursor.execute("ALTER TABLE vacancies ADD COLUMN company_founded INTEGER NOT NULL DEFAULT 0")
-        logger.debug("Added column company_founded")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
-    
-    try:
-        cursor.execute("ALTER TABLE vacancies ADD COLUMN applide_at TIMESTAMP")
-        logger.debug("Added column applide_at")
-    except sqlite3.OperationalError:
-        pass  # Column already exists
+
     # Run history table
     cursor.execute(
         """
         CREATE TABLE IF NOT EXISTS run_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            run_timestamp TIMESTAMP NOT NULL
+            run_timestamp INTEGER NOT NULL
         )
     """
     )
-    conn.commit()
-    logger.info("Database setup complete.")
+
+    # Migration: bring databases created by older versions up to date
+    schema_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+    for migrate in _MIGRATIONS[schema_version:]:
+        migrate(cursor)
+    if schema_version < SCHEMA_VERSION:
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        # Give the planner statistics for the indexes the migrations created
+        cursor.execute("ANALYZE")
+        logger.debug(f"Database schema migrated to version {SCHEMA_VERSION}")
 
 
-def setup_database(db_file: str) -> sqlite3.Connection:
+def setup_database(db_file: str, synchronous_off: bool = False) -> sqlite3.Connection:
     """
     Initializes the database connection and creates tables.
+
+    See _configure_connection for `synchronous_off`.
     """
     conn = sqlite3.connect(
-        db_file, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES, check_same_thread=False
+        db_file,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        # Autocommit: multi-statement writes open their own transaction
+        # explicitly (see _write_transaction) instead of an implicit one
+        isolation_level=None,
     )
+    _configure_connection(conn, synchronous_off)
     init_db(conn)
     return conn
 
 
-def save_discovered_jobs(jobs: list, conn: sqlite3.Connection):
+def save_discovered_jobs(jobs: list, conn: sqlite3.Connection) -> set[int]:
     """
     Saves a list of newly discovered jobs to the database.
+
+    All jobs go in with one statement, expanded from a JSON array parameter.
+    Ids that are already stored are left untouched.
+
+    Returns:
+        set: Ids of the jobs that were actually inserted.
     """
     if not jobs:
-        return
+        return set()
     logger.debug(f"Saving {len(jobs)} discovered jobs.")
-    cursor = conn.cursor()
-    now = datetime.datetime.now()
-    jobs_to_insert = [
-        (job_id, title, company, link, "discovered", now)
-        for job_id, link, title, company in jobs
-    ]
-    cursor.executemany(
-        "INSERT OR IGNORE INTO vacancies (id, title, company, link, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-        jobs_to_insert,
+    now = _epoch_now()
+    payload = json.dumps(
+        [[job_id, title, company, link] for job_id, link, title, company in jobs]
     )
-    conn.commit()
+    with _write_transaction(conn) as cursor:
+        # WHERE true keeps the upsert clause from being parsed as a join constraint
+        cursor.execute(_SQL_SAVE_DISCOVERED, (now, payload))
+        inserted_ids = {row[0] for row in cursor}
     logger.info(
-        f"Saved {cursor.rowcount} new discovered jobs. Ignored {len(jobs_to_insert) - cursor.rowcount} duplicates."
+        f"Saved {len(inserted_ids)} new discovered jobs. Ignored {len(jobs) - len(inserted_ids)} duplicates."
     )
+    return inserted_ids
 
 
 def get_jobs_to_enrich(conn: sqlite3.Connection) -> list:
@@ -128,9 +419,7 @@ def get_jobs_to_enrich(conn: sqlite3.Connection) -> list:
     """
     logger.debug("Getting jobs to enrich.")
     cursor = conn.cursor()
-    cursor.execute(
-        "SELECT id, link, title, company FROM vacancies WHERE status = 'discovered' OR status = 'enrichment_error' ORDER BY id DESC"
-    )
+    cursor.execute(_SQL_GET_JOBS_TO_ENRICH)
     jobs = cursor.fetchall()
     logger.info(f"Retrieved {len(jobs)} jobs to be enriched.")
     return jobs
@@ -141,42 +430,25 @@ def save_enrichment_data(job_id: int, details: dict, conn: sqlite3.Connection):
     Updates a job record with its full scraped details and sets status to 'enriched'.
     """
     logger.debug(f"Enriching job_id: {job_id}")
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        UPDATE vacancies SET
-            status = 'enriched',
-            description = ?,
-            company_description = ?,
-            employment_type = ?,
-            company_overview = ?,
-            company_website = ?,
-            company_industry = ?,
-            company_size = ?,
-            company_headquarters = ?,
-            company_specialties = ?,
-            company_founded = ?,
-            match_percentage = ?,
-            analysis = ?
-        WHERE id = ?
-    """,
-        (
-            details.get("description"),
-            details.get("company_description"),
-            details.get("employment_type"),
-            details.get("company_overview"),
-            details.get("company_website"),
-            details.get("company_industry"),
-            details.get("company_size"),
-            details.get("company_headquarters"),
-            details.get("company_specialties"),
-            details.get("company_founded", 0),
-            details.get("match_percentage"),
-            details.get("analysis"),
-            job_id,
-        ),
-    )
-    conn.commit()
+    with _write_transaction(conn) as cursor:
+        cursor.execute(
+            _SQL_SAVE_ENRICHMENT,
+            (
+                details.get("description"),
+                details.get("company_description"),
+                details.get("employment_type"),
+                details.get("company_overview"),
+                details.get("company_website"),
+                details.get("company_industry"),
+                details.get("company_size"),
+                details.get("company_headquarters"),
+                details.get("company_specialties"),
+                details.get("company_founded", 0),
+                details.get("match_percentage"),
+                details.get("analysis"),
+                job_id,
+            ),
+        )
 
 
 def save_skill_match_data(
@@ -187,15 +459,7 @@ def save_skill_match_data(
     """
     logger.debug(f"Saving skill match data for job_id: {job_id}")
     cursor = conn.cursor()
-    cursor.execute(
-        """
-        UPDATE vacancies SET
-            match_percentage = ?,
-            analysis = ?
-        WHERE id = ?
-    """,
-        (match_percentage, analysis, job_id),
-    )
+    cursor.execute(_SQL_SAVE_SKILL_MATCH, (match_percentage, analysis, job_id))
     conn.commit()
 
 
@@ -206,9 +470,7 @@ def get_enriched_jobs(conn: sqlite3.Connection) -> list:
     logger.debug("Getting enriched jobs.")
     cursor = conn.cursor()
     # Fetch all necessary fields for final filtering and application
-    cursor.execute(
-        "SELECT id, link, title, company, description FROM vacancies WHERE status = 'enriched' ORDER BY id DESC"
-    )
+    cursor.execute(_SQL_GET_ENRICHED_JOBS)
     jobs = cursor.fetchall()
     logger.info(f"Retrieved {len(jobs)} enriched jobs to be processed.")
     return jobs
@@ -230,32 +492,42 @@ def get_error_jobs(conn: sqlite3.Connection) -> list:
     logger.debug("Getting jobs with error status for retry.")
     cursor = conn.cursor()
     # Fetch all necessary fields for retry attempt
-    cursor.execute(
-        "SELECT id, link, title, company, description FROM vacancies WHERE status = 'error' ORDER BY id DESC"
-    )
+    cursor.execute(_SQL_GET_ERROR_JOBS)
     jobs = cursor.fetchall()
     logger.info(f"Retrieved {len(jobs)} error jobs to be retried.")
     return jobs
 
 
+def update_job_statuses(pairs: list[tuple[int, str]], conn: sqlite3.Connection):
+    """
+    Updates the status of several jobs in one transaction.
+    Jobs moved to 'applied' also get applide_at set to the current timestamp.
+
+    Args:
+        pairs: (job_id, status) tuples.
+        conn: Database connection object.
+    """
+    if not pairs:
+        return
+    logger.debug(f"Updating status for {len(pairs)} job(s).")
+
+    now = _epoch_now()
+    applied = [(status, now, job_id) for job_id, status in pairs if status == "applied"]
+    others = [(status, job_id) for job_id, status in pairs if status != "applied"]
+    with _write_transaction(conn) as cursor:
+        if applied:
+            cursor.executemany(_SQL_UPDATE_STATUS_APPLIED, applied)
+        if others:
+            cursor.executemany(_SQL_UPDATE_STATUS, others)
+
+
 def update_job_status(job_id: int, status: str, conn: sqlite3.Connection):
     """
     Updates the status of a job identified by its job_id.
     If status is 'applied', also sets applide_at to current timestamp.
     """
     logger.debug(f"Updating status to '{status}' for job_id: {job_id}")
-    cursor = conn.cursor()
-    
-    if status == "applied":
-        now = datetime.datetime.now()
-        cursor.execute(
-            "UPDATE vacancies SET status = ?, applide_at = ? WHERE id = ?",
-            (status, now, job_id)
-        )
-    else:
-        cursor.execute("UPDATE vacancies SET status = ? WHERE id = ?", (status, job_id))
-    
-    conn.commit()
+    update_job_statuses([(job_id, status)], conn)
 
 
 # --- Unchanged functions ---
@@ -277,11 +549,9 @@ def get_last_run_timestamp(conn: sqlite3.Connection) -> datetime.datetime | None
         See record_run_timestamp() for recording run history.
     """
     cursor = conn.cursor()
-    cursor.execute(
-        "SELECT run_timestamp FROM run_history ORDER BY run_timestamp DESC LIMIT 1"
-    )
+    cursor.execute(_SQL_GET_LAST_RUN)
     result = cursor.fetchone()
-    return result[0] if result else None
+    return datetime.datetime.fromtimestamp(result[0]) if result else None
 
 
 def record_run_timestamp(conn: sqlite3.Connection) -> None:
@@ -306,46 +576,67 @@ def record_run_timestamp(conn: sqlite3.Connection) -> None:
     """
     now = datetime.datetime.now()
     cursor = conn.cursor()
-    cursor.execute("INSERT INTO run_history (run_timestamp) VALUES (?)", (now,))
+    cursor.execute(_SQL_RECORD_RUN, (int(now.timestamp()),))
     conn.commit()
     logger.info(f"Recorded new run timestamp: {now}")
+    # Refresh planner statistics for tables whose size drifted during the run;
+    # a no-op when nothing changed, so it is cheap to do after every run
+    conn.execute("PRAGMA optimize")
 
 
 def count_todays_applications(conn: sqlite3.Connection) -> int:
+    """
+    Counts the jobs applied to since midnight, by their applide_at timestamp.
+    """
     cursor = conn.cursor()
-    today_str = datetime.date.today().strftime("%Y-%m-%d")
+    start = datetime.datetime.combine(datetime.date.today(), datetime.time.min)
+    end = start + datetime.timedelta(days=1)
+    # A half-open range, unlike DATE(applide_at) = ?, can be answered from
+    # idx_vacancies_status_applied_at instead of evaluating every row
     cursor.execute(
-        "SELECT COUNT(*) FROM vacancies WHERE status = 'applied' AND DATE(created_at) = ?",
-        (today_str,),
+        _SQL_COUNT_APPLIED_BETWEEN, (int(start.timestamp()), int(end.timestamp()))
     )
     count = cursor.fetchone()[0]
     return count
 
 
-def get_vacancy_by_id(vacancy_id: int, conn: sqlite3.Connection) -> dict | None:
+def get_vacancy_by_id(vacancy_id: int, conn: sqlite3.Connection) -> Vacancy | None:
     """
     Retrieves a single vacancy by its ID.
     """
-    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM vacancies WHERE id = ?", (vacancy_id,))
-    vacancy = cursor.fetchone()
-    if vacancy:
-        return dict(vacancy)
+    cursor.execute(_SQL_GET_VACANCY, (vacancy_id,))
+    row = cursor.fetchone()
+    if row:
+        return Vacancy._make(row)
     return None
 
 
+def get_vacancies_by_ids(
+    vacancy_ids: list[int], conn: sqlite3.Connection
+) -> dict[int, Vacancy]:
+    """
+    Retrieves several vacancies with all their columns in a single query.
+
+    Returns:
+        dict: Vacancies keyed by id; ids that are not stored are absent.
+    """
+    if not vacancy_ids:
+        return {}
+    cursor = conn.cursor()
+    in_clause, params = _in_clause(vacancy_ids)
+    cursor.execute(_SQL_GET_VACANCIES_IN + in_clause, params)
+    return {row[0]: Vacancy._make(row) for row in cursor}
+
+
 def get_existing_vacancy_ids(
     candidate_ids: list[int], conn: sqlite3.Connection
 ) -> set[int]:
     if not candidate_ids:
         return set()
     cursor = conn.cursor()
-    # Build placeholders for IN clause safely
-    placeholders = ",".join(["?"] * len(candidate_ids))
-    cursor.execute(
-        f"SELECT id FROM vacancies WHERE id IN ({placeholders})",
-        candidate_ids,
-    )
-    rows = cursor.fetchall()
-    return {row[0] for row in rows}
+    # Build the IN clause safely
+    in_clause, params = _in_clause(candidate_ids)
+    cursor.execute(_SQL_GET_IDS_IN + in_clause, params)
+    # Drain the cursor straight into the set, without an intermediate list
+    return {row[0] for row in cursor}
@@ -1,4 +1,7 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -28,53 +31,64 @@ class ModalFlowResources:
         self._profile: Optional[CandidateProfile] = None
         self._rule_store: Optional[RuleStore] = None
         self._normalizer: Optional[QuestionNormalizer] = None
-        self._learning_config: Optional[LearningConfig] = None
         self._llm_delegate: Optional[OpenAILLMDelegate] = None
         self._llm_client: Optional[LLMClient] = None
+        # warmup() loads resources on worker threads while the event loop may
+        # already read them; one lock per resource keeps each built only once
+        # without serializing the parallel loads
+        self._profile_lock = threading.Lock()
+        self._rule_store_lock = threading.Lock()
+        self._normalizer_lock = threading.Lock()
+        self._llm_delegate_lock = threading.Lock()
+        self._llm_client_lock = threading.Lock()
 
     @property
     def profile(self) -> CandidateProfile:
         if self._profile is None:
-            profile_path = Path(self._modal_flow_config.profile_path)
-            self._logger.debug("Loading candidate profile from %s", profile_path)
-            store = ProfileStore(profile_path)
-            self._profile = store.load()
+            with self._profile_lock:
+                if self._profile is None:
+                    profile_path = Path(self._modal_flow_config.profile_path)
+                    self._logger.debug("Loading candidate profile from %s", profile_path)
+                    store = ProfileStore(profile_path)
+                    self._profile = store.load()
         return self._profile
 
     @property
     def rule_store(self) -> RuleStore:
         if self._rule_store is None:
-            rules_path = Path(self._modal_flow_config.rules_path)
-            self._logger.debug("Loading rules from %s", rules_path)
-            self._rule_store = RuleStore(rules_path)
+            with self._rule_store_lock:
+                if self._rule_store is None:
+                    rules_path = Path(self._modal_flow_config.rules_path)
+                    self._logger.debug("Loading rules from %s", rules_path)
+                    self._rule_store = RuleStore(rules_path)
         return self._rule_store
 
     @property
     def normalizer(self) -> QuestionNormalizer:
         if self._normalizer is None:
-            config_path = self._modal_flow_config.normalizer_rules_path
-            config_arg = str(config_path) if config_path else None
-            self._logger.debug("Loading normalizer with config %s", config_arg)
-            self._normalizer = QuestionNormalizer(config_arg)
+            with self._normalizer_lock:
+                if self._normalizer is None:
+                    config_path = self._modal_flow_config.normalizer_rules_path
+                    config_arg = str(config_path) if config_path else None
+                    self._logger.debug("Loading normalizer with config %s", config_arg)
+                    self._normalizer = QuestionNormalizer(config_arg)
         return self._normalizer
 
-    @property
+    @cached_property
     def learning_config(self) -> LearningConfig:
-        if self._learning_config is None:
-            cfg = self._modal_flow_config.learning
-            self._learning_config = LearningConfig(
-                enabled=cfg.enabled,
-                auto_learn=cfg.auto_learn,
-                use_separate_rule_generation=cfg.use_separate_rule_generation,
-                rule_generation_fallback=cfg.rule_generation_fallback,
-                confidence_threshold=cfg.confidence_threshold,
-                enable_duplicate_check=cfg.enable_duplicate_check,
-                enable_pattern_validation=cfg.enable_pattern_validation,
-                enable_strategy_validation=cfg.enable_strategy_validation,
-                review_mode=cfg.review_mode,
-                review_path=str(cfg.review_path) if cfg.review_path else None,
-            )
-        return self._learning_config
+        cfg = self._modal_flow_config.learning
+        return LearningConfig(
+            enabled=cfg.enabled,
+            auto_learn=cfg.auto_learn,
+            use_separate_rule_generation=cfg.use_separate_rule_generation,
+            rule_generation_fallback=cfg.rule_generation_fallback,
+            confidence_threshold=cfg.confidence_threshold,
+            enable_duplicate_check=cfg.enable_duplicate_check,
+            enable_pattern_validation=cfg.enable_pattern_validation,
+            enable_strategy_validation=cfg.enable_strategy_validation,
+            review_mode=cfg.review_mode,
+            review_path=str(cfg.review_path) if cfg.review_path else None,
+        )
 
     @property
     def llm_delegate(self) -> Optional[OpenAILLMDelegate]:
@@ -82,21 +96,37 @@ class ModalFlowResources:
             return None
 
         if self._llm_delegate is None:
-            self._logger.debug("Initializing modal flow LLM delegate")
-            self._llm_delegate = OpenAILLMDelegate(self._get_llm_client())
+            with self._llm_delegate_lock:
+                if self._llm_delegate is None:
+                    self._logger.debug("Initializing modal flow LLM delegate")
+                    self._llm_delegate = OpenAILLMDelegate(self._get_llm_client())
         return self._llm_delegate
 
     def _get_llm_client(self) -> LLMClient:
         if self._llm_client is None:
-            self._logger.debug("Creating LLM client for modal flow")
-            self._llm_client = LLMClient(self._llm_config)
+            with self._llm_client_lock:
+                if self._llm_client is None:
+                    self._logger.debug("Creating LLM client for modal flow")
+                    self._llm_client = LLMClient(self._llm_config)
         return self._llm_client
 
+    def warmup(self) -> None:
+        """Load every resource now instead of on first access.
+
+        Profile, rules and normalizer config are independent file reads, so they
+        are loaded in parallel threads.
+        """
+        file_backed = ("profile", "rule_store", "normalizer")
+        with ThreadPoolExecutor(max_workers=len(file_backed)) as pool:
+            list(pool.map(lambda name: getattr(self, name), file_backed))
+        self.learning_config
+        self.llm_delegate
+
     def reset(self) -> None:
         """Reset cached resources (useful for tests)."""
         self._profile = None
         self._rule_store = None
         self._normalizer = None
-        self._learning_config = None
+        self.__dict__.pop("learning_config", None)
         self._llm_delegate = None
         self._llm_client = None
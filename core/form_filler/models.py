@@ -5,9 +5,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobApplicationContext:
-    """Context information about current job application."""
+    """Context information about current job application (immutable once built)."""
 
     job_id: int
     job_url: str
@@ -16,9 +16,9 @@ class JobApplicationContext:
     cover_letter_path: Optional[Path] = None
     job_description: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _payload: Dict[str, Any] = field(init=False, repr=False, compare=False)
 
-    def to_job_payload(self) -> Dict[str, Any]:
-        """Serialize context for logging/LLM."""
+    def __post_init__(self) -> None:
         payload = {
             "job_id": self.job_id,
             "job_url": self.job_url,
@@ -27,10 +27,18 @@ class JobApplicationContext:
         if self.job_description:
             payload["job_description"] = self.job_description
         payload.update(self.metadata or {})
-        return payload
+        # Frozen instance: set the derived field the way dataclasses do
+        object.__setattr__(self, "_payload", payload)
+
+    def to_job_payload(self) -> Dict[str, Any]:
+        """Serialize context for logging/LLM.
+
+        The payload is built once per context and shared; callers must not modify it.
+        """
+        return self._payload
 
 
-@dataclass
+@dataclass(slots=True)
 class FillResult:
     """Result of filling a job application form."""
 
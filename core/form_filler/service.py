@@ -1,6 +1,7 @@
 import logging
 from typing import Optional
 
+import structlog
 from playwright.async_api import Page
 
 from config import AppConfig
@@ -25,6 +26,12 @@ class FormFillCoordinator:
     ):
         self._app_config = app_config
         self._logger = logger or logging.getLogger(__name__)
+        # Fixed for the run; read once instead of on every fill
+        self._cv_path = app_config.form_data.cv_path
+        self._default_cover_letter_path = app_config.form_data.cover_letter_path
+        self._llm_cover_letter_enabled = bool(
+            app_config.llm.LLM_API_KEY and app_config.llm.LLM_PROVIDER
+        )
 
         self._modal_flow_filler = ModalFlowFormFiller(
             resources=resources,
@@ -37,19 +44,30 @@ class FormFillCoordinator:
         page: Page,
         job_context: JobApplicationContext,
     ) -> FillResult:
-        """Fill using the modal flow form filler."""
+        """Fill using the modal flow form filler.
+
+        The job id and url are bound as structlog context variables for the
+        duration of the fill, so every structured log record emitted by the
+        modal flow carries them.
+        """
+        with structlog.contextvars.bound_contextvars(
+            job_id=job_context.job_id, job_url=job_context.job_url
+        ):
+            return await self._fill(page, job_context)
+
+    async def _fill(
+        self,
+        page: Page,
+        job_context: JobApplicationContext,
+    ) -> FillResult:
         document_paths = DocumentPaths(
-            resume=self._app_config.form_data.cv_path,
+            resume=self._cv_path,
             cover_letter=job_context.cover_letter_path
-            or self._app_config.form_data.cover_letter_path,
+            or self._default_cover_letter_path,
         )
 
         lazy_generator: Optional[CoverLetterLazyGenerator] = None
-        if (
-            not document_paths.cover_letter
-            and self._app_config.llm.LLM_API_KEY
-            and self._app_config.llm.LLM_PROVIDER
-        ):
+        if not document_paths.cover_letter and self._llm_cover_letter_enabled:
             lazy_generator = CoverLetterLazyGenerator(
                 job_id=job_context.job_id,
                 app_config=self._app_config,
@@ -63,5 +81,8 @@ class FormFillCoordinator:
             document_paths=document_paths,
             lazy_generator=lazy_generator,
         )
-        self._logger.debug("Modal flow result: %s", result)
+        # Checked up front: the result's repr is only worth building when
+        # debug records are actually emitted
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Modal flow result: %s", result)
         return result
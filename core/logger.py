@@ -1,39 +1,68 @@
 import logging
+import logging.handlers
+import atexit
+import queue
 import sys
 import structlog
 from config import config
 import os
 from datetime import datetime
+from functools import lru_cache
 
 # Flag to ensure configuration happens only once
 _is_configured = False
 
+# Background thread that formats and writes the records queued by the root logger
+_listener: logging.handlers.QueueListener | None = None
+
+# Records buffered before the log file is written; ERROR and above flush at once
+FILE_LOG_BUFFER_CAPACITY = 1024
+
+
+def _build_file_handler(log_file, formatter: logging.Formatter) -> logging.Handler:
+    """
+    Creates the handler writing to `log_file`, buffered so records reach the
+    disk in batches instead of one write per record.
+
+    The buffer is flushed when it is full, on an ERROR record, and when logging
+    shuts down at interpreter exit.
+    """
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    return logging.handlers.MemoryHandler(
+        capacity=FILE_LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+
+
 def setup_logging():
     """
     Set up logging configuration for the application using structlog.
     This function is idempotent and will only configure the logging system once.
     """
-    global _is_configured
+    global _is_configured, _listener
     if _is_configured:
         return
 
     # 1. Get the root logger
     root_logger = logging.getLogger()
     
-    # 2. Determine the logging level and clear any existing handlers
+    # 2. Determine the logging level and clear any existing handlers. This is
+    # the only place the root level is set, as a number rather than a name.
     log_level = config.logging.log_level.upper()
     numeric_level = getattr(logging, log_level, logging.INFO)
     root_logger.setLevel(numeric_level)
     
     # Clear any handlers that may have been set by other libraries or pytest
-    if root_logger.hasHandlers():
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
 
     # 3. Create a shared formatter
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s')
 
-    # 3. Create handlers
+    # Create handlers
     handlers = []
     
     # Console Handler
@@ -51,32 +80,42 @@ def setup_logging():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         new_log_file = log_dir / f"{log_stem}_{timestamp}{log_suffix}"
         
-        file_handler = logging.FileHandler(new_log_file, encoding='utf-8')
-        file_handler.setFormatter(formatter)
-        handlers.append(file_handler)
-
-    # 4. Get the root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
+        handlers.append(_build_file_handler(new_log_file, formatter))
 
-    # Set up the root logger
-    logging.basicConfig(level=log_level, handlers=handlers, force=True)
+    # 4. Attach the root handler; the level was set and old handlers removed
+    # above, so no basicConfig(force=True) pass is needed. Log calls only
+    # enqueue the record; formatting and the console/file writes happen on the
+    # listener thread, off the event loop.
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Merges args and the traceback into the message before it is queued
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    root_logger.addHandler(queue_handler)
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    # Registered after logging's own shutdown hook, so it runs first and the
+    # queued records reach the handlers before they are flushed and closed
+    atexit.register(_listener.stop)
 
-    # 6. Configure structlog to process log records and pass them to standard logging
+    # 5. Configure structlog to process log records and pass them to standard logging.
+    # The chain runs on the caller's thread, the event loop included, so it only
+    # collects what the record cannot: the time, level filtering and rendering
+    # come from the stdlib record and the listener thread.
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
-            structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso", utc=False, key="timestamp"),
             structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
+            # exc_info is left for render_to_log_kwargs to hand to the stdlib
+            # logger, whose formatter prints the traceback
             structlog.stdlib.render_to_log_kwargs,
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the configured level return before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
@@ -84,9 +123,14 @@ def setup_logging():
     _is_configured = True
 
 
+@lru_cache(maxsize=None)
 def get_structured_logger(name: str) -> structlog.BoundLogger:
     """
     Get a structured logger with the given name.
+
+    Loggers are memoized per name, so repeated calls are a cache hit. Prefer
+    one module-level logger and `bind_context` per job over calling this
+    inside hot paths.
     
     Args:
         name: The name of the logger (usually __name__ of the module)
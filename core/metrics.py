@@ -9,10 +9,116 @@ import json
 import os
 import time
 import threading
-from typing import Dict, List, Any, Optional, Union
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Union
 import structlog
 from config import config # Import the new config object
 
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the langchain stack
+    orjson = None
+
+
+_ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@lru_cache(maxsize=256)
+def _format_utc_second(second: int) -> str:
+    """ISO-8601 UTC text of a whole Unix second, cached across reads."""
+    return time.strftime(_ISO_FORMAT, time.gmtime(second))
+
+
+# Derived selector values kept as raw floats and rounded only in exports
+_DISPLAY_FIELDS = ("success_rate", "avg_duration_ms", "p95_duration_ms")
+
+
+def _rounded_for_display(selector_metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of derived selector metrics with the display values at 2 decimals."""
+    rounded = dict(selector_metrics)
+    for field in _DISPLAY_FIELDS:
+        if rounded[field] is not None:
+            rounded[field] = round(rounded[field], 2)
+    return rounded
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate using the P-square algorithm (Jain & Chlamtac).
+
+    Keeps five markers instead of the samples, so `add` and `value` are O(1).
+    Until five samples have been seen the quantile is computed exactly.
+    """
+
+    def __init__(self, quantile: float):
+        self.quantile = quantile
+        self._initial: List[float] = []
+        self._heights: List[float] = []
+        self._positions: List[int] = []
+        self._desired: List[float] = []
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def add(self, sample: float) -> None:
+        """Add one observation to the estimate."""
+        if len(self._initial) < 5:
+            self._initial.append(sample)
+            if len(self._initial) == 5:
+                q = self.quantile
+                self._heights = sorted(self._initial)
+                self._positions = [0, 1, 2, 3, 4]
+                self._desired = [0.0, 2 * q, 4 * q, 2 + 2 * q, 4.0]
+            return
+
+        heights, positions = self._heights, self._positions
+        # Find the cell the sample falls into, widening the extremes if needed
+        if sample < heights[0]:
+            heights[0] = sample
+            cell = 0
+        elif sample >= heights[4]:
+            heights[4] = sample
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if sample < heights[i + 1])
+
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the middle markers towards their desired positions
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+    def value(self) -> Optional[float]:
+        """Current estimate, or None before the first observation."""
+        if len(self._initial) < 5:
+            if not self._initial:
+                return None
+            ordered = sorted(self._initial)
+            return ordered[min(int(len(ordered) * self.quantile), len(ordered) - 1)]
+        return self._heights[2]
+
 
 class MetricsCollector:
     """
@@ -31,6 +137,16 @@ class MetricsCollector:
             config: Optional configuration dictionary for metrics collection
         """
         self.config = config or {}
+        # Buffer bounds, read once instead of per selector record
+        self._max_samples = self.config.get("max_duration_samples", 100)
+        self._max_errors = self.config.get("max_errors", 10)
+        # Export target from the app config, resolved on the first export
+        self._default_export_path: Optional[str] = None
+        # Directories already created for exports, so makedirs runs once each
+        self._export_dirs: set = set()
+        # Derived selector metrics, recomputed only for selectors in _dirty
+        self._derived_cache: Dict[str, Dict[str, Any]] = {}
+        self._dirty: set = set()
         self.logger = structlog.get_logger(__name__)
         self.metrics: Dict[str, Dict[str, Any]] = {}
         self.selector_metrics: Dict[str, Dict[str, Any]] = {}
@@ -38,7 +154,28 @@ class MetricsCollector:
         self.lock = threading.RLock()  # Ensure thread safety
         self.session_id = f"session_{int(time.time())}"
         self.start_time = time.time()
+        # Hot paths record monotonic_ns; reads map it back to wall time from here
+        self._wall_anchor = time.time()
+        self._monotonic_anchor_ns = time.monotonic_ns()
         
+    def _new_selector_metrics(self) -> Dict[str, Any]:
+        """Create the empty metrics record of a selector."""
+        return {
+            "total_executions": 0,
+            "successes": 0,
+            "failures": 0,
+            "retries": 0,
+            "total_duration_ms": 0,
+            # Recent samples; the deque drops the oldest one in O(1)
+            "durations": deque(maxlen=self._max_samples),
+            "p95_estimator": P2Quantile(0.95),
+            "circuit_breaker_trips": 0,
+            # Calls refused up front because the selector's breaker was open
+            "blocked_calls": 0,
+            "last_execution_ns": time.monotonic_ns(),
+            "errors": deque(maxlen=self._max_errors),  # Last few errors
+        }
+
     def record_selector_execution(
         self, 
         selector_name: str, 
@@ -59,52 +196,77 @@ class MetricsCollector:
             error: Error message if operation failed
             context: Additional context like job_id, page_url, etc.
         """
-        with self.lock:
-            # Initialize selector metrics if needed
-            if selector_name not in self.selector_metrics:
-                self.selector_metrics[selector_name] = {
-                    "total_executions": 0,
-                    "successes": 0,
-                    "failures": 0,
-                    "retries": 0,
-                    "total_duration_ms": 0,
-                    "durations": [],  # For percentile calculations
-                    "circuit_breaker_trips": 0,
-                    "last_execution_time": time.time(),
-                    "errors": [],  # Last few errors
-                }
-            
+        self.record_selector_executions(
+            selector_name, ((status, duration_ms, attempt, error),), context
+        )
+
+    def record_selector_executions(
+        self,
+        selector_name: str,
+        executions: Iterable[Tuple[str, float, int, Optional[str]]],
+        context: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Record every attempt of one selector operation in a single call.
+
+        Args:
+            selector_name: Name of the selector used
+            executions: (status, duration_ms, attempt, error) per attempt, as
+                taken by record_selector_execution
+            context: Additional context like job_id, page_url, etc.
+        """
+        # Hot path, called for every selector operation: no lock is taken.
+        # Selectors are driven from the event loop thread, setdefault creates
+        # a record atomically, and the bounded deques trim themselves.
+        metrics = self.selector_metrics.get(selector_name)
+        if metrics is None:
+            metrics = self.selector_metrics.setdefault(
+                selector_name, self._new_selector_metrics()
+            )
+
+        durations = metrics["durations"]
+        p95_estimator = metrics["p95_estimator"]
+        for status, duration_ms, attempt, error in executions:
             # Update metrics
-            metrics = self.selector_metrics[selector_name]
             metrics["total_executions"] += 1
             metrics["total_duration_ms"] += duration_ms
-            metrics["durations"].append(duration_ms)
-            metrics["last_execution_time"] = time.time()
-            
-            # Limit size of durations array to prevent memory issues
-            max_samples = self.config.get("max_duration_samples", 100)
-            if len(metrics["durations"]) > max_samples:
-                metrics["durations"] = metrics["durations"][-max_samples:]
-            
+            durations.append(duration_ms)
+            p95_estimator.add(duration_ms)
+
             # Update status counters
             if status == "success":
                 metrics["successes"] += 1
             elif status == "failure":
                 metrics["failures"] += 1
-                # Store error with timestamp and context
-                error_entry = {
+                # Store error with timestamp and context; the deque keeps the last max_errors
+                metrics["errors"].append({
                     "timestamp": time.time(),
                     "error": error or "Unknown error",
                     "attempt": attempt,
                     "context": context or {}
-                }
-                metrics["errors"].append(error_entry)
-                # Limit error history
-                if len(metrics["errors"]) > self.config.get("max_errors", 10):
-                    metrics["errors"] = metrics["errors"][-self.config.get("max_errors", 10):]
+                })
             elif status == "retry":
                 metrics["retries"] += 1
+        metrics["last_execution_ns"] = time.monotonic_ns()
+        # Marked last, so a concurrent read of a half-updated record is redone
+        self._dirty.add(selector_name)
     
+    def record_blocked_call(self, selector_name: str) -> None:
+        """
+        Record a call refused because the selector's circuit breaker is open.
+
+        Args:
+            selector_name: Name of the selector
+        """
+        # Lock-free like record_selector_executions, which runs on the same path
+        metrics = self.selector_metrics.get(selector_name)
+        if metrics is None:
+            metrics = self.selector_metrics.setdefault(
+                selector_name, self._new_selector_metrics()
+            )
+        metrics["blocked_calls"] += 1
+        self._dirty.add(selector_name)
+
     def record_circuit_breaker_state_change(
         self, 
         breaker_name: str, 
@@ -119,27 +281,23 @@ class MetricsCollector:
             old_state: Previous state of the circuit breaker
             new_state: New state of the circuit breaker
         """
-        # Extract selector name from breaker name (e.g., "selector_easy_apply_button" -> "easy_apply_button")
-        selector_name = breaker_name.replace("selector_", "")
+        # Extract selector name from breaker name (e.g., "selector_easy_apply_button" -> "easy_apply_button");
+        # only the leading prefix is stripped, not every occurrence
+        selector_name = breaker_name.removeprefix("selector_")
         
         with self.lock:
-            # Initialize selector metrics if needed
-            if selector_name not in self.selector_metrics:
-                self.selector_metrics[selector_name] = {
-                    "total_executions": 0,
-                    "successes": 0,
-                    "failures": 0,
-                    "retries": 0,
-                    "total_duration_ms": 0,
-                    "durations": [],
-                    "circuit_breaker_trips": 0,
-                    "errors": [],
-                    "last_execution_time": time.time(),
-                }
+            # Initialize selector metrics if needed; setdefault because
+            # record_selector_execution creates records without the lock
+            metrics = self.selector_metrics.get(selector_name)
+            if metrics is None:
+                metrics = self.selector_metrics.setdefault(
+                    selector_name, self._new_selector_metrics()
+                )
             
             # Record trip count when circuit opens
             if old_state == "closed" and new_state == "open":
-                self.selector_metrics[selector_name]["circuit_breaker_trips"] += 1
+                metrics["circuit_breaker_trips"] += 1
+            self._dirty.add(selector_name)
     
     def record_job_application(
         self, 
@@ -198,13 +356,18 @@ class MetricsCollector:
             Dictionary with selector metrics
         """
         with self.lock:
-            if selector_name and selector_name in self.selector_metrics:
-                return self._calculate_derived_metrics_for_selector(selector_name)
-            else:
-                result = {}
-                for name in self.selector_metrics:
-                    result[name] = self._calculate_derived_metrics_for_selector(name)
-                return result
+            self._refresh_derived_cache()
+            if selector_name and selector_name in self._derived_cache:
+                return self._derived_cache[selector_name]
+            return dict(self._derived_cache)
+
+    def _refresh_derived_cache(self) -> None:
+        """Recompute the derived metrics of selectors recorded since the last read."""
+        # Snapshot the names: selectors may be marked without the lock
+        for name in list(self._dirty):
+            # Unmarked before computing, so an update racing with it marks it again
+            self._dirty.discard(name)
+            self._derived_cache[name] = self._calculate_derived_metrics_for_selector(name)
     
     def _calculate_derived_metrics_for_selector(self, selector_name: str) -> Dict[str, Any]:
         """
@@ -222,10 +385,9 @@ class MetricsCollector:
         p95_duration = None
         avg_duration = None
         
-        if metrics["durations"]:
-            sorted_durations = sorted(metrics["durations"])
-            p95_idx = int(len(sorted_durations) * 0.95)
-            p95_duration = sorted_durations[min(p95_idx, len(sorted_durations) - 1)]
+        if metrics["total_executions"]:
+            # Streaming estimate over the session instead of sorting the samples
+            p95_duration = metrics["p95_estimator"].value()
             avg_duration = metrics["total_duration_ms"] / metrics["total_executions"]
         
         # Create result with calculated metrics
@@ -234,18 +396,23 @@ class MetricsCollector:
             "successes": metrics["successes"],
             "failures": metrics["failures"],
             "retries": metrics["retries"],
-            "success_rate": round(metrics["successes"] / max(metrics["total_executions"], 1) * 100, 2),
-            "avg_duration_ms": round(avg_duration, 2) if avg_duration is not None else None,
-            "p95_duration_ms": round(p95_duration, 2) if p95_duration is not None else None,
+            # Raw floats; rounded for display only when exported
+            "success_rate": metrics["successes"] / max(metrics["total_executions"], 1) * 100,
+            "avg_duration_ms": avg_duration,
+            "p95_duration_ms": p95_duration,
             "circuit_breaker_trips": metrics["circuit_breaker_trips"],
-            "last_execution_time": time.strftime(
-                "%Y-%m-%dT%H:%M:%SZ", time.gmtime(metrics["last_execution_time"])
-            ),
-            "recent_errors": metrics.get("errors", [])[-3:],  # Last 3 errors
+            "blocked_calls": metrics["blocked_calls"],
+            "last_execution_time": self._format_monotonic(metrics["last_execution_ns"]),
+            "recent_errors": list(metrics["errors"])[-3:],  # Last 3 errors
         }
         
         return result
     
+    def _format_monotonic(self, monotonic_ns: int) -> str:
+        """ISO-8601 UTC text of a time.monotonic_ns() reading."""
+        elapsed_s = (monotonic_ns - self._monotonic_anchor_ns) / 1_000_000_000
+        return _format_utc_second(int(self._wall_anchor + elapsed_s))
+
     def get_aggregated_metrics(self) -> Dict[str, Any]:
         """
         Get aggregated metrics for the current session.
@@ -257,12 +424,8 @@ class MetricsCollector:
             # Calculate overall session metrics
             aggregated = {
                 "session_id": self.session_id,
-                "start_time": time.strftime(
-                    "%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.start_time)
-                ),
-                "current_time": time.strftime(
-                    "%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time())
-                ),
+                "start_time": _format_utc_second(int(self.start_time)),
+                "current_time": _format_utc_second(int(time.time())),
                 "duration_seconds": int(time.time() - self.start_time),
                 "selectors": self.get_selector_metrics(),
                 "jobs": self.metrics.get("jobs", {
@@ -286,14 +449,31 @@ class MetricsCollector:
             Path to the exported metrics file
         """
         if not file_path:
-            file_path = str(config.logging.metrics_file_path) # Use the new config object
+            if self._default_export_path is None:
+                self._default_export_path = str(config.logging.metrics_file_path)
+            file_path = self._default_export_path
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # Ensure directory exists (checked on the first export to it only)
+        directory = os.path.dirname(file_path)
+        if directory not in self._export_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._export_dirs.add(directory)
         
         # Write metrics to file
-        with open(file_path, "w") as f:
-            json.dump({"aggregated_metrics": self.get_aggregated_metrics()}, f, indent=2)
+        aggregated = self.get_aggregated_metrics()
+        aggregated["selectors"] = {
+            name: _rounded_for_display(selector)
+            for name, selector in aggregated["selectors"].items()
+        }
+        payload = {"aggregated_metrics": aggregated}
+        if orjson is not None:
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(
+                    payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(file_path, "w") as f:
+                json.dump(payload, f, separators=(",", ":"))
         
         self.logger.info("metrics_exported", file_path=file_path)
         return file_path
@@ -301,6 +481,7 @@ class MetricsCollector:
 
 # Singleton instance for app-wide metrics
 _instance: Optional[MetricsCollector] = None
+_instance_lock = threading.Lock()
 
 
 def get_metrics_collector() -> MetricsCollector:
@@ -312,6 +493,10 @@ def get_metrics_collector() -> MetricsCollector:
     """
     global _instance
     if _instance is None:
-        _instance = MetricsCollector()
+        # Double-checked, so only the first calls ever take the lock and two
+        # threads cannot each build a collector
+        with _instance_lock:
+            if _instance is None:
+                _instance = MetricsCollector()
     return _instance
 
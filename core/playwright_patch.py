@@ -0,0 +1,95 @@
+"""
+Optional patch that makes Playwright's per-call stack capture cheaper.
+
+Every Playwright API call walks the Python call stack to find the public API
+name (used in error messages) and the user frames (used only for tracing).
+The stock implementation materializes ``frame.f_locals`` and builds a dict
+for each frame, which shows up in profiles of call-heavy form filling. The
+lightweight variant resolves the API name from ``co_qualname`` and skips frame
+collection, so traces recorded with it have no source locations.
+
+Like the stock capture, it walks the whole stack and reports the outermost API
+boundary. For a method inherited from a base class, ``co_qualname`` names the
+defining class where the stock capture names the class of ``self``.
+"""
+
+import logging
+import sys
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+_installed = False
+
+
+def _build_lightweight_capture_stack_trace(
+    mapping_file: str, playwright_path: str
+) -> Callable[[], Dict[str, Any]]:
+    """
+    Builds the drop-in for ``_connection._capture_stack_trace``.
+
+    The glue module's path and Playwright's package path are resolved once by
+    the installer and closed over, so the hook does no imports or attribute
+    lookups of its own on each API call.
+    """
+    getframe = sys._getframe
+
+    def capture_stack_trace() -> Dict[str, Any]:
+        # Skip this helper and the caller that only captures the stack.
+        frame = getframe(2)
+        last_internal_api_name = ""
+        api_name = ""
+        while frame:
+            code = frame.f_code
+            filename = code.co_filename
+            if filename == mapping_file:
+                frame = frame.f_back
+                continue
+            if filename.startswith(playwright_path):
+                last_internal_api_name = code.co_qualname
+            elif last_internal_api_name:
+                # Keep walking, like the stock capture: the outermost API
+                # boundary names the call
+                api_name = last_internal_api_name
+                last_internal_api_name = ""
+            frame = frame.f_back
+        if not api_name:
+            api_name = last_internal_api_name
+
+        return {"frames": [], "apiName": api_name, "title": None}
+
+    return capture_stack_trace
+
+
+def install_lightweight_stack_capture() -> bool:
+    """
+    Replaces Playwright's stack capture with the lightweight variant.
+
+    Safe to call more than once. Returns False (leaving Playwright untouched)
+    if the private hook is not present in the installed Playwright version.
+    """
+    global _installed
+    if _installed:
+        return True
+
+    try:
+        from playwright._impl import _connection
+    except ImportError:
+        return False
+
+    if not callable(getattr(_connection, "_capture_stack_trace", None)) or not hasattr(
+        _connection, "_PLAYWRIGHT_MODULE_PATH"
+    ):
+        logger.warning(
+            "Playwright stack capture hook not found; lightweight stack capture not installed."
+        )
+        return False
+
+    import playwright._impl._impl_to_api_mapping as impl_to_api_mapping
+
+    _connection._capture_stack_trace = _build_lightweight_capture_stack_trace(
+        impl_to_api_mapping.__file__, _connection._PLAYWRIGHT_MODULE_PATH
+    )
+    _installed = True
+    logger.info("Installed lightweight Playwright stack capture.")
+    return True
@@ -8,44 +8,120 @@ This module provides mechanisms for building resilient operations using:
 """
 
 import time
-import functools
 import logging
 import asyncio
-from typing import Dict, Any, Optional, Callable, TypeVar, Union, cast, Awaitable, Tuple
+import random
+import weakref
+from typing import Dict, Any, List, Optional, Callable, TypeVar, Awaitable, Tuple, NamedTuple
 
 import structlog
 import pybreaker
 from tenacity import (
-    retry, 
+    AsyncRetrying,
+    RetryCallState,
     stop_after_attempt, 
-    wait_exponential,
     retry_if_exception_type,
     before_log, 
     after_log,
-    RetryError,
-    wait_random
 )
-from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError, Locator, Error as PlaywrightError
+from tenacity.wait import wait_base
+from playwright.async_api import Page, Locator, Error as PlaywrightError
 
 from core.metrics import get_metrics_collector
+from core.selectors import selectors
 from core.logger import get_structured_logger, bind_context
 from config import config, AppConfig # Import the new config object
 
 # Type variables for generic function signatures
 T = TypeVar('T')
-R = TypeVar('R')
 
 # Configure standard logger for tenacity
 logger = logging.getLogger(__name__)
 structured_logger = get_structured_logger(__name__)
 
+# Only Playwright errors (timeouts included) are worth another attempt. Anything
+# else, such as an open circuit breaker or a bug in the operation, fails at once
+# instead of sleeping through the backoff ladder.
+RETRYABLE_EXCEPTIONS: Tuple[type, ...] = (PlaywrightError,)
+_RETRY_ON_RETRYABLE_EXCEPTIONS = retry_if_exception_type(RETRYABLE_EXCEPTIONS)
+
+# Tenacity hooks logging each attempt at DEBUG, shared by all retry policies
+_ATTEMPT_LOG_HOOKS = {
+    "before": before_log(logger, logging.DEBUG),
+    "after": after_log(logger, logging.DEBUG),
+}
+
+
+def _ms_with_two_decimals(duration_ns: int) -> float:
+    """Converts a monotonic_ns duration to milliseconds, truncated to two decimals for logs."""
+    return duration_ns // 10_000 / 100
+
+
+class SelectorRetrySettings(NamedTuple):
+    """Retry settings of one selector, with its overrides merged over the defaults."""
+
+    max_attempts: int
+    initial_wait: float
+    max_wait: float
+    exponential_base: float
+    use_jitter: bool
+
+
+class BackoffTable(wait_base):
+    """
+    Exponential backoff read from a table computed once from a selector's settings.
+
+    The delay after attempt n is initial_wait * exponential_base ** (n - 1),
+    kept between initial_wait and max_wait, plus up to a second of jitter when
+    enabled - the same schedule as wait_exponential + wait_random(0, 1),
+    without the power and min/max arithmetic on every attempt.
+    """
+
+    def __init__(self, settings: SelectorRetrySettings):
+        initial_wait = settings.initial_wait
+        self.delays: Tuple[float, ...] = tuple(
+            max(initial_wait, min(initial_wait * settings.exponential_base ** i, settings.max_wait))
+            for i in range(max(settings.max_attempts - 1, 1))
+        )
+        self.use_jitter = settings.use_jitter
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        delay = self.delays[min(retry_state.attempt_number, len(self.delays)) - 1]
+        if self.use_jitter:
+            delay += random.uniform(0, 1)
+        return delay
+
+
+def _with_context(
+    logger: structlog.BoundLogger, context: Optional[Dict[str, Any]]
+) -> structlog.BoundLogger:
+    """Bind per-call context to a logger, skipping the bind when there is none."""
+    return bind_context(logger, **context) if context else logger
+
+
+class _SelectorPlan(NamedTuple):
+    """Everything an operation on one selector needs, resolved on its first call."""
+
+    settings: SelectorRetrySettings
+    backoff: BackoffTable
+    retry_policy: AsyncRetrying
+    breaker: pybreaker.CircuitBreaker
+    logger: structlog.BoundLogger
+    debug_enabled: bool
+
 
 class CircuitBreakerListener(pybreaker.CircuitBreakerListener):
     """
     Circuit breaker listener that collects metrics and logs state changes.
     """
     
-    def __init__(self, metrics_collector, logger: structlog.BoundLogger, selector_name: str):
+    def __init__(
+        self,
+        metrics_collector,
+        logger: structlog.BoundLogger,
+        selector_name: str,
+        state_mirror: Optional[Dict[str, str]] = None,
+    ):
         """
         Initialize the circuit breaker listener.
         
@@ -53,10 +129,13 @@ class CircuitBreakerListener(pybreaker.CircuitBreakerListener):
             metrics_collector: Metrics collector instance
             logger: Structured logger instance
             selector_name: Name of the selector this circuit breaker protects
+            state_mirror: Optional mapping of selector names to state names,
+                updated on every state change
         """
         self.metrics_collector = metrics_collector
         self.logger = logger
         self.selector_name = selector_name
+        self.state_mirror = state_mirror
     
     def state_change(self, breaker, old_state, new_state):
         """
@@ -73,6 +152,8 @@ class CircuitBreakerListener(pybreaker.CircuitBreakerListener):
             old_state=str(old_state.name),
             new_state=str(new_state.name)
         )
+        if self.state_mirror is not None:
+            self.state_mirror[self.selector_name] = str(new_state.name)
         self.metrics_collector.record_circuit_breaker_state_change(
             breaker.name, str(old_state.name), str(new_state.name)
         )
@@ -89,7 +170,7 @@ class CircuitBreakerListener(pybreaker.CircuitBreakerListener):
             "circuit_breaker_failure",
             selector=self.selector_name,
             error=str(exc),
-            failure_count=breaker._failure_count,
+            failure_count=breaker.fail_counter,
             threshold=breaker.fail_max
         )
     
@@ -122,6 +203,28 @@ class SelectorCircuitBreaker:
         self.metrics_collector = get_metrics_collector()
         self.logger = get_structured_logger(__name__)
         self.breakers: Dict[str, pybreaker.CircuitBreaker] = {}
+        # Current state name of each breaker, kept up to date by its listener
+        self._state_mirror: Dict[str, str] = {}
+        self.selector_loggers: Dict[str, structlog.BoundLogger] = {}
+
+    def get_selector_logger(self, selector_name: str) -> structlog.BoundLogger:
+        """
+        Get or create the logger bound to a selector.
+
+        The bound logger is built once per selector and reused, instead of
+        binding a fresh one on every operation.
+
+        Args:
+            selector_name: Name of the selector
+
+        Returns:
+            Structured logger with the selector bound
+        """
+        selector_logger = self.selector_loggers.get(selector_name)
+        if selector_logger is None:
+            selector_logger = bind_context(self.logger, selector=selector_name)
+            self.selector_loggers[selector_name] = selector_logger
+        return selector_logger
         
     def get_breaker(self, selector_name: str) -> pybreaker.CircuitBreaker:
         """
@@ -133,22 +236,24 @@ class SelectorCircuitBreaker:
         Returns:
             Circuit breaker instance for the selector
         """
-        if selector_name not in self.breakers:
+        breaker = self.breakers.get(selector_name)
+        if breaker is None:
             # Create selector-specific logger
-            logger = bind_context(self.logger, selector=selector_name)
+            logger = self.get_selector_logger(selector_name)
             
             # Create listener for metrics collection
             listener = CircuitBreakerListener(
                 self.metrics_collector, 
                 logger,
-                selector_name
+                selector_name,
+                state_mirror=self._state_mirror,
             )
             
             # Get selector-specific configuration
             selector_config_override = self.app_config.selector_retry_overrides.overrides.get(selector_name, {})
             
             # Create circuit breaker with configuration
-            self.breakers[selector_name] = pybreaker.CircuitBreaker(
+            breaker = pybreaker.CircuitBreaker(
                 fail_max=selector_config_override.get(
                     "failure_threshold", 
                     self.app_config.circuit_breaker.failure_threshold
@@ -159,22 +264,24 @@ class SelectorCircuitBreaker:
                 ),
                 name=f"selector_{selector_name}",
                 listeners=[listener],
-                exclude=[self.app_config.circuit_breaker.expected_exception]
+                exclude=self.app_config.circuit_breaker.excluded_exceptions
             )
+            self.breakers[selector_name] = breaker
+            self._state_mirror[selector_name] = breaker.current_state
         
-        return self.breakers[selector_name]
+        return breaker
     
     def get_all_states(self) -> Dict[str, str]:
         """
         Get the current state of all circuit breakers.
+
+        Served from the mirror the listeners maintain, without reading each
+        breaker's state under its lock.
         
         Returns:
             Dictionary mapping selector names to circuit breaker states
         """
-        return {
-            name: breaker.current_state
-            for name, breaker in self.breakers.items()
-        }
+        return dict(self._state_mirror)
 
 
 # Singleton circuit breaker manager
@@ -211,11 +318,91 @@ class SelectorExecutor:
             page: Playwright page instance
             app_config: The application configuration object.
         """
-        self.page = page
+        self._page_ref = weakref.ref(page)
         self.app_config = app_config
         self.logger = get_structured_logger(__name__)
         self.metrics_collector = get_metrics_collector()
         self.circuit_breaker_manager = get_circuit_breaker_manager()
+        # Settings, retry policy, breaker and logger of each selector, resolved
+        # on its first operation so later calls need a single lookup
+        self._selector_plans: Dict[str, _SelectorPlan] = {}
+
+    @property
+    def page(self) -> Page:
+        """The Playwright page, held weakly so a cached executor does not keep it alive."""
+        return self._page_ref()
+
+    def _resolved_config(self, selector_name: str) -> SelectorRetrySettings:
+        """
+        Resolve the retry settings of a selector.
+
+        Args:
+            selector_name: Name of the selector
+
+        Returns:
+            The selector's overrides merged over the resilience defaults
+        """
+        # Get selector-specific configuration
+        selector_config_override = self.app_config.selector_retry_overrides.overrides.get(selector_name, {})
+        resilience = self.app_config.resilience
+        return SelectorRetrySettings(
+            max_attempts=selector_config_override.get("max_attempts", resilience.max_attempts),
+            initial_wait=selector_config_override.get("initial_wait", resilience.initial_wait),
+            max_wait=selector_config_override.get("max_wait", resilience.max_wait),
+            exponential_base=selector_config_override.get("exponential_base", resilience.exponential_base),
+            use_jitter=selector_config_override.get("jitter", resilience.jitter),
+        )
+
+    @staticmethod
+    def _build_retry_policy(settings: SelectorRetrySettings, backoff: BackoffTable) -> AsyncRetrying:
+        """
+        Build the retry policy for a selector's settings.
+
+        Args:
+            settings: Resolved retry settings of the selector
+            backoff: The selector's backoff table
+
+        Returns:
+            Retry policy. Callers iterate a `copy()` of it, since a running
+            retry loop keeps its state on the policy object.
+        """
+        # The attempt hooks are attached only when their DEBUG records would be
+        # kept; otherwise tenacity runs its no-op defaults between attempts
+        hooks = _ATTEMPT_LOG_HOOKS if logger.isEnabledFor(logging.DEBUG) else {}
+        return AsyncRetrying(
+            stop=stop_after_attempt(settings.max_attempts),
+            wait=backoff,
+            retry=_RETRY_ON_RETRYABLE_EXCEPTIONS,
+            reraise=True,
+            **hooks,
+        )
+
+    def _selector_plan(self, selector_name: str) -> _SelectorPlan:
+        """
+        Get the resolved settings, retry policy, breaker and logger of a selector.
+
+        Args:
+            selector_name: Name of the selector
+
+        Returns:
+            The selector's plan, built on its first operation and reused
+        """
+        plan = self._selector_plans.get(selector_name)
+        if plan is None:
+            settings = self._resolved_config(selector_name)
+            backoff = BackoffTable(settings)
+            selector_logger = self.circuit_breaker_manager.get_selector_logger(selector_name)
+            plan = _SelectorPlan(
+                settings=settings,
+                backoff=backoff,
+                retry_policy=self._build_retry_policy(settings, backoff),
+                breaker=self.circuit_breaker_manager.get_breaker(selector_name),
+                logger=selector_logger,
+                # The log level is fixed when logging is set up, so it is read once
+                debug_enabled=selector_logger.is_enabled_for(logging.DEBUG),
+            )
+            self._selector_plans[selector_name] = plan
+        return plan
     
     async def _execute_with_resilience(
         self,
@@ -241,151 +428,122 @@ class SelectorExecutor:
         Raises:
             Exception: If the operation fails after all retries, or if the circuit breaker is open
         """
+        plan = self._selector_plan(selector_name)
+        breaker = plan.breaker
+
         # Get selector-specific configuration
-        selector_config_override = self.app_config.selector_retry_overrides.overrides.get(selector_name, {})
-        
-        # Configure retry with exponential backoff
-        max_attempts = selector_config_override.get("max_attempts", self.app_config.resilience.max_attempts)
-        initial_wait = selector_config_override.get("initial_wait", self.app_config.resilience.initial_wait)
-        max_wait = selector_config_override.get("max_wait", self.app_config.resilience.max_wait)
-        exponential_base = selector_config_override.get("exponential_base", self.app_config.resilience.exponential_base)
-        use_jitter = selector_config_override.get("jitter", self.app_config.resilience.jitter)
-        
-        # Create a logger with context
-        op_logger = bind_context(
-            self.logger, 
-            selector=selector_name,
-            **(context or {})
-        )
-        
-        # Get circuit breaker for this selector
-        breaker = self.circuit_breaker_manager.get_breaker(selector_name)
-        
-        # Retry decorator configuration
-        retry_config = {
-            "stop": stop_after_attempt(max_attempts),
-            "wait": wait_exponential(
-                multiplier=initial_wait,
-                min=initial_wait,
-                max=max_wait,
-                exp_base=exponential_base
-            ),
-            "retry": retry_if_exception_type((PlaywrightTimeoutError, Exception)),
-            "reraise": True,
-            "before": before_log(logger, logging.DEBUG),
-            "after": after_log(logger, logging.DEBUG),
-        }
+        max_attempts = plan.settings.max_attempts
         
-        # Add jitter if configured
-        if use_jitter:
-            retry_config["wait"] = retry_config["wait"] + wait_random(0, 1)
+        # Reuse the selector's logger. Per-call context is bound only once an
+        # event is emitted, so a successful call with DEBUG off binds nothing.
+        debug_enabled = plan.debug_enabled
+        op_logger = _with_context(plan.logger, context) if debug_enabled else None
 
         attempt = 0
-        start_time = time.time()
-        
-        @retry(**retry_config)  # type: ignore
-        async def _operation_with_retry() -> T:
-            """Inner function to apply retry decorator."""
-            nonlocal attempt
-            attempt += 1
-            
-            op_start_time = time.time()
-            
-            try:
-                op_logger.debug(
-                    "selector_operation_start", 
-                    attempt=attempt,
-                    max_attempts=max_attempts,
-                )
-                
-                # Execute operation inside circuit breaker
-                result = await breaker(operation)(*args, **kwargs)
-                
-                duration_ms = (time.time() - op_start_time) * 1000
-                
-                op_logger.debug(
-                    "selector_operation_success",
-                    duration_ms=round(duration_ms, 2),
-                    attempt=attempt,
-                )
-                
-                # Record successful execution
-                self.metrics_collector.record_selector_execution(
-                    selector_name=selector_name,
-                    status="success",
-                    duration_ms=duration_ms,
-                    attempt=attempt,
-                    context=context,
-                )
-                
-                return result
-                
-            except Exception as e:
-                duration_ms = (time.time() - op_start_time) * 1000
-                
-                # If this is the last attempt, log as error
-                if attempt >= max_attempts:
-                    op_logger.error(
-                        "selector_operation_failed",
-                        error=str(e),
-                        error_type=type(e).__name__,
-                        duration_ms=round(duration_ms, 2),
-                        attempt=attempt,
-                    )
-                else:
-                    op_logger.warning(
-                        "selector_operation_retry",
-                        error=str(e),
-                        error_type=type(e).__name__,
-                        duration_ms=round(duration_ms, 2),
-                        attempt=attempt,
-                        next_attempt_in=f"{initial_wait * (exponential_base ** (attempt-1))}s",
-                    )
-                    
-                    # Record retry metric
-                    self.metrics_collector.record_selector_execution(
-                        selector_name=selector_name,
-                        status="retry",
-                        duration_ms=duration_ms,
-                        attempt=attempt,
-                        error=str(e),
-                        context=context,
-                    )
-                
-                raise
+        # Whether the breaker let the last attempt's operation run
+        operation_started = False
+        start_ns = time.monotonic_ns()
+        # (status, duration_ms, attempt, error) of each attempt, handed to the
+        # metrics collector in one call once the operation has finished
+        executions: List[Tuple[str, float, int, Optional[str]]] = []
         
         try:
             # Execute the operation with retry
-            result = await _operation_with_retry()
+            async for attempt_manager in plan.retry_policy.copy():
+                with attempt_manager:
+                    attempt = attempt_manager.retry_state.attempt_number
+                    op_start_ns = time.monotonic_ns()
+                    operation_started = False
+                    
+                    try:
+                        if debug_enabled:
+                            op_logger.debug(
+                                "selector_operation_start",
+                                attempt=attempt,
+                                max_attempts=max_attempts,
+                            )
+                        
+                        # The operation is awaited inside the breaker, so its
+                        # failures count; breaker.call() would only see the
+                        # coroutine being created. An open breaker raises
+                        # CircuitBreakerError here, before the operation runs.
+                        with breaker.calling():
+                            operation_started = True
+                            result = await operation(*args, **kwargs)
+                        
+                        duration_ns = time.monotonic_ns() - op_start_ns
+                        duration_ms = duration_ns / 1_000_000
+                        
+                        if debug_enabled:
+                            op_logger.debug(
+                                "selector_operation_success",
+                                duration_ms=_ms_with_two_decimals(duration_ns),
+                                attempt=attempt,
+                            )
+                        
+                    except Exception as e:
+                        duration_ns = time.monotonic_ns() - op_start_ns
+                        duration_ms = duration_ns / 1_000_000
+                        
+                        # Terminal failures are logged once, by the handler below
+                        if attempt < max_attempts and isinstance(e, RETRYABLE_EXCEPTIONS):
+                            if op_logger is None:
+                                op_logger = _with_context(plan.logger, context)
+                            op_logger.warning(
+                                "selector_operation_retry",
+                                error=str(e),
+                                error_type=type(e).__name__,
+                                duration_ms=_ms_with_two_decimals(duration_ns),
+                                attempt=attempt,
+                                next_attempt_in=f"{plan.backoff.delays[attempt - 1]}s",
+                            )
+                            
+                            # Record retry metric
+                            executions.append(("retry", duration_ms, attempt, str(e)))
+                        
+                        raise
+
+            # Record successful execution
+            executions.append(("success", duration_ms, attempt, None))
+            self.metrics_collector.record_selector_executions(
+                selector_name, executions, context
+            )
             return result
             
-        except (RetryError, Exception) as e:
+        except Exception as e:
+            if not operation_started and isinstance(e, pybreaker.CircuitBreakerError):
+                # Refused by an open breaker; the operation never ran, so this is
+                # counted as a blocked call rather than a failed execution
+                if executions:
+                    self.metrics_collector.record_selector_executions(
+                        selector_name, executions, context
+                    )
+                self.metrics_collector.record_blocked_call(selector_name)
+                raise
+
             # Calculate total duration
-            total_duration_ms = (time.time() - start_time) * 1000
+            total_duration_ns = time.monotonic_ns() - start_ns
+            total_duration_ms = total_duration_ns / 1_000_000
             
             # Record failure metric
-            self.metrics_collector.record_selector_execution(
-                selector_name=selector_name,
-                status="failure",
-                duration_ms=total_duration_ms,
-                attempt=attempt,
-                error=str(e),
-                context=context,
+            executions.append(("failure", total_duration_ms, attempt, str(e)))
+            self.metrics_collector.record_selector_executions(
+                selector_name, executions, context
             )
             
             # Log the failure
+            if op_logger is None:
+                op_logger = _with_context(plan.logger, context)
             op_logger.error(
                 "selector_operation_failed_all_retries",
                 error=str(e),
                 error_type=type(e).__name__,
                 attempts=attempt,
                 max_attempts=max_attempts,
-                total_duration_ms=round(total_duration_ms, 2),
+                total_duration_ms=_ms_with_two_decimals(total_duration_ns),
             )
             
-            # Re-raise the original exception
-            if isinstance(e, RetryError) and e.last_attempt.exception():
-                raise e.last_attempt.exception() from None
+            # The policy reraises, so this is the operation's own exception
             raise
             
     async def wait_for_selector(
@@ -433,18 +591,18 @@ class SelectorExecutor:
             selector_name: Name of the selector (for logs and metrics)
             css_selector: CSS selector string (defaults to selector name if not provided)
             context: Additional context for logging
-            timeout: Timeout in milliseconds for wait_for_selector. Defaults to config.performance.selector_timeout.
+            timeout: Timeout in milliseconds for the element to become actionable. Defaults to config.performance.selector_timeout.
         """
         if css_selector is None:
-            from core.selectors import selectors
             css_selector = selectors.get(selector_name, selector_name)
         
         if timeout is None:
             timeout = self.app_config.performance.selector_timeout
             
         async def operation():
-            await self.page.wait_for_selector(css_selector, timeout=timeout)
-            await self.page.click(css_selector)
+            # Playwright actions wait for the element themselves, so no separate
+            # wait_for_selector round trip is needed
+            await self.page.click(css_selector, timeout=timeout)
             
         return await self._execute_with_resilience(
             selector_name=selector_name,
@@ -468,18 +626,16 @@ class SelectorExecutor:
             value: Value to fill in the form field
             css_selector: CSS selector string (defaults to selector name if not provided)
             context: Additional context for logging
-            timeout: Timeout in milliseconds for wait_for_selector. Defaults to config.performance.selector_timeout.
+            timeout: Timeout in milliseconds for the element to become actionable. Defaults to config.performance.selector_timeout.
         """
         if css_selector is None:
-            from core.selectors import selectors
             css_selector = selectors.get(selector_name, selector_name)
         
         if timeout is None:
             timeout = self.app_config.performance.selector_timeout
             
         async def operation():
-            await self.page.wait_for_selector(css_selector, timeout=timeout)
-            await self.page.fill(css_selector, value)
+            await self.page.fill(css_selector, value, timeout=timeout)
             
         return await self._execute_with_resilience(
             selector_name=selector_name,
@@ -503,18 +659,16 @@ class SelectorExecutor:
             checked: Whether to check or uncheck the checkbox
             css_selector: CSS selector string (defaults to selector name if not provided)
             context: Additional context for logging
-            timeout: Timeout in milliseconds for wait_for_selector. Defaults to config.performance.selector_timeout.
+            timeout: Timeout in milliseconds for the element to become actionable. Defaults to config.performance.selector_timeout.
         """
         if css_selector is None:
-            from core.selectors import selectors
             css_selector = selectors.get(selector_name, selector_name)
         
         if timeout is None:
             timeout = self.app_config.performance.selector_timeout
             
         async def operation():
-            await self.page.wait_for_selector(css_selector, timeout=timeout)
-            await self.page.set_checked(css_selector, checked)
+            await self.page.set_checked(css_selector, checked, timeout=timeout)
             
         return await self._execute_with_resilience(
             selector_name=selector_name,
@@ -538,18 +692,16 @@ class SelectorExecutor:
             value: Value of the option to select
             css_selector: CSS selector string (defaults to selector name if not provided)
             context: Additional context for logging
-            timeout: Timeout in milliseconds for wait_for_selector. Defaults to config.performance.selector_timeout.
+            timeout: Timeout in milliseconds for the element to become actionable. Defaults to config.performance.selector_timeout.
         """
         if css_selector is None:
-            from core.selectors import selectors
             css_selector = selectors.get(selector_name, selector_name)
         
         if timeout is None:
             timeout = self.app_config.performance.selector_timeout
             
         async def operation():
-            await self.page.wait_for_selector(css_selector, timeout=timeout)
-            await self.page.select_option(css_selector, value)
+            await self.page.select_option(css_selector, value, timeout=timeout)
             
         return await self._execute_with_resilience(
             selector_name=selector_name,
@@ -573,18 +725,16 @@ class SelectorExecutor:
             file_path: Path to the file to upload
             css_selector: CSS selector string (defaults to selector name if not provided)
             context: Additional context for logging
-            timeout: Timeout in milliseconds for wait_for_selector. Defaults to config.performance.selector_timeout.
+            timeout: Timeout in milliseconds for the element to become actionable. Defaults to config.performance.selector_timeout.
         """
         if css_selector is None:
-            from core.selectors import selectors
             css_selector = selectors.get(selector_name, selector_name)
         
         if timeout is None:
             timeout = self.app_config.performance.selector_timeout
             
         async def operation():
-            await self.page.wait_for_selector(css_selector, timeout=timeout)
-            await self.page.set_input_files(css_selector, file_path)
+            await self.page.set_input_files(css_selector, file_path, timeout=timeout)
             
         return await self._execute_with_resilience(
             selector_name=selector_name,
@@ -612,7 +762,6 @@ class SelectorExecutor:
             Text content of the element
         """
         if css_selector is None:
-            from core.selectors import selectors
             css_selector = selectors.get(selector_name, selector_name)
         
         if timeout is None:
@@ -636,45 +785,37 @@ class SelectorExecutor:
         timeout: Optional[int] = None
     ) -> bool:
         """
-        Check if an element is visible with resilience.
+        Check if an element is visible.
         
         This method doesn't throw if element is not found, just returns False.
+        It is a predicate, not an action: a single wait decides it, without
+        retries, circuit breaker or metrics, so a negative answer takes
+        `timeout` rather than every attempt's timeout plus the backoff.
         
         Args:
-            selector_name: Name of the selector (for logs and metrics)
+            selector_name: Name of the selector (used when css_selector is not provided)
             css_selector: CSS selector string (defaults to selector name if not provided)
-            context: Additional context for logging
+            context: Unused; kept for signature compatibility with the other operations
             timeout: Timeout in milliseconds for wait_for_selector. Defaults to config.performance.selector_timeout.
             
         Returns:
             True if element is visible, False otherwise
         """
         if css_selector is None:
-            from core.selectors import selectors
             css_selector = selectors.get(selector_name, selector_name)
         
         if timeout is None:
             timeout = self.app_config.performance.selector_timeout
             
-        async def operation():
-            try:
-                element = await self.page.wait_for_selector(
-                    css_selector, 
-                    timeout=timeout,
-                    state="visible"
-                )
-                return element is not None
-            except PlaywrightTimeoutError:
-                return False
-            
         try:
-            return await self._execute_with_resilience(
-                selector_name=f"{selector_name}_visibility",
-                operation=operation,
-                context=context
+            element = await self.page.wait_for_selector(
+                css_selector, 
+                timeout=timeout,
+                state="visible"
             )
-        except Exception:
+        except PlaywrightError:
             return False
+        return element is not None
     
     async def execute_operation(
         self,
@@ -712,8 +853,8 @@ class SelectorExecutor:
         )
 
 
-# Singleton instance for app-wide selector executor
-_selector_executor: Dict[int, SelectorExecutor] = {}
+# Selector executor per page; an entry goes away once its page is collected
+_selector_executor: "weakref.WeakKeyDictionary[Page, SelectorExecutor]" = weakref.WeakKeyDictionary()
 
 
 def get_selector_executor(page: Page) -> SelectorExecutor:
@@ -726,10 +867,11 @@ def get_selector_executor(page: Page) -> SelectorExecutor:
     Returns:
         SelectorExecutor instance for the page
     """
-    page_id = id(page)
-    if page_id not in _selector_executor:
-        _selector_executor[page_id] = SelectorExecutor(page, config)
-    return _selector_executor[page_id]
+    executor = _selector_executor.get(page)
+    if executor is None:
+        executor = SelectorExecutor(page, config)
+        _selector_executor[page] = executor
+    return executor
 
 
 class ResilienceExecutor:
@@ -754,10 +896,18 @@ class ResilienceExecutor:
             page: Playwright page instance
             app_config: The application configuration object
         """
-        self.page = page
+        self._page_ref = weakref.ref(page)
         self.app_config = app_config
         self.selector_executor = SelectorExecutor(page, app_config)
         self.logger = get_structured_logger(__name__)
+        # (max_attempts, initial_wait, exponential_base) of workflow retries,
+        # resolved on the first workflow run
+        self._workflow_retry_settings: Optional[Tuple[int, float, int]] = None
+
+    @property
+    def page(self) -> Page:
+        """The Playwright page, held weakly so a cached executor does not keep it alive."""
+        return self._page_ref()
     
     # Delegate all SelectorExecutor methods for backward compatibility
     async def wait_for_selector(
@@ -855,7 +1005,7 @@ class ResilienceExecutor:
         context: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None
     ) -> bool:
-        """Check if an element is visible with resilience."""
+        """Check if an element is visible, with a single wait."""
         return await self.selector_executor.is_visible(
             selector_name, css_selector, context, timeout
         )
@@ -894,13 +1044,7 @@ class ResilienceExecutor:
         if timeout is None:
             timeout = self.app_config.performance.selector_timeout
         
-        # Get navigation-specific configuration
-        selector_config_override = self.app_config.selector_retry_overrides.overrides.get("navigation", {})
-        max_attempts = selector_config_override.get(
-            "max_attempts", 
-            self.app_config.resilience.navigation_max_attempts
-        )
-        
+        # Retry settings come from the "navigation" selector's cached plan
         async def nav_operation():
             await self.page.goto(url, wait_until=wait_until, timeout=timeout)
         
@@ -987,6 +1131,25 @@ class ResilienceExecutor:
             f"{label} text did not load after waiting {delay_sequence_label} seconds."
         )
     
+    def _workflow_retry(self) -> Tuple[int, float, int]:
+        """
+        Resolve the workflow retry settings once per executor.
+
+        Returns:
+            (max_attempts, initial_wait, exponential_base), with the "workflow"
+            overrides merged over the resilience defaults
+        """
+        if self._workflow_retry_settings is None:
+            # Get workflow-specific configuration
+            selector_config_override = self.app_config.selector_retry_overrides.overrides.get("workflow", {})
+            resilience = self.app_config.resilience
+            self._workflow_retry_settings = (
+                selector_config_override.get("max_attempts", resilience.workflow_max_attempts),
+                selector_config_override.get("initial_wait", resilience.workflow_initial_wait),
+                selector_config_override.get("exponential_base", resilience.exponential_base),
+            )
+        return self._workflow_retry_settings
+
     async def execute_workflow_with_retry(
         self,
         operation_name: str,
@@ -1016,20 +1179,7 @@ class ResilienceExecutor:
         Raises:
             Exception: If the operation fails after all retries
         """
-        # Get workflow-specific configuration
-        selector_config_override = self.app_config.selector_retry_overrides.overrides.get("workflow", {})
-        max_attempts = selector_config_override.get(
-            "max_attempts",
-            self.app_config.resilience.workflow_max_attempts
-        )
-        initial_wait = selector_config_override.get(
-            "initial_wait",
-            self.app_config.resilience.workflow_initial_wait
-        )
-        exponential_base = selector_config_override.get(
-            "exponential_base",
-            self.app_config.resilience.exponential_base
-        )
+        max_attempts, initial_wait, exponential_base = self._workflow_retry()
         
         op_logger = bind_context(
             self.logger,
@@ -1133,8 +1283,8 @@ class ResilienceExecutor:
             return None
 
 
-# Singleton instance for app-wide resilience executor
-_resilience_executor: Dict[int, ResilienceExecutor] = {}
+# Resilience executor per page; an entry goes away once its page is collected
+_resilience_executor: "weakref.WeakKeyDictionary[Page, ResilienceExecutor]" = weakref.WeakKeyDictionary()
 
 
 def get_resilience_executor(page: Page) -> ResilienceExecutor:
@@ -1147,8 +1297,9 @@ def get_resilience_executor(page: Page) -> ResilienceExecutor:
     Returns:
         ResilienceExecutor instance for the page
     """
-    page_id = id(page)
-    if page_id not in _resilience_executor:
-        _resilience_executor[page_id] = ResilienceExecutor(page, config)
-    return _resilience_executor[page_id]
+    executor = _resilience_executor.get(page)
+    if executor is None:
+        executor = ResilienceExecutor(page, config)
+        _resilience_executor[page] = executor
+    return executor
 
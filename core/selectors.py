@@ -12,6 +12,8 @@ selectors = {
     "fieldset": ".jobs-easy-apply-modal fieldset",
     "select": ".jobs-easy-apply-modal select",
     "submit": ".jobs-easy-apply-modal footer button[aria-label*='Submit']",
+    "next_button": ".jobs-easy-apply-modal footer button[aria-label*='next'], .jobs-easy-apply-modal footer button[aria-label*='Review']",
+    "submit_or_next_button": ".jobs-easy-apply-modal footer button[aria-label*='Submit'], .jobs-easy-apply-modal footer button[aria-label*='next'], .jobs-easy-apply-modal footer button[aria-label*='Review']",
     "enabled_submit_or_next_button": ".jobs-easy-apply-modal footer button[aria-label*='Submit']:enabled, .jobs-easy-apply-modal  footer button[aria-label*='next']:enabled, .jobs-easy-apply-modal  footer button[aria-label*='Review']:enabled",
     "text_input": ".jobs-easy-apply-modal input[type='text'], .jobs-easy-apply-modal textarea",
     "home_city": ".jobs-easy-apply-modal input[id*='easyApplyFormElement'][id*='city-HOME-CITY']",
@@ -66,6 +68,7 @@ selectors = {
 
     # Form elements (common)
     "label_for": "label[for='{id}']",  # Шаблон для label по id (используется динамически)
+    "element_by_id": "[id='{id}']",  # Элемент по id (безопасно для id со спецсимволами)
     "legend": "legend",  # Легенда fieldset
     "select_option": "option",  # Опция в select
 
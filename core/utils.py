@@ -3,10 +3,13 @@ import json
 import hashlib
 import asyncio
 import logging
-from typing import Optional
-from playwright.async_api import Page, ElementHandle
+import weakref
+from typing import Dict, Optional
+from playwright.async_api import Page, ElementHandle, Locator
 from urllib.parse import urljoin
 
+from core.selectors import selectors as default_selectors
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.linkedin.com"
@@ -17,6 +20,36 @@ def construct_full_url(relative_path: str) -> str:
     return urljoin(BASE_URL, relative_path)
 
 
+class SelectorCache:
+    """
+    Caches Playwright locators per page so that each selector is resolved once.
+
+    Locators are lazy and re-evaluated on every action, so reusing one per
+    (page, selector key) is safe across DOM updates and spares repeated
+    selector parsing on hot paths. Entries disappear together with the page.
+    """
+
+    def __init__(self, selectors: Optional[Dict[str, str]] = None):
+        self._selectors = selectors if selectors is not None else default_selectors
+        self._locators: "weakref.WeakKeyDictionary[Page, Dict[str, Locator]]" = weakref.WeakKeyDictionary()
+
+    def get(self, page: Page, selector_key: str) -> Locator:
+        """Returns the cached locator for `selector_key` on `page`, creating it on first use."""
+        page_locators = self._locators.get(page)
+        if page_locators is None:
+            page_locators = {}
+            self._locators[page] = page_locators
+        locator = page_locators.get(selector_key)
+        if locator is None:
+            locator = page.locator(self._selectors[selector_key])
+            page_locators[selector_key] = locator
+        return locator
+
+
+# Shared cache for the selectors defined in core.selectors
+selector_cache = SelectorCache()
+
+
 def ask_user(prompt: str) -> str:
     """
     Asks the user for input and returns the response.
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from typing import Tuple, Optional
@@ -6,7 +7,12 @@ from config import AppConfig
 from llm.exceptions import ResumeReadError, VacancyNotFoundError
 from llm.prompts import VACANCY_MATCH_PROMPT
 from llm.schemas import MatchResult
-from core.database import get_db_connection, get_vacancy_by_id, save_skill_match_data
+from core.database import (
+    Vacancy,
+    get_db_connection,
+    get_vacancy_by_id,
+    save_skill_match_data,
+)
 from llm.resume_utils import read_resume_text
 from llm.client_factory import get_llm_client
 from llm.utils import format_prompt
@@ -68,7 +74,7 @@ def calculate_skill_match(
 
 
 async def is_vacancy_suitable(
-    vacancy_id: int, app_config: AppConfig
+    vacancy_id: int, app_config: AppConfig, vacancy_data: Optional[Vacancy] = None
 ) -> Tuple[bool, Optional[str]]:
     """
     Check if the job is suitable for the candidate using LLM
@@ -76,6 +82,8 @@ async def is_vacancy_suitable(
     Args:
         vacancy_id: Job ID in the database
         app_config: The application configuration object.
+        vacancy_data: The vacancy row if the caller already loaded it; when
+            omitted it is read from the database.
 
     Returns:
         bool: True if the vacancy is suitable, False otherwise
@@ -94,9 +102,10 @@ async def is_vacancy_suitable(
     }
 
     try:
-        logger.debug(f"Getting vacancy data for ID: {vacancy_id}")
-        with get_db_connection(app_config.session.db_file) as conn:
-            vacancy_data = get_vacancy_by_id(vacancy_id, conn)
+        if vacancy_data is None:
+            logger.debug(f"Getting vacancy data for ID: {vacancy_id}")
+            with get_db_connection(app_config.session.db_file) as conn:
+                vacancy_data = get_vacancy_by_id(vacancy_id, conn)
 
         if not vacancy_data:
             raise VacancyNotFoundError(vacancy_id=vacancy_id)
@@ -111,8 +120,10 @@ async def is_vacancy_suitable(
 
         resume_text = read_resume_text(app_config)
 
-        match_percentage, analysis, calc_log_extra = calculate_skill_match(
-            vacancy_id, vacancy_description, resume_text, app_config
+        # The LLM client is blocking; run it off the event loop so browser work
+        # (e.g. the application in progress) keeps running meanwhile.
+        match_percentage, analysis, calc_log_extra = await asyncio.to_thread(
+            calculate_skill_match, vacancy_id, vacancy_description, resume_text, app_config
         )
 
         if isinstance(calc_log_extra, dict):
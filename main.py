@@ -99,7 +99,9 @@ async def main():
     
     db_conn = None
     try:
-        db_conn = setup_database(config.session.db_file)
+        db_conn = setup_database(
+            config.session.db_file, synchronous_off=config.session.db_synchronous_off
+        )
         config.session.db_conn = db_conn  # Set the connection object on the config
 
         applications_today_count = count_todays_applications(db_conn)
@@ -113,7 +115,12 @@ async def main():
             return
 
         os.makedirs(config.session.user_data_dir, exist_ok=True)
-        
+
+        if config.performance.lightweight_playwright_stacks:
+            from core.playwright_patch import install_lightweight_stack_capture
+
+            install_lightweight_stack_capture()
+
         async with async_playwright() as p:
             context = None  # Инициализируем context как None
             logger.info(f"Launching browser with persistent context from: {config.session.user_data_dir}")
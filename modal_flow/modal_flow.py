@@ -5,6 +5,7 @@ This module implements the core logic for parsing modals, applying rules,
 resolving fields, and controlling the flow between multiple modal steps.
 """
 
+import asyncio
 import re
 import logging
 from pathlib import Path
@@ -411,22 +412,35 @@ class ModalFlowRunner:
                 "Skipping fields that are already filled."
             )
         
-        # Attach documents if required before filling other fields
+        # Attach documents in the background: the file transfer (and a lazily
+        # generated cover letter) overlaps with filling the other fields, and
+        # is awaited before the caller moves on to Next/Submit.
+        upload_task: Optional[asyncio.Task] = None
         if self._document_uploader:
             self.logger.info("[MODAL_FILL] Handling document upload")
-            await self._document_uploader.handle_modal(modal)
+            upload_task = asyncio.create_task(
+                self._document_uploader.handle_modal(modal)
+            )
+
+        try:
+            # Process fields in order: radio groups, checkboxes, comboboxes, number inputs, textboxes
+            self.logger.info("[MODAL_FILL] Processing radio groups")
+            await self._handle_radio_groups(modal, is_same_dialog=is_same_dialog)
+            self.logger.info("[MODAL_FILL] Processing checkboxes")
+            await self._handle_checkboxes(modal, is_same_dialog=is_same_dialog)
+            self.logger.info("[MODAL_FILL] Processing comboboxes")
+            await self._handle_comboboxes(modal, is_same_dialog=is_same_dialog)
+            self.logger.info("[MODAL_FILL] Processing number inputs")
+            await self._handle_number_inputs(modal, is_same_dialog=is_same_dialog)
+            self.logger.info("[MODAL_FILL] Processing textboxes")
+            await self._handle_textboxes(modal, is_same_dialog=is_same_dialog)
+        except BaseException:
+            if upload_task:
+                upload_task.cancel()
+            raise
 
-        # Process fields in order: radio groups, checkboxes, comboboxes, number inputs, textboxes
-        self.logger.info("[MODAL_FILL] Processing radio groups")
-        await self._handle_radio_groups(modal, is_same_dialog=is_same_dialog)
-        self.logger.info("[MODAL_FILL] Processing checkboxes")
-        await self._handle_checkboxes(modal, is_same_dialog=is_same_dialog)
-        self.logger.info("[MODAL_FILL] Processing comboboxes")
-        await self._handle_comboboxes(modal, is_same_dialog=is_same_dialog)
-        self.logger.info("[MODAL_FILL] Processing number inputs")
-        await self._handle_number_inputs(modal, is_same_dialog=is_same_dialog)
-        self.logger.info("[MODAL_FILL] Processing textboxes")
-        await self._handle_textboxes(modal, is_same_dialog=is_same_dialog)
+        if upload_task:
+            await upload_task
         self.logger.info("[MODAL_FILL] Finished filling modal fields")
     
     async def _handle_radio_groups(self, modal: Locator, is_same_dialog: bool = False):
@@ -759,11 +773,12 @@ class ModalFlowRunner:
                 except Exception as e:
                     self.logger.debug(f"[SELECT] Could not determine select state: {e}")
 
-            options = []
-            option_locators = await sel.locator(selectors["select_option"]).all()
-            for opt_loc in option_locators:
-                opt_text = await opt_loc.inner_text()
-                options.append(opt_text)
+            # All [value, text] pairs in one call; option.text needs no layout,
+            # unlike a per-option inner_text() round-trip.
+            option_pairs = await sel.evaluate(
+                "(el) => Array.from(el.options).map((o) => [o.value, o.text])"
+            )
+            options = [text for _, text in option_pairs]
 
             decision = await self.rules_engine.decide(
                 question=question, field_type="select", options=options
@@ -776,14 +791,13 @@ class ModalFlowRunner:
                 )
                 found_option_value = None
 
-                for opt_loc in option_locators:
-                    current_option_text = await opt_loc.inner_text()
+                for option_value, current_option_text in option_pairs:
                     normalized_current_option = self.normalizer.normalize_string(
                         current_option_text
                     )
 
                     if normalized_current_option == normalized_target_option:
-                        found_option_value = await opt_loc.get_attribute("value")
+                        found_option_value = option_value
                         break
 
                 if found_option_value is not None:
@@ -1417,39 +1431,27 @@ class ModalFlowRunner:
         Returns:
             Label text
         """
-        # Try aria-label
-        aria = await element.get_attribute("aria-label")
-        if aria and aria.strip():
-            return aria.strip()
-        
-        # Try aria-labelledby
-        labelledby = await element.get_attribute("aria-labelledby")
-        if labelledby:
-            text = await element.evaluate(
-                """(el) => {
-                    const id = el.getAttribute('aria-labelledby');
-                    if (!id) return '';
-                    return id.split(' ')
+        # aria-label, aria-labelledby and label[for] are resolved in one
+        # evaluate, in that order, instead of a round-trip per strategy
+        direct_text = await element.evaluate(
+            """(el) => {
+                const aria = (el.getAttribute('aria-label') || '').trim();
+                if (aria) return aria;
+                const labelledby = el.getAttribute('aria-labelledby');
+                if (labelledby) {
+                    const text = labelledby.split(' ')
                         .map(id => el.ownerDocument.getElementById(id))
                         .filter(Boolean)
                         .map(n => n.innerText)
                         .join(' ').trim();
-                }"""
-            )
-            if text and text.strip():
-                return text.strip()
-        
-        # Try label[for] association
-        lab_text = await element.evaluate(
-            """(el) => {
-                const id = el.id;
-                if (!id) return '';
-                const lbl = el.ownerDocument.querySelector(`label[for="${id}"]`);
-                return lbl ? lbl.innerText : '';
+                    if (text) return text;
+                }
+                // `labels` is kept by the browser, no label[for] scan needed
+                return el.labels && el.labels[0] ? el.labels[0].innerText : '';
             }"""
         )
-        if lab_text and lab_text.strip():
-            return lab_text.strip()
+        if direct_text and direct_text.strip():
+            return direct_text.strip()
 
         # Try parent fieldset legend
         legend_text = await element.evaluate(
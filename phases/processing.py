@@ -5,11 +5,18 @@ import asyncio
 import inspect
 from pathlib import Path
 
-from typing import Optional, List, Sequence, Tuple
+from typing import Awaitable, Optional, List, Sequence, Tuple
 from config import config, AppConfig
 from diagnostics import DiagnosticOptions, DiagnosticContext, capture_on_failure
 from actions.apply import apply_to_job
-from core.database import get_enriched_jobs, get_error_jobs, update_job_status
+from core.database import (
+    Vacancy,
+    get_enriched_jobs,
+    get_error_jobs,
+    get_vacancies_by_ids,
+    update_job_status,
+    update_job_statuses,
+)
 from core.selectors import selectors
 from llm.vacancy_filter import is_vacancy_suitable
 from core.utils import construct_full_url
@@ -43,12 +50,19 @@ def _limit_jobs(jobs: Sequence[Tuple[int, str, str, str]], app_config: AppConfig
 
 
 async def _is_job_suitable(
-    job_id: int, title: str, description: str | None, app_config: AppConfig
+    job_id: int,
+    title: str,
+    description: str | None,
+    app_config: AppConfig,
+    vacancy: Optional[Vacancy] = None,
 ) -> bool:
-    """Determines if a job is suitable based on title, description, and language filters."""
+    """Determines if a job is suitable based on title, description, and language filters.
+
+    `vacancy` is the job's full database row when the caller already has it.
+    """
     # LLM-based filtering (primary)
     try:
-        suitable, reason = await is_vacancy_suitable(job_id, app_config)
+        suitable, reason = await is_vacancy_suitable(job_id, app_config, vacancy)
         if suitable:
             logger.debug("LLM filter result for '%s': True", title)
             return True
@@ -81,14 +95,32 @@ async def _is_job_suitable(
             return False
 
 
+def _start_suitability_check(
+    job_data: tuple, app_config: AppConfig, vacancy: Optional[Vacancy] = None
+) -> asyncio.Task:
+    """Starts the (LLM-backed) suitability check for a job in the background."""
+    job_id, _, title, _, description = job_data
+    return asyncio.create_task(
+        _is_job_suitable(job_id, title, description, app_config, vacancy)
+    )
+
+
 async def _process_single_job(
     context: BrowserContext,
     job_data: tuple,
     app_config: AppConfig,
     should_submit: bool,
     coordinator: FormFillCoordinator,
+    suitability: Optional[Awaitable[bool]] = None,
+    pending_statuses: Optional[List[Tuple[int, str]]] = None,
 ) -> bool:
-    """Processes a single job application."""
+    """Processes a single job application.
+
+    `suitability` is an already started suitability check for this job (see
+    `_start_suitability_check`); when omitted the check runs inline.
+    A filter skip is appended to `pending_statuses` when given, for the caller
+    to write in one batch, instead of being committed immediately.
+    """
     logger.debug(f"Call to function '{__name__}' started.{inspect.stack()[0][3]}")
     job_id, link, title, _, description = job_data
     full_url = construct_full_url(link)
@@ -99,9 +131,15 @@ async def _process_single_job(
         else None
     )
 
-    is_suitable = await _is_job_suitable(job_id, title, description, app_config)
+    if suitability is not None:
+        is_suitable = await suitability
+    else:
+        is_suitable = await _is_job_suitable(job_id, title, description, app_config)
     if not is_suitable:
-        update_job_status(job_id, "skipped_filter", app_config.session.db_conn)
+        if pending_statuses is not None:
+            pending_statuses.append((job_id, "skipped_filter"))
+        else:
+            update_job_status(job_id, "skipped_filter", app_config.session.db_conn)
         logger.info(f"Skipping job '{title}' as it does not match the filter criteria.")
         return False
 
@@ -374,49 +412,69 @@ async def _process_single_job(
             await page.close()
 
 
-async def run_processing_phase(
+async def _process_jobs(
     context: BrowserContext,
+    jobs: List[tuple],
+    progress_label: str,
     applications_today_count: int,
     should_submit: bool,
     app_config: AppConfig,
-) -> None:
-    """Runs the processing phase of the bot."""
-    logger.info("--- Starting Processing Phase ---")
+    coordinator: FormFillCoordinator,
+) -> int:
+    """Applies to `jobs` one at a time and returns the updated application count.
+
+    Applications stay strictly sequential and throttled, but the suitability
+    check of the next job (an LLM round-trip) runs while the current job is
+    being applied to and during the wait between submissions.
+
+    Filter skips touch no external state, so they are collected and written in
+    a single commit at the end. Every other status is committed as soon as it
+    is known, so an interrupted run never forgets a submitted application.
+    """
     max_applications = app_config.general_settings.max_applications_per_day
-    
-    # Prepare form filling coordinator (modal flow only)
-    modal_flow_resources = ModalFlowResources(
-        modal_flow_config=app_config.modal_flow,
-        llm_config=app_config.llm,
-        logger=logger,
+    pending_statuses: List[Tuple[int, str]] = []
+    # Full rows for every job in one query, rather than one lookup per check
+    vacancies = get_vacancies_by_ids(
+        [job_data[0] for job_data in jobs], app_config.session.db_conn
     )
-    form_fill_coordinator = FormFillCoordinator(
-        app_config=app_config,
-        resources=modal_flow_resources,
-        logger=logger,
+    next_suitability = (
+        _start_suitability_check(jobs[0], app_config, vacancies.get(jobs[0][0]))
+        if jobs and applications_today_count < max_applications
+        else None
     )
-    
-    # First, process enriched jobs
-    enriched_jobs = get_enriched_jobs(app_config.session.db_conn)
-    if enriched_jobs:
-        logger.info(f"Found {len(enriched_jobs)} enriched jobs to process.")
-        limited_enriched_jobs = _limit_jobs(enriched_jobs, app_config)
-        for job_data in limited_enriched_jobs:
+    try:
+        for index, job_data in enumerate(jobs):
             job_id, _, title, _, _ = job_data
+            suitability = next_suitability
+            next_suitability = None
             logger.info(
-                f"Processing enriched job {limited_enriched_jobs.index(job_data) + 1}/{len(limited_enriched_jobs)}: {title} (ID: {job_id})"
+                f"{progress_label} {index + 1}/{len(jobs)}: {title} (ID: {job_id})"
             )
 
             if applications_today_count >= max_applications:
                 logger.warning(f"Daily application limit of {max_applications} reached.")
+                if suitability is not None:
+                    suitability.cancel()
                 break
 
+            # Prefetch only when the next job can still be applied to. If this
+            # application may reach the limit, the next check would be thrown
+            # away; cancelling it does not stop its LLM call in the worker
+            # thread. Such a job is checked inline if it is reached after all.
+            if index + 1 < len(jobs) and applications_today_count + 1 < max_applications:
+                next_job = jobs[index + 1]
+                next_suitability = _start_suitability_check(
+                    next_job, app_config, vacancies.get(next_job[0])
+                )
+
             if await _process_single_job(
                 context,
                 job_data,
                 app_config,
                 should_submit,
-                form_fill_coordinator,
+                coordinator,
+                suitability=suitability,
+                pending_statuses=pending_statuses,
             ):
                 applications_today_count += 1
                 if applications_today_count >= max_applications:
@@ -424,47 +482,89 @@ async def run_processing_phase(
                         f"Daily application limit of {max_applications} reached after this application."
                     )
                     break
-            
+
             await wait(app_config.general_settings.wait_between_submissions_ms)
+    finally:
+        # Do not leave a prefetched check running once we stop applying
+        if next_suitability is not None:
+            next_suitability.cancel()
+        update_job_statuses(pending_statuses, app_config.session.db_conn)
+
+    return applications_today_count
+
+
+async def _warm_up_resources(resources: ModalFlowResources) -> None:
+    """Loads the modal flow resources in a worker thread, logging any failure.
+
+    A failure is not fatal here: the resource is loaded again, and the error
+    raised, when the form filler first needs it.
+    """
+    try:
+        await asyncio.to_thread(resources.warmup)
+    except Exception as e:
+        logger.warning(f"Failed to preload modal flow resources: {e}")
+
+
+async def run_processing_phase(
+    context: BrowserContext,
+    applications_today_count: int,
+    should_submit: bool,
+    app_config: AppConfig,
+) -> None:
+    """Runs the processing phase of the bot."""
+    logger.info("--- Starting Processing Phase ---")
+    max_applications = app_config.general_settings.max_applications_per_day
+    
+    # Prepare form filling coordinator (modal flow only)
+    modal_flow_resources = ModalFlowResources(
+        modal_flow_config=app_config.modal_flow,
+        llm_config=app_config.llm,
+        logger=logger,
+    )
+    form_fill_coordinator = FormFillCoordinator(
+        app_config=app_config,
+        resources=modal_flow_resources,
+        logger=logger,
+    )
+    # Load profile, rules and LLM client while the first job page is opening
+    warmup_task = asyncio.create_task(_warm_up_resources(modal_flow_resources))
+
+    # First, process enriched jobs
+    enriched_jobs = get_enriched_jobs(app_config.session.db_conn)
+    if enriched_jobs:
+        logger.info(f"Found {len(enriched_jobs)} enriched jobs to process.")
+        applications_today_count = await _process_jobs(
+            context,
+            _limit_jobs(enriched_jobs, app_config),
+            "Processing enriched job",
+            applications_today_count,
+            should_submit,
+            app_config,
+            form_fill_coordinator,
+        )
     else:
         logger.info("No enriched jobs to process.")
-    
+
     # Second, retry jobs with error status if we haven't reached the daily limit
     if applications_today_count < max_applications:
         error_jobs = get_error_jobs(app_config.session.db_conn)
         if error_jobs:
             logger.info(f"Found {len(error_jobs)} jobs with error status to retry.")
-            limited_error_jobs = _limit_jobs(error_jobs, app_config)
-            for job_data in limited_error_jobs:
-                job_id, _, title, _, _ = job_data
-                logger.info(
-                    f"Retrying error job {limited_error_jobs.index(job_data) + 1}/{len(limited_error_jobs)}: {title} (ID: {job_id})"
-                )
-
-                if applications_today_count >= max_applications:
-                    logger.warning(f"Daily application limit of {max_applications} reached.")
-                    break
-
-                if await _process_single_job(
-                    context,
-                    job_data,
-                    app_config,
-                    should_submit,
-                    form_fill_coordinator,
-                ):
-                    applications_today_count += 1
-                    if applications_today_count >= max_applications:
-                        logger.info(
-                            f"Daily application limit of {max_applications} reached after this application."
-                        )
-                        break
-                
-                await wait(app_config.general_settings.wait_between_submissions_ms)
+            applications_today_count = await _process_jobs(
+                context,
+                _limit_jobs(error_jobs, app_config),
+                "Retrying error job",
+                applications_today_count,
+                should_submit,
+                app_config,
+                form_fill_coordinator,
+            )
         else:
             logger.info("No error jobs to retry.")
     else:
         logger.info("Daily application limit reached. Skipping error job retry.")
 
+    await warmup_task
     logger.info("--- Finished Processing Phase ---")
     await context.close()
 
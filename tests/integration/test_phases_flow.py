@@ -115,5 +115,5 @@ class TestPhasesFlow:
         mock_apply.assert_awaited_once()
 
         # Verify the final state in the database
-        final_status = database.get_vacancy_by_id(123, db_conn)["status"]
+        final_status = database.get_vacancy_by_id(123, db_conn).status
         assert final_status == "applied"
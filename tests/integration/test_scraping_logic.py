@@ -19,14 +19,16 @@ class TestScrapingLogic:
         await page.set_content(html_content)
         scraped_data = await _extract_job_data_from_page(page)
         assert len(scraped_data) == 2
-        assert scraped_data[0][0] == 1234567890
-        assert scraped_data[0][1] == "/jobs/view/1234567890"
-        assert scraped_data[0][2] == "Software Engineer"
-        assert scraped_data[0][3] == "Tech Innovations Inc."
-        assert scraped_data[1][0] == 987654321
-        assert scraped_data[1][1] == "/jobs/view/0987654321"
-        assert scraped_data[1][2] == "Backend Developer"
-        assert scraped_data[1][3] == "Data Systems LLC"
+        assert scraped_data[1234567890] == {
+            "link": "/jobs/view/1234567890",
+            "title": "Software Engineer",
+            "company": "Tech Innovations Inc.",
+        }
+        assert scraped_data[987654321] == {
+            "link": "/jobs/view/0987654321",
+            "title": "Backend Developer",
+            "company": "Data Systems LLC",
+        }
 
     @pytest.mark.asyncio
     async def test_fetch_job_details(self, page: Page):
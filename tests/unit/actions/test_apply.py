@@ -90,6 +90,33 @@ class TestClickEasyApplyButton:
         mock_executor_instance.execute_operation.side_effect = None  # cleanup for other tests
 
 
+    @pytest.mark.asyncio
+    async def test_click_easy_apply_button_clicks_without_separate_wait(self):
+        """The selected button is clicked directly; the click does its own waiting."""
+        page = AsyncMock()
+        mock_locator = AsyncMock()
+        mock_locator.or_ = MagicMock(return_value=mock_locator)
+        mock_locator.count = AsyncMock(return_value=1)
+        mock_locator.last = AsyncMock()
+        mock_locator.last.text_content = AsyncMock(return_value="Easy Apply")
+        page.locator = MagicMock(return_value=mock_locator)
+        page.get_by_role = MagicMock(return_value=mock_locator)
+
+        async def run_operation(selector_name, operation, context=None):
+            return await operation()
+
+        mock_executor_instance.execute_operation.side_effect = run_operation
+        try:
+            with patch("actions.apply.asyncio.sleep", new_callable=AsyncMock):
+                await click_easy_apply_button(page)
+        finally:
+            mock_executor_instance.execute_operation.side_effect = None
+
+        mock_locator.last.wait_for.assert_not_called()
+        mock_locator.last.click.assert_awaited_once()
+        assert "timeout" in mock_locator.last.click.await_args.kwargs
+
+
 class TestApplyToJob:
     def _build_job_context(self, should_submit: bool) -> JobApplicationContext:
         return JobApplicationContext(
@@ -16,6 +16,9 @@ from actions.fetch_jobs import (
     _scrape_job_page_details,
     _scrape_company_about_page,
     fetch_job_details,
+    _page_url_prefix,
+    _ensure_all_jobs_are_loaded,
+    CARD_RENDER_TIMEOUT_MS,
 )
 
 from pytest_mock import MockerFixture
@@ -136,30 +139,34 @@ class TestScrapePageForLinks:
         mock_listing4 = AsyncMock()
         mock_listing4.get_attribute.return_value = "" # Empty job id
 
-        mock_page.query_selector_all.return_value = [mock_listing1, mock_listing2, mock_listing3, mock_listing4]
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.element_handles = AsyncMock(
+            return_value=[mock_listing1, mock_listing2, mock_listing3, mock_listing4]
+        )
 
         result = await _extract_job_data_from_page(mock_page)
 
         # Assert correct selector was used
-        mock_page.query_selector_all.assert_called_once_with(".scaffold-layout__list-item")
+        mock_page.locator.assert_called_once_with(".scaffold-layout__list-item")
         
         # Assertions
         assert len(result) == 2
         # Check that link is cleaned and text is stripped
-        assert result[0] == (123, "/jobs/view/123", "Software Engineer", "Company A")
-        assert result[1] == (456, "/jobs/view/456", "Data Scientist", "Company B")
+        assert result[123] == {"link": "/jobs/view/123", "title": "Software Engineer", "company": "Company A"}
+        assert result[456] == {"link": "/jobs/view/456", "title": "Data Scientist", "company": "Company B"}
 
     @pytest.mark.asyncio
     async def test_scrape_page_for_links_no_listings(self):
         """Test handling when no job listings are found on the page."""
         mock_page = AsyncMock()
-        mock_page.query_selector_all.return_value = []
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.element_handles = AsyncMock(return_value=[])
 
         result = await _extract_job_data_from_page(mock_page)
 
         # Should try the main selector once
-        assert mock_page.query_selector_all.call_count == 1
-        assert result == []
+        assert mock_page.locator.return_value.element_handles.call_count == 1
+        assert result == {}
 
 
 class TestFetchJobLinksUser:
@@ -199,22 +206,24 @@ class TestFetchJobLinksUser:
         # Mock page and browser context
         mock_page = AsyncMock()
         mock_page.wait_for_selector.return_value = AsyncMock()
-        # Simulate 'Next' button being visible on the first page, but not the second
-        mock_page.is_visible.side_effect = [True, False]
+        mock_worker_page = AsyncMock()
+        mock_page.context.new_page.return_value = mock_worker_page
     
-        # Set a return value for the mocked function
-        mock_get_total_job_count.return_value = 10
+        # Set a return value for the mocked function (two result pages)
+        mock_get_total_job_count.return_value = 30
         mock_fetch_job_links_limit.return_value = None
         mock_extract_job_data_from_page.side_effect = [
-            [
-                (1, "link1", "Software Engineer", "Company A"),
-                (2, "link2", "Data Scientist", "Company B"),
-                (3, "link3", "Senior Software Engineer", "Company C"),
-            ],
-            [
-                (4, "link4", "DevOps Engineer", "Company D"),
-            ],
-]
+            {
+                1: {"link": "link1", "title": "Software Engineer", "company": "Company A"},
+                2: {"link": "link2", "title": "Data Scientist", "company": "Company B"},
+                3: {"link": "link3", "title": "Senior Software Engineer", "company": "Company C"},
+            },
+            {
+                # Job 1 shows up again on the next page and must not be duplicated
+                1: {"link": "link1", "title": "Software Engineer", "company": "Company A"},
+                4: {"link": "link4", "title": "DevOps Engineer", "company": "Company D"},
+            },
+        ]
     
         keywords = "software engineer"
         workplace = config.workplace
@@ -229,6 +238,11 @@ class TestFetchJobLinksUser:
 
         mock_get_total_job_count.assert_called_once()
         assert mock_extract_job_data_from_page.call_count == 2  # 2 pages
+        # The second page is fetched on a worker page addressed by its offset
+        mock_page.context.new_page.assert_called_once()
+        mock_extract_job_data_from_page.assert_any_call(mock_worker_page)
+        assert mock_executor_instance.navigate.call_args_list[-1].args[0].endswith("start=25")
+        mock_worker_page.close.assert_called_once()
         # The scroll function should be called for each page
         # assert mock_ensure_all_jobs_loaded.call_count == 2
         
@@ -264,6 +278,70 @@ class TestFetchJobLinksUser:
         mock_executor_instance.navigate.assert_called_once()
 
 
+class TestEnsureAllJobsAreLoaded:
+
+    @pytest.mark.asyncio
+    async def test_show_more_waits_for_new_items_instead_of_sleeping(self):
+        """Test that clicking 'Show more' waits on the DOM, not on a fixed timeout."""
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.first.is_visible = AsyncMock(return_value=True)
+        mock_page.locator.return_value.first.evaluate = AsyncMock()
+        mock_page.query_selector_all.return_value = [AsyncMock(), AsyncMock()]
+        mock_page.is_visible.return_value = True
+
+        await _ensure_all_jobs_are_loaded(mock_page)
+
+        mock_page.click.assert_called_once_with(selectors["show_more_button"])
+        mock_page.wait_for_function.assert_called_once()
+        assert mock_page.wait_for_function.call_args.kwargs["arg"] == [
+            selectors["job_card_container_in_list"],
+            2,
+        ]
+        mock_page.wait_for_timeout.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scrolled_items_wait_for_their_card_not_a_fixed_pause(self):
+        """Test that each scrolled item waits for its card to render instead of sleeping."""
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.first.is_visible = AsyncMock(return_value=False)
+        rendered, promo = AsyncMock(), AsyncMock()
+        promo.wait_for_selector.side_effect = PlaywrightTimeoutError("no card")
+        mock_page.query_selector_all.return_value = [rendered, promo]
+        mock_page.is_visible.return_value = False
+
+        await _ensure_all_jobs_are_loaded(mock_page)
+
+        for item in (rendered, promo):
+            item.scroll_into_view_if_needed.assert_awaited_once()
+            item.wait_for_selector.assert_awaited_once_with(
+                selectors["job_card_container"],
+                state="attached",
+                timeout=CARD_RENDER_TIMEOUT_MS,
+            )
+        mock_page.wait_for_timeout.assert_not_called()
+
+
+class TestPageUrlPrefix:
+
+    def test_page_url_prefix_drops_start(self):
+        """Test that the start offset is stripped so it is not duplicated."""
+        url = "https://www.linkedin.com/jobs/search/?keywords=python&start=0"
+
+        assert f"{_page_url_prefix(url)}start=50" == (
+            "https://www.linkedin.com/jobs/search/?keywords=python&start=50"
+        )
+
+    def test_page_url_prefix_without_query(self):
+        """Test that custom collection URLs without a query get a start offset."""
+        url = "https://www.linkedin.com/jobs/collections/top-applicant/"
+
+        assert f"{_page_url_prefix(url)}start=25" == (
+            "https://www.linkedin.com/jobs/collections/top-applicant/?start=25"
+        )
+
+
 class TestScrapeJobPageDetails:
 
     @pytest.mark.asyncio
@@ -277,40 +355,59 @@ class TestScrapeJobPageDetails:
         mock_company_desc_locator = AsyncMock()
         mock_company_desc_locator.wait_for = AsyncMock()
 
+        mock_employment_type_locator = MagicMock()
+        mock_employment_type_locator.all_inner_texts = AsyncMock(
+            return_value=["Hybrid", "Full-time"]
+        )
+
         def locator_side_effect(selector):
             mock_locator_obj = MagicMock()
             if selector == selectors["job_description"]:
                 mock_locator_obj.first = mock_desc_locator
             elif selector == selectors["company_description"]:
                 mock_locator_obj.first = mock_company_desc_locator
+            elif selector == selectors["employment_type_details"]:
+                return mock_employment_type_locator
             else:
                 mock_locator_obj.first = AsyncMock()
             return mock_locator_obj
 
         mock_page.locator = MagicMock(side_effect=locator_side_effect)
 
-        # Mock extract_text_with_retry to return description texts
+        # Sections are read concurrently, so key the texts by label
+        texts = {
+            "Job description": "Job description here",
+            "Company description": "Company description here",
+        }
         mock_executor_instance.extract_text_with_retry = AsyncMock(
-            side_effect=["Job description here", "Company description here"]
+            side_effect=lambda locator, label: texts[label]
         )
 
-        # Mock employment type elements
-        mock_employment_type2 = AsyncMock()
-        mock_employment_type2.inner_text.return_value = "Hybrid"
-        
-        mock_employment_type1 = AsyncMock()
-        mock_employment_type1.inner_text.return_value = "Full-time"
-        
-        mock_page.query_selector_all.return_value = [
-            mock_employment_type2,
-            mock_employment_type1,
-        ]
-
         result = await _scrape_job_page_details(mock_page, "/job/123")
 
         assert result["description"] == "Job description here"
         assert result["company_description"] == "Company description here"
         assert result["employment_type"] == "Hybrid, Full-time"
+        mock_page.query_selector_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scrape_job_page_details_description_timeout_raises(self):
+        """Test that a missing description text still fails the job page scrape."""
+        mock_page = AsyncMock()
+        mock_locator_obj = MagicMock()
+        mock_locator_obj.first = AsyncMock()
+        mock_locator_obj.all_inner_texts = AsyncMock(return_value=[])
+        mock_page.locator = MagicMock(return_value=mock_locator_obj)
+
+        async def extract_text(locator, label):
+            if label == "Job description":
+                raise TimeoutError("empty description")
+            return "Company description here"
+
+        mock_executor_instance.extract_text_with_retry = AsyncMock(side_effect=extract_text)
+
+        with pytest.raises(TimeoutError):
+            await _scrape_job_page_details(mock_page, "/job/123")
 
 
 class TestScrapeCompanyAboutPage:
@@ -329,12 +426,13 @@ class TestScrapeCompanyAboutPage:
         mock_details_list_locator = AsyncMock()
         mock_details_list_locator.wait_for = AsyncMock()
         mock_details_list_locator.scroll_into_view_if_needed = AsyncMock()
-        # evaluate returns list of [term, definition] pairs
-        mock_details_list_locator.evaluate = AsyncMock(return_value=[
-            ["website", "https://company.com"],
-            ["industry", "Technology"],
-            ["company size", "1001-5000 employees"],
-        ])
+        # evaluate returns a {term: definition} mapping
+        mock_details_list_locator.evaluate = AsyncMock(return_value={
+            "website": "https://company.com",
+            "industry": "Technology",
+            "company size": "1001-5000 employees",
+            "founded": "Founded in 2015",
+        })
         
         # Setup locator side effect for overview and details list
         def locator_side_effect(selector):
@@ -350,12 +448,17 @@ class TestScrapeCompanyAboutPage:
         # Mock extract_text_with_retry to return overview text
         mock_executor_instance.extract_text_with_retry.return_value = "Company overview here"
 
-        result = await _scrape_company_about_page(mock_page, company_name)
+        with patch("actions.fetch_jobs.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await _scrape_company_about_page(mock_page, company_name)
 
         assert result["company_overview"] == "Company overview here"
         assert result["company_website"] == "https://company.com"
         assert result["company_industry"] == "Technology"
         assert result["company_size"] == "1001-5000 employees"
+        assert result["company_founded"] == 2015
+        # A populated list is read in one evaluate without waiting first
+        mock_details_list_locator.evaluate.assert_called_once()
+        mock_sleep.assert_not_called()
 
 
 class TestFetchJobDetails:
@@ -105,6 +105,8 @@ class TestLogin:
         # Should fill in credentials
         mock_executor_instance.fill.assert_any_call("email_input", "test@example.com", css_selector=ANY)
         mock_executor_instance.fill.assert_any_call("password_input", "password123", css_selector=ANY)
+        # fill() waits for the inputs itself; no separate wait round-trips
+        mock_executor_instance.wait_for_selector.assert_not_called()
         # Should click submit
         assert mock_executor_instance.click.call_count >= 1
         # Should not call ask_user since no captcha is detected
@@ -23,8 +23,36 @@ class TestChangeTextInput:
         await change_text_input(mock_container, "input#test", "new_value")
 
         mock_container.query_selector.assert_called_once_with("input#test")
+        mock_element.fill.assert_called_once_with("new_value")
+        mock_element.click.assert_not_called()
+        mock_element.type.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_change_text_input_with_keyboard(self):
+        """Test that use_keyboard selects the text and types the value."""
+        mock_container = AsyncMock()
+        mock_element = AsyncMock()
+        mock_container.query_selector.return_value = mock_element
+        mock_element.input_value.return_value = "old_value"
+
+        await change_text_input(mock_container, "input#test", "new_value", use_keyboard=True)
+
         mock_element.click.assert_called_once_with(click_count=3)
         mock_element.type.assert_called_once_with("new_value")
+        mock_element.fill.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_change_text_input_trailing_whitespace_only(self):
+        """Test that a value differing only in trailing whitespace is left as is."""
+        mock_container = AsyncMock()
+        mock_element = AsyncMock()
+        mock_container.query_selector.return_value = mock_element
+        mock_element.input_value.return_value = "same_value  "
+
+        await change_text_input(mock_container, "input#test", "same_value")
+
+        mock_element.fill.assert_not_called()
+        mock_element.click.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_change_text_input_without_selector(self):
@@ -32,13 +60,11 @@ class TestChangeTextInput:
         # Create a proper ElementHandle mock
         mock_element = MagicMock(spec=ElementHandle)
         mock_element.input_value = AsyncMock(return_value="old_value")
-        mock_element.click = AsyncMock()
-        mock_element.type = AsyncMock()
+        mock_element.fill = AsyncMock()
 
         await change_text_input(mock_element, "", "new_value")
 
-        mock_element.click.assert_called_once_with(click_count=3)
-        mock_element.type.assert_called_once_with("new_value")
+        mock_element.fill.assert_called_once_with("new_value")
 
     @pytest.mark.asyncio
     async def test_change_text_input_value_different(self):
@@ -51,7 +77,8 @@ class TestChangeTextInput:
         await change_text_input(mock_container, "input#test", "same_value")
 
         mock_container.query_selector.assert_called_once_with("input#test")
-        # Should not click or type since values are the same
+        # Should not fill, click or type since values are the same
+        mock_element.fill.assert_not_called()
         mock_element.click.assert_not_called()
         mock_element.type.assert_not_called()
 
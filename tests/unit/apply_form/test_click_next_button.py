@@ -5,7 +5,12 @@ Unit tests for the click_next_button module.
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from apply_form.click_next_button import click_next_button
+from apply_form.click_next_button import (
+    BUTTON_ENABLED_PREDICATE,
+    BUTTON_ENABLED_TIMEOUT_MS,
+    click_next_button,
+)
+from core.selectors import selectors
 
 
 @pytest.mark.asyncio
@@ -34,7 +39,7 @@ class TestClickNextButton:
                     selector_name="next_button",
                     context={"job_id": "12345", "job_title": "Software Engineer"}
                 )
-                mock_executor.wait_for_selector.assert_called_once()
+                mock_executor.execute_operation.assert_called_once()
                 
                 # Verify logger was used
                 assert mock_logger.debug.call_count == 2
@@ -57,4 +62,23 @@ class TestClickNextButton:
                     selector_name="next_button",
                     context={}  # Empty context
                 )
-                mock_executor.wait_for_selector.assert_called_once()
+                mock_executor.execute_operation.assert_called_once()
+
+    async def test_click_next_button_waits_for_enabled_predicate(self):
+        """Test that the post-click wait polls the DOM enablement predicate."""
+        mock_page = AsyncMock()
+        mock_executor = AsyncMock()
+
+        with patch("apply_form.click_next_button.get_structured_logger", return_value=MagicMock()):
+            with patch("apply_form.click_next_button.get_resilience_executor", return_value=mock_executor):
+                await click_next_button(page=mock_page)
+
+                operation = mock_executor.execute_operation.call_args.kwargs["operation"]
+                await operation()
+
+                mock_page.wait_for_function.assert_called_once_with(
+                    BUTTON_ENABLED_PREDICATE,
+                    arg=selectors["submit_or_next_button"],
+                    timeout=BUTTON_ENABLED_TIMEOUT_MS,
+                )
+                mock_page.wait_for_timeout.assert_not_called()
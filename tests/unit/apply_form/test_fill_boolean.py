@@ -1,9 +1,13 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import sys
 import os
 
 from apply_form.fill_boolean import (
+    ELEMENT_LABEL_TEXT_SCRIPT,
+    RADIO_FIELDSET_INDEX_ATTRIBUTE,
+    SELECT_OPTION_PAIRS_SCRIPT,
+    TWO_OPTION_RADIO_FIELDSETS_SCRIPT,
     fill_boolean,
     _process_single_radio_fieldset,
     _fill_radio_buttons,
@@ -20,80 +24,36 @@ sys.path.insert(
 class TestProcessSingleRadioFieldset:
 
     @pytest.mark.asyncio
-    async def test_process_single_radio_fieldset_two_options_match(self):
-        """Test processing a radio fieldset with two options that match the pattern."""
-        mock_fieldset = AsyncMock()
-        mock_radio1 = AsyncMock()
-        mock_radio2 = AsyncMock()
-        mock_fieldset.query_selector_all.return_value = [mock_radio1, mock_radio2]
-
-        mock_legend = AsyncMock()
-        mock_legend.inner_text.return_value = "Do you require sponsorship?"
-
-        def query_selector_side_effect(selector):
-            if selector == "legend":
-                return mock_legend
-            elif selector == f"{selectors['radio_input']}[value='Yes']":
-                return mock_radio1
-            return None
-
-        mock_fieldset.query_selector.side_effect = query_selector_side_effect
-
-        mock_radio1.get_attribute.return_value = "Yes"
-        mock_radio2.get_attribute.return_value = "No"
+    async def test_process_single_radio_fieldset_match(self):
+        """Test clicking the matching option of a 2-option radio fieldset."""
+        mock_page = AsyncMock()
+        mock_radio = make_locator()
+        mock_page.locator = MagicMock(return_value=MagicMock(first=mock_radio))
 
+        candidate = {"idx": 3, "text": "Do you require sponsorship?"}
         booleans = {"sponsorship": True}
 
-        await _process_single_radio_fieldset(mock_fieldset, booleans)
+        await _process_single_radio_fieldset(mock_page, candidate, booleans)
 
-        mock_fieldset.query_selector_all.assert_called_once()
-        assert mock_fieldset.query_selector.call_count == 2
-        mock_fieldset.query_selector.assert_any_call("legend")
-        mock_fieldset.query_selector.assert_any_call(
+        mock_page.locator.assert_called_once_with(
+            f"fieldset[{RADIO_FIELDSET_INDEX_ATTRIBUTE}='3'] "
             f"{selectors['radio_input']}[value='Yes']"
         )
-        mock_radio1.click.assert_called_once()
-        mock_radio2.click.assert_not_called()
+        mock_radio.click.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_process_single_radio_fieldset_not_two_options(self):
-        """Test processing a radio fieldset that doesn't have exactly two options."""
-        mock_fieldset = AsyncMock()
-        mock_radio1 = AsyncMock()
-        mock_radio2 = AsyncMock()
-        mock_radio3 = AsyncMock()
-        mock_fieldset.query_selector_all.return_value = [
-            mock_radio1,
-            mock_radio2,
-            mock_radio3,
-        ]
+    async def test_process_single_radio_fieldset_no_match(self):
+        """Test that a fieldset whose legend matches no pattern is left alone."""
+        mock_page = AsyncMock()
 
+        candidate = {"idx": 0, "text": "Years of experience?"}
         booleans = {"sponsorship": True}
 
-        await _process_single_radio_fieldset(mock_fieldset, booleans)
+        mock_page.locator = MagicMock()
 
-        mock_fieldset.query_selector_all.assert_called_once()
-        # Should return early since not exactly 2 options
-        mock_fieldset.query_selector.assert_not_called()
+        await _process_single_radio_fieldset(mock_page, candidate, booleans)
 
-    @pytest.mark.asyncio
-    async def test_process_single_radio_fieldset_no_legend(self):
-        """Test processing a radio fieldset with no legend."""
-        mock_fieldset = AsyncMock()
-        mock_radio1 = AsyncMock()
-        mock_radio2 = AsyncMock()
-        mock_fieldset.query_selector_all.return_value = [mock_radio1, mock_radio2]
-
-        mock_fieldset.query_selector.return_value = None  # No legend
-
-        booleans = {"sponsorship": True}
-
-        await _process_single_radio_fieldset(mock_fieldset, booleans)
-
-        mock_fieldset.query_selector_all.assert_called_once()
-        mock_fieldset.query_selector.assert_called_once_with("legend")
-        # Should return early since no legend
-        mock_radio1.get_attribute.assert_not_called()
+        mock_page.locator.assert_not_called()
 
 
 class TestFillRadioButtons:
@@ -105,19 +65,45 @@ class TestFillRadioButtons:
     async def test_fill_radio_buttons_multiple_fieldsets(
         self, mock_process_single_radio_fieldset
     ):
-        """Test filling radio buttons across multiple fieldsets."""
+        """Test that candidates are filtered in one evaluate call and processed."""
         mock_page = AsyncMock()
-        mock_fieldset1 = AsyncMock()
-        mock_fieldset2 = AsyncMock()
-        mock_page.query_selector_all.return_value = [mock_fieldset1, mock_fieldset2]
+        candidate1 = {"idx": 0, "text": "Sponsorship?"}
+        candidate2 = {"idx": 2, "text": "Relocate?"}
+        mock_page.evaluate.return_value = [candidate1, candidate2]
 
         booleans = {"sponsorship": True}
         await _fill_radio_buttons(mock_page, booleans)
 
-        mock_page.query_selector_all.assert_called_once_with(selectors["fieldset"])
+        mock_page.evaluate.assert_called_once_with(
+            TWO_OPTION_RADIO_FIELDSETS_SCRIPT,
+            {
+                "fieldset": selectors["fieldset"],
+                "radio": selectors["radio_input"],
+                "legend": selectors["legend"],
+                "indexAttribute": RADIO_FIELDSET_INDEX_ATTRIBUTE,
+            },
+        )
         assert mock_process_single_radio_fieldset.call_count == 2
-        mock_process_single_radio_fieldset.assert_any_call(mock_fieldset1, booleans)
-        mock_process_single_radio_fieldset.assert_any_call(mock_fieldset2, booleans)
+        mock_process_single_radio_fieldset.assert_any_call(mock_page, candidate1, booleans)
+        mock_process_single_radio_fieldset.assert_any_call(mock_page, candidate2, booleans)
+
+
+def make_locator(count=1):
+    """Builds a Locator-like mock whose async methods can be awaited."""
+    locator = MagicMock()
+    for method in (
+        "count", "inner_text", "get_attribute", "evaluate", "is_checked", "click", "select_option"
+    ):
+        setattr(locator, method, AsyncMock())
+    locator.count.return_value = count
+    return locator
+
+
+def make_labelled_locator(label_text):
+    """Builds a field locator whose associated label reads `label_text`."""
+    locator = make_locator()
+    locator.evaluate.return_value = label_text
+    return locator
 
 
 class TestProcessSingleCheckbox:
@@ -126,20 +112,16 @@ class TestProcessSingleCheckbox:
     async def test_process_single_checkbox_match_and_not_checked(self):
         """Test processing a checkbox that matches and is not checked."""
         mock_page = AsyncMock()
-        mock_checkbox = AsyncMock()
-        mock_checkbox.get_attribute.return_value = "checkbox_id"
-
-        mock_label = AsyncMock()
-        mock_page.query_selector.return_value = mock_label
-        mock_label.inner_text.return_value = "Authorized to work in the US"
+        mock_checkbox = make_labelled_locator("Authorized to work in the US")
 
         mock_checkbox.is_checked.return_value = False  # Not checked
         booleans = {"authorized": True}
 
         await _process_single_checkbox(mock_page, mock_checkbox, booleans)
 
-        mock_checkbox.get_attribute.assert_called_once_with("id")
-        mock_page.query_selector.assert_called_once_with("label[for='checkbox_id']")
+        # The label comes from the checkbox itself, not a label[for] lookup
+        mock_checkbox.evaluate.assert_called_once_with(ELEMENT_LABEL_TEXT_SCRIPT)
+        mock_page.locator.assert_not_called()
         mock_checkbox.is_checked.assert_called_once()
         mock_checkbox.click.assert_called_once()
 
@@ -147,20 +129,16 @@ class TestProcessSingleCheckbox:
     async def test_process_single_checkbox_match_and_checked_correctly(self):
         """Test processing a checkbox that matches and is already checked correctly."""
         mock_page = AsyncMock()
-        mock_checkbox = AsyncMock()
-        mock_checkbox.get_attribute.return_value = "checkbox_id"
-
-        mock_label = AsyncMock()
-        mock_page.query_selector.return_value = mock_label
-        mock_label.inner_text.return_value = "Authorized to work in the US"
+        mock_checkbox = make_labelled_locator("Authorized to work in the US")
 
         mock_checkbox.is_checked.return_value = True  # Checked
         booleans = {"authorized": True}
 
         await _process_single_checkbox(mock_page, mock_checkbox, booleans)
 
-        mock_checkbox.get_attribute.assert_called_once_with("id")
-        mock_page.query_selector.assert_called_once_with("label[for='checkbox_id']")
+        # The label comes from the checkbox itself, not a label[for] lookup
+        mock_checkbox.evaluate.assert_called_once_with(ELEMENT_LABEL_TEXT_SCRIPT)
+        mock_page.locator.assert_not_called()
         mock_checkbox.is_checked.assert_called_once()
         # Should not click since already correct
         mock_checkbox.click.assert_not_called()
@@ -172,33 +150,39 @@ class TestProcessSingleSelect:
     async def test_process_single_select_two_options_match(self):
         """Test processing a select with two options that match the pattern."""
         mock_page = AsyncMock()
-        mock_select = AsyncMock()
-        mock_option1 = AsyncMock()
-        mock_option2 = AsyncMock()
-
-        # Directly provide the options list without the placeholder for this test
-        mock_select.query_selector_all.return_value = [mock_option1, mock_option2]
-        mock_option1.inner_text.return_value = "No"
-        mock_option2.inner_text.return_value = "Yes"
-
-        mock_select.get_attribute.return_value = "select_id"
-
-        mock_label = AsyncMock()
-        mock_page.query_selector.return_value = mock_label
-        mock_label.inner_text.return_value = "Do you have a degree?"
-
-        mock_option1.get_attribute.return_value = "no_value"
-        mock_option2.get_attribute.return_value = "yes_value"
+        mock_select = make_locator()
+        scripts = {
+            SELECT_OPTION_PAIRS_SCRIPT: [
+                ["", "Select an option"],
+                ["no_value", "No"],
+                ["yes_value", "Yes"],
+            ],
+            ELEMENT_LABEL_TEXT_SCRIPT: "Do you have a degree?",
+        }
+        mock_select.evaluate.side_effect = lambda script: scripts[script]
 
         booleans = {"degree": True}
 
         await _process_single_select(mock_page, mock_select, booleans)
 
-        mock_select.query_selector_all.assert_called_once()
-        mock_select.get_attribute.assert_called_once_with("id")
-        mock_page.query_selector.assert_called_once_with("label[for='select_id']")
+        # Options and label are each read with a single evaluate
+        assert mock_select.evaluate.call_count == 2
+        mock_select.locator.assert_not_called()
+        mock_page.locator.assert_not_called()
         mock_select.select_option.assert_called_once_with(value="yes_value")
 
+    @pytest.mark.asyncio
+    async def test_process_single_select_skips_non_binary_select(self):
+        """Test that selects without exactly two real options are left alone."""
+        mock_page = AsyncMock()
+        mock_select = make_locator()
+        mock_select.evaluate.return_value = [["a", "A"], ["b", "B"], ["c", "C"]]
+
+        await _process_single_select(mock_page, mock_select, {"degree": True})
+
+        mock_select.evaluate.assert_called_once_with(SELECT_OPTION_PAIRS_SCRIPT)
+        mock_select.select_option.assert_not_called()
+
 
 class TestFillBoolean:
 
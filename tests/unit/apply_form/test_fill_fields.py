@@ -1,12 +1,16 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import sys
 import os
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, Any, Optional
 
 from apply_form.fill_fields import fill_fields
+from apply_form.form_snapshot import FormSnapshot
 
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))
@@ -28,15 +32,43 @@ def mock_config():
         language_proficiency: Dict[str, str] = field(default_factory=lambda: {"english": "native"})
         multiple_choice_fields: Dict[str, str] = field(default_factory=lambda: {"pronouns": "they/them"})
 
+        @cached_property
+        def merged_text_fields(self):
+            return {**self.text_fields, **self.years_of_experience}
+
+        @cached_property
+        def merged_booleans(self):
+            return {**self.booleans, "sponsorship": self.requires_visa_sponsorship}
+
+        @cached_property
+        def merged_multiple_choice_fields(self):
+            return {**self.language_proficiency, **self.multiple_choice_fields}
+
+    @dataclass
+    class MockPerformanceConfig:
+        short_circuit_text_fields: bool = False
+
     @dataclass
     class MockAppConfig:
         form_data: MockFormDataConfig = field(default_factory=MockFormDataConfig)
+        performance: MockPerformanceConfig = field(default_factory=MockPerformanceConfig)
 
     return MockAppConfig()
 
 
+@pytest.fixture
+def snapshot():
+    return FormSnapshot(
+        texts=[{"id": "salary_id", "label": "Salary"}],
+        selects=[{"id": "english_id", "label": "English", "options": []}],
+        uploads=[{"idx": 0, "label": "resume"}],
+        follow_checked=True,
+    )
+
+
 # This test does NOT use playwright, so it needs the asyncio mark.
 @pytest.mark.asyncio
+@patch("apply_form.fill_fields.capture_form_snapshot", new_callable=AsyncMock)
 @patch("apply_form.fill_fields.fill_multiple_choice_fields", new_callable=AsyncMock)
 @patch("apply_form.fill_fields.fill_boolean", new_callable=AsyncMock)
 @patch("apply_form.fill_fields.fill_text_fields", new_callable=AsyncMock)
@@ -52,26 +84,34 @@ async def test_fill_fields_orchestration(
     mock_fill_text_fields,
     mock_fill_boolean,
     mock_fill_multiple_choice_fields,
+    mock_capture_form_snapshot,
     mock_config,
+    snapshot,
 ):
     """Test that fill_fields calls all helper functions with the correct arguments."""
     # This test doesn't use a real page, so a simple AsyncMock is sufficient.
     mock_page = AsyncMock()
     cover_letter_path = Path("/path/to/cl.pdf")
+    mock_capture_form_snapshot.return_value = snapshot
 
     await fill_fields(mock_page, mock_config, cover_letter_path)
 
+    # The form is read once and the snapshot is shared by the helpers
+    mock_capture_form_snapshot.assert_called_once_with(mock_page)
+
     # Assert that each function was called once with the mock_page and correct data
     mock_insert_home_city.assert_called_once_with(mock_page, "Test City")
     mock_insert_phone.assert_called_once_with(mock_page, "123456789")
-    mock_uncheck_follow_company.assert_called_once_with(mock_page)
+    mock_uncheck_follow_company.assert_called_once_with(mock_page, True)
     mock_upload_docs.assert_called_once_with(
-        mock_page, Path("/path/to/cv.pdf"), cover_letter_path
+        mock_page, Path("/path/to/cv.pdf"), cover_letter_path, snapshot.uploads
     )
 
     # Assert that text fields are combined and passed correctly
     expected_text_fields = {"salary": "100k", "python": 5}
-    mock_fill_text_fields.assert_called_once_with(mock_page, expected_text_fields)
+    mock_fill_text_fields.assert_called_once_with(
+        mock_page, expected_text_fields, snapshot.texts, short_circuit=False
+    )
 
     # Assert that booleans are combined and passed correctly
     expected_booleans = {"authorized": True, "sponsorship": False}
@@ -80,5 +120,61 @@ async def test_fill_fields_orchestration(
     # Assert that multiple choice fields are combined and passed correctly
     expected_mc_fields = {"english": "native", "pronouns": "they/them"}
     mock_fill_multiple_choice_fields.assert_called_once_with(
-        mock_page, expected_mc_fields
+        mock_page, expected_mc_fields, snapshot.selects
     )
+
+
+@pytest.mark.asyncio
+@patch("apply_form.fill_fields.capture_form_snapshot", new_callable=AsyncMock)
+@patch("apply_form.fill_fields.fill_multiple_choice_fields", new_callable=AsyncMock)
+@patch("apply_form.fill_fields.fill_boolean", new_callable=AsyncMock)
+@patch("apply_form.fill_fields.fill_text_fields", new_callable=AsyncMock)
+@patch("apply_form.fill_fields.upload_docs", new_callable=AsyncMock)
+@patch("apply_form.fill_fields.uncheck_follow_company", new_callable=AsyncMock)
+@patch("apply_form.fill_fields.insert_phone", new_callable=AsyncMock)
+@patch("apply_form.fill_fields.insert_home_city", new_callable=AsyncMock)
+async def test_fill_fields_keeps_focus_dependent_steps_in_order(
+    mock_insert_home_city,
+    mock_insert_phone,
+    mock_uncheck_follow_company,
+    mock_upload_docs,
+    mock_fill_text_fields,
+    mock_fill_boolean,
+    mock_fill_multiple_choice_fields,
+    mock_capture_form_snapshot,
+    mock_config,
+    snapshot,
+):
+    """Test that typing/clicking steps run sequentially while uploads overlap them."""
+    calls = []
+    upload_started = asyncio.Event()
+
+    def record(name):
+        async def side_effect(*args, **kwargs):
+            calls.append(name)
+        return side_effect
+
+    async def slow_home_city(*args):
+        # The upload must already be in flight while the city is being typed
+        await upload_started.wait()
+        calls.append("home_city")
+
+    async def upload(*args):
+        upload_started.set()
+        calls.append("upload")
+
+    mock_capture_form_snapshot.return_value = snapshot
+    mock_insert_home_city.side_effect = slow_home_city
+    mock_upload_docs.side_effect = upload
+    mock_insert_phone.side_effect = record("phone")
+    mock_uncheck_follow_company.side_effect = record("follow")
+    mock_fill_text_fields.side_effect = record("text")
+    mock_fill_boolean.side_effect = record("boolean")
+    mock_fill_multiple_choice_fields.side_effect = record("multiple_choice")
+
+    await fill_fields(AsyncMock(), mock_config, None)
+
+    # Multiple choice follows the booleans, so it wins on selects both match
+    focus_steps = [c for c in calls if c != "upload"]
+    assert focus_steps == ["home_city", "phone", "follow", "text", "boolean", "multiple_choice"]
+    assert calls.index("upload") < calls.index("home_city")
@@ -5,7 +5,9 @@ import os
 from core.selectors import selectors
 
 from apply_form.fill_multiple_choice_fields import (
+    SELECT_FIELDS_SCRIPT,
     fill_multiple_choice_fields,
+    _find_option_value,
     _process_select_element,
 )
 
@@ -14,87 +16,96 @@ sys.path.insert(
 )
 
 
+def make_select_field(label):
+    return {
+        "id": "select_id",
+        "label": label,
+        "options": [
+            {"value": "beg_value", "text": "Beginner"},
+            {"value": "prof_value", "text": " Professional "},
+        ],
+    }
+
+
 class TestProcessSelectElement:
 
     @pytest.mark.asyncio
     async def test_process_select_element_match_and_select(self):
         """Test processing a select element that matches a pattern and selects the correct option."""
         mock_page = AsyncMock()
-        mock_select = AsyncMock()
-        mock_option1 = AsyncMock()
-        mock_option2 = AsyncMock()
-
-        mock_select.query_selector_all.return_value = [mock_option1, mock_option2]
-        mock_option1.inner_text.return_value = "Beginner"
-        mock_option2.inner_text.return_value = "Professional"
-
-        mock_select.get_attribute.return_value = "select_id"
-
-        mock_label = AsyncMock()
-        mock_page.query_selector.return_value = mock_label
-        mock_label.inner_text.return_value = "English Proficiency"
-
-        mock_option2.get_attribute.return_value = "prof_value"
-
         multiple_choice_fields = {"english": "professional"}
 
-        await _process_select_element(mock_page, mock_select, multiple_choice_fields)
+        await _process_select_element(
+            mock_page, make_select_field("English Proficiency"), multiple_choice_fields
+        )
 
-        mock_select.query_selector_all.assert_called_once_with(selectors["option"])
-        mock_select.get_attribute.assert_called_once_with("id")
-        mock_page.query_selector.assert_called_once_with("label[for='select_id']")
-        mock_select.select_option.assert_called_once_with(value="prof_value")
+        mock_page.select_option.assert_called_once_with(
+            "[id='select_id']", value="prof_value"
+        )
 
     @pytest.mark.asyncio
     async def test_process_select_element_no_matching_label(self):
         """Test processing a select element with no matching label."""
         mock_page = AsyncMock()
-        mock_select = AsyncMock()
-        # No need to mock options if query_selector_all is not called
-
-        mock_select.get_attribute.return_value = "select_id"
-
-        mock_label = AsyncMock()
-        mock_page.query_selector.return_value = mock_label
-        mock_label.inner_text.return_value = "Some Other Field"
-
         multiple_choice_fields = {"english": "professional"}
 
-        await _process_select_element(mock_page, mock_select, multiple_choice_fields)
+        await _process_select_element(
+            mock_page, make_select_field("Some Other Field"), multiple_choice_fields
+        )
 
-        mock_select.query_selector_all.assert_not_called()
-        mock_select.get_attribute.assert_called_once_with("id")
-        mock_page.query_selector.assert_called_once_with("label[for='select_id']")
         # Should not select anything since no matching label
-        mock_select.select_option.assert_not_called()
+        mock_page.select_option.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_process_select_element_no_matching_option(self):
         """Test processing a select element where no option matches the desired value."""
         mock_page = AsyncMock()
-        mock_select = AsyncMock()
-        mock_option1 = AsyncMock()
-        mock_option2 = AsyncMock()
+        multiple_choice_fields = {"english": "native"}  # No matching option
+
+        await _process_select_element(
+            mock_page, make_select_field("English Proficiency"), multiple_choice_fields
+        )
+
+        # Should not select anything since no matching option
+        mock_page.select_option.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_process_select_element_falls_back_to_next_matching_rule(self):
+        """Test that a later matching rule is tried when the first has no option."""
+        mock_page = AsyncMock()
+        multiple_choice_fields = {"english": "native", "proficiency": "beginner"}
+
+        await _process_select_element(
+            mock_page, make_select_field("English Proficiency"), multiple_choice_fields
+        )
 
-        mock_select.query_selector_all.return_value = [mock_option1, mock_option2]
-        mock_option1.inner_text.return_value = "Beginner"
-        mock_option2.inner_text.return_value = "Professional"
+        mock_page.select_option.assert_called_once_with(
+            "[id='select_id']", value="beg_value"
+        )
+        mock_page.evaluate.assert_not_called()
 
-        mock_select.get_attribute.return_value = "select_id"
 
-        mock_label = AsyncMock()
-        mock_page.query_selector.return_value = mock_label
-        mock_label.inner_text.return_value = "English Proficiency"
+class TestFindOptionValue:
 
-        multiple_choice_fields = {"english": "native"}  # No matching option
+    def test_find_option_value_is_memoized_by_option_set(self):
+        """Test that identical option sets on different selects reuse the match."""
+        _find_option_value.cache_clear()
+        options = (("beg_value", "Beginner"), ("prof_value", " Professional "))
 
-        await _process_select_element(mock_page, mock_select, multiple_choice_fields)
+        assert _find_option_value(options, "Professional") == (
+            "prof_value",
+            " Professional ",
+        )
+        assert _find_option_value(options, "Professional") == (
+            "prof_value",
+            " Professional ",
+        )
+        assert _find_option_value.cache_info().hits == 1
 
-        mock_select.query_selector_all.assert_called_once_with(selectors["option"])
-        mock_select.get_attribute.assert_called_once_with("id")
-        mock_page.query_selector.assert_called_once_with("label[for='select_id']")
-        # Should not select anything since no matching option
-        mock_select.select_option.assert_not_called()
+    def test_find_option_value_no_match(self):
+        """Test that a missing option returns None."""
+        assert _find_option_value((("beg_value", "Beginner"),), "Native") is None
 
 
 class TestFillMultipleChoiceFields:
@@ -106,19 +117,22 @@ class TestFillMultipleChoiceFields:
     ):
         """Test filling multiple choice fields across multiple select elements."""
         mock_page = AsyncMock()
-        mock_select1 = AsyncMock()
-        mock_select2 = AsyncMock()
-        mock_page.query_selector_all.return_value = [mock_select1, mock_select2]
+        select_field1 = make_select_field("English Proficiency")
+        select_field2 = make_select_field("Pronouns")
+        mock_page.evaluate.return_value = [select_field1, select_field2]
 
         multiple_choice_fields = {"english": "professional", "pronouns": "he/him"}
 
         await fill_multiple_choice_fields(mock_page, multiple_choice_fields)
 
-        mock_page.query_selector_all.assert_called_once_with(selectors["select"])
-        assert mock_process_select.call_count == 2
-        mock_process_select.assert_any_call(
-            mock_page, mock_select1, multiple_choice_fields
-        )
-        mock_process_select.assert_any_call(
-            mock_page, mock_select2, multiple_choice_fields
+        # Labels and options for all selects are read in a single round-trip
+        mock_page.evaluate.assert_called_once_with(
+            SELECT_FIELDS_SCRIPT,
+            {
+                "select": selectors["select"],
+                "option": selectors["select_option"],
+            },
         )
+        assert mock_process_select.call_count == 2
+        mock_process_select.assert_any_call(mock_page, select_field1, multiple_choice_fields)
+        mock_process_select.assert_any_call(mock_page, select_field2, multiple_choice_fields)
@@ -1,9 +1,11 @@
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import sys
 import os
 from core.selectors import selectors
-from apply_form.fill_text_fields import fill_text_fields
+from apply_form.fill_text_fields import TEXT_INPUT_LABELS_SCRIPT, fill_text_fields
 
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))
@@ -13,74 +15,142 @@ sys.path.insert(
 class TestFillTextFields:
 
     @pytest.mark.asyncio
-    @patch("apply_form.fill_text_fields.change_text_input")
-    async def test_fill_text_fields_match_and_fill(self, mock_change_text_input):
+    async def test_fill_text_fields_match_and_fill(self):
         """Test filling text fields that match a pattern."""
         mock_page = AsyncMock()
-        mock_input1 = AsyncMock()
-        mock_input2 = AsyncMock()
-        mock_page.query_selector_all.return_value = [mock_input1, mock_input2]
-
-        mock_input1.get_attribute.return_value = "input1_id"
-        mock_input2.get_attribute.return_value = "input2_id"
-
-        mock_label1 = AsyncMock()
-        mock_label2 = AsyncMock()
-        mock_page.query_selector.side_effect = [mock_label1, mock_label2]
-        mock_label1.inner_text.return_value = "Years of Experience"
-        mock_label2.inner_text.return_value = "Phone Number"
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.fill = AsyncMock()
+        mock_page.evaluate.return_value = [
+            {"id": "input1_id", "label": "Years of Experience"},
+            {"id": "input2_id", "label": "Phone Number"},
+        ]
 
         text_fields = {"experience": "5", "phone": "123-456-7890"}
 
         await fill_text_fields(mock_page, text_fields)
 
-        mock_page.query_selector_all.assert_called_once_with(selectors["text_input"])
-        assert mock_page.query_selector.call_count == 2
-        # Should call change_text_input for both matching fields
-        assert mock_change_text_input.call_count == 2
-        mock_change_text_input.assert_any_call(mock_input1, "", "5")
-        mock_change_text_input.assert_any_call(mock_input2, "", "123-456-7890")
+        # Labels for all inputs are read in a single round-trip
+        mock_page.evaluate.assert_called_once_with(
+            TEXT_INPUT_LABELS_SCRIPT,
+            {"input": selectors["text_input"]},
+        )
+        mock_page.query_selector_all.assert_not_called()
+        # Both matching fields are filled through a locator in one call each
+        assert mock_page.locator.call_count == 2
+        mock_page.locator.assert_any_call("[id='input1_id']")
+        mock_page.locator.assert_any_call("[id='input2_id']")
+        mock_page.locator.return_value.fill.assert_any_call("5")
+        mock_page.locator.return_value.fill.assert_any_call("123-456-7890")
+        mock_page.query_selector.assert_not_called()
 
     @pytest.mark.asyncio
-    @patch("apply_form.fill_text_fields.change_text_input")
-    async def test_fill_text_fields_no_matching_label(self, mock_change_text_input):
+    async def test_fill_text_fields_no_matching_label(self):
         """Test filling text fields when no label matches."""
         mock_page = AsyncMock()
-        mock_input = AsyncMock()
-        mock_page.query_selector_all.return_value = [mock_input]
+        mock_page.locator = MagicMock()
+        mock_page.evaluate.return_value = [
+            {"id": "input_id", "label": "Some Other Field"},
+            {"id": "unlabelled_id", "label": ""},
+        ]
+
+        text_fields = {"experience": "5", "phone": "123-456-7890"}
 
-        mock_input.get_attribute.return_value = "input_id"
+        await fill_text_fields(mock_page, text_fields)
 
-        mock_label = AsyncMock()
-        mock_page.query_selector.return_value = mock_label
-        mock_label.inner_text.return_value = "Some Other Field"
+        # Should not fill anything since no matching label
+        mock_page.locator.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fill_text_fields_label_lookup_fails(self):
+        """Test handling when label lookup fails."""
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock()
+        mock_page.evaluate.side_effect = Exception("Lookup failed")
 
         text_fields = {"experience": "5", "phone": "123-456-7890"}
 
         await fill_text_fields(mock_page, text_fields)
 
-        mock_page.query_selector_all.assert_called_once_with(selectors["text_input"])
-        mock_page.query_selector.assert_called_once_with("label[for='input_id']")
-        # Should not call change_text_input since no matching label
-        mock_change_text_input.assert_not_called()
+        mock_page.evaluate.assert_called_once()
+        # Should log the error and leave the fields untouched
+        mock_page.locator.assert_not_called()
 
     @pytest.mark.asyncio
-    @patch("apply_form.fill_text_fields.change_text_input")
-    async def test_fill_text_fields_label_lookup_fails(self, mock_change_text_input):
-        """Test handling when label lookup fails."""
+    async def test_fill_text_fields_short_circuit(self):
+        """Test that scanning stops once every rule has filled an input."""
         mock_page = AsyncMock()
-        mock_input = AsyncMock()
-        mock_page.query_selector_all.return_value = [mock_input]
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.fill = AsyncMock()
+        pairs = [
+            {"id": "salary_id", "label": "Expected salary"},
+            {"id": "other_salary_id", "label": "Salary in previous job"},
+        ]
 
-        mock_input.get_attribute.return_value = "input_id"
+        await fill_text_fields(mock_page, {"salary": "35k"}, pairs, short_circuit=True)
 
-        mock_page.query_selector.side_effect = Exception("Lookup failed")
+        mock_page.locator.assert_called_once_with("[id='salary_id']")
+        mock_page.evaluate.assert_not_called()
 
-        text_fields = {"experience": "5", "phone": "123-456-7890"}
+    @pytest.mark.asyncio
+    async def test_fill_text_fields_without_short_circuit_fills_every_match(self):
+        """Test that by default a rule fills every input it matches."""
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.fill = AsyncMock()
+        pairs = [
+            {"id": "salary_id", "label": "Expected salary"},
+            {"id": "other_salary_id", "label": "Salary in previous job"},
+        ]
 
-        await fill_text_fields(mock_page, text_fields)
+        await fill_text_fields(mock_page, {"salary": "35k"}, pairs)
+
+        assert mock_page.locator.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fill_text_fields_formats_non_string_values(self):
+        """Test that ints, large ints and booleans are typed as their str() text."""
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.fill = AsyncMock()
+        pairs = [
+            {"id": "python_id", "label": "Years of Python"},
+            {"id": "salary_id", "label": "Expected salary"},
+            {"id": "relocate_id", "label": "Willing to relocate"},
+        ]
+
+        await fill_text_fields(
+            mock_page, {"python": 5, "salary": 35000, "relocate": True}, pairs
+        )
+
+        fills = [c.args[0] for c in mock_page.locator.return_value.fill.call_args_list]
+        assert fills == ["5", "35000", "True"]
+
+    @pytest.mark.asyncio
+    async def test_fill_text_fields_scans_uncombinable_rules_in_thread(self):
+        """Test that rule-by-rule matching runs off the event loop."""
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.fill = AsyncMock()
+        pairs = [{"id": "relocate_id", "label": "Can you relocate?"}]
+
+        with patch(
+            "apply_form.fill_text_fields.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as mock_to_thread:
+            await fill_text_fields(mock_page, {"(?s)relocat": "Yes"}, pairs)
+
+        mock_to_thread.assert_called_once()
+        mock_page.locator.return_value.fill.assert_called_once_with("Yes")
+
+    @pytest.mark.asyncio
+    async def test_fill_text_fields_matches_combined_rules_inline(self):
+        """Test that combinable rules are matched without a thread hop."""
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock()
+        mock_page.locator.return_value.fill = AsyncMock()
+        pairs = [{"id": "salary_id", "label": "Expected salary"}]
+
+        with patch("apply_form.fill_text_fields.asyncio.to_thread") as mock_to_thread:
+            await fill_text_fields(mock_page, {"salary": "35k"}, pairs)
 
-        mock_page.query_selector_all.assert_called_once_with(selectors["text_input"])
-        mock_page.query_selector.assert_called_once_with("label[for='input_id']")
-        # Should continue to next input after logging the error
-        mock_change_text_input.assert_not_called()
+        mock_to_thread.assert_not_called()
+        mock_page.locator.return_value.fill.assert_called_once_with("35k")
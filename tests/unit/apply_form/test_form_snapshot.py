@@ -0,0 +1,40 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from apply_form.form_snapshot import (
+    FORM_SNAPSHOT_ARGS,
+    FORM_SNAPSHOT_SCRIPT,
+    FormSnapshot,
+    capture_form_snapshot,
+)
+from apply_form.fill_text_fields import TEXT_INPUT_LABELS_SCRIPT
+
+
+class TestCaptureFormSnapshot:
+
+    @pytest.mark.asyncio
+    async def test_capture_form_snapshot_single_evaluate(self):
+        """Test that the whole form is read with one evaluate call."""
+        mock_page = AsyncMock()
+        mock_page.evaluate.return_value = {
+            "texts": [{"id": "salary_id", "label": "Salary"}],
+            "selects": [],
+            "uploads": [{"idx": 0, "label": "resume"}],
+            "followChecked": True,
+        }
+
+        snapshot = await capture_form_snapshot(mock_page)
+
+        mock_page.evaluate.assert_called_once_with(
+            FORM_SNAPSHOT_SCRIPT, FORM_SNAPSHOT_ARGS
+        )
+        assert snapshot == FormSnapshot(
+            texts=[{"id": "salary_id", "label": "Salary"}],
+            selects=[],
+            uploads=[{"idx": 0, "label": "resume"}],
+            follow_checked=True,
+        )
+
+    def test_snapshot_script_reuses_field_scripts(self):
+        """Test that the snapshot composes the per-field discovery scripts."""
+        assert TEXT_INPUT_LABELS_SCRIPT in FORM_SNAPSHOT_SCRIPT
@@ -24,4 +24,5 @@ class TestInsertHomeCity:
             mock_page,
             ".jobs-easy-apply-modal input[id*='easyApplyFormElement'][id*='city-HOME-CITY']",
             home_city,
+            use_keyboard=True,
         )
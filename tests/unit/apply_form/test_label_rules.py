@@ -0,0 +1,91 @@
+from apply_form.label_rules import (
+    _compile_label_rules,
+    iter_label_rules,
+    label_rules_combined,
+    match_label_rule,
+    match_label_rules,
+)
+
+
+class TestMatchLabelRule:
+
+    def test_returns_first_rule_in_dict_order(self):
+        """Test that rule priority follows dict order, not match position."""
+        rules = {"experience": 3, "python": 5}
+
+        assert match_label_rule("Python: years of experience", rules) == ("experience", 3)
+
+    def test_is_case_insensitive(self):
+        """Test that labels are matched ignoring case."""
+        assert match_label_rule("AUTHORIZED to work", {"authorized": True}) == (
+            "authorized",
+            True,
+        )
+
+    def test_no_match_or_empty_label(self):
+        """Test that unmatched or empty labels return None."""
+        rules = {"salary": "35k"}
+
+        assert match_label_rule("Phone number", rules) is None
+        assert match_label_rule("", rules) is None
+
+    def test_patterns_with_their_own_groups(self):
+        """Test that capturing groups inside a rule do not confuse the dispatch."""
+        rules = {"(bachelor|bacharelado)": True, "degree": False}
+
+        assert match_label_rule("Do you have a degree?", rules) == ("degree", False)
+        assert match_label_rule("Bachelor's degree?", rules) == (
+            "(bachelor|bacharelado)",
+            True,
+        )
+
+    def test_falls_back_when_patterns_cannot_be_combined(self):
+        """Test rule-by-rule matching when a pattern uses a global inline flag."""
+        rules = {"(?s)relocat": True, "sponsor": False}
+
+        assert _compile_label_rules(tuple(rules)) is None
+        assert match_label_rule("Visa sponsorship?", rules) == ("sponsor", False)
+
+    def test_combined_pattern_is_compiled_once_per_rule_set(self):
+        """Test that the combined regex is cached across calls."""
+        rules = {"english": "Professional", "spanish": "Native"}
+
+        first = _compile_label_rules(tuple(rules))
+        match_label_rule("English level", rules)
+
+        assert _compile_label_rules(tuple(rules)) is first
+
+
+class TestIterLabelRules:
+
+    def test_yields_all_matching_rules_in_order(self):
+        """Test that every matching rule is yielded in dict order."""
+        rules = {"english": "Native", "salary": "35k", "proficiency": "Fluent"}
+
+        assert list(iter_label_rules("English proficiency", rules)) == [
+            ("english", "Native"),
+            ("proficiency", "Fluent"),
+        ]
+
+    def test_yields_nothing_without_match(self):
+        """Test that an unmatched label yields no rules."""
+        assert list(iter_label_rules("Phone", {"english": "Native"})) == []
+
+
+class TestMatchLabelRules:
+
+    def test_classifies_each_label(self):
+        """Test that a batch returns one result per label, in order."""
+        rules = {"salary": "35k", "python": 5}
+
+        assert match_label_rules(["Python years", "Phone", "Salary"], rules) == [
+            ("python", 5),
+            None,
+            ("salary", "35k"),
+        ]
+
+    def test_label_rules_combined(self):
+        """Test detection of rule sets that fall back to rule-by-rule scanning."""
+        assert label_rules_combined({"salary": "35k"})
+        assert not label_rules_combined({"(?s)relocat": True})
+        assert not label_rules_combined({})
@@ -2,7 +2,10 @@ import pytest
 from unittest.mock import AsyncMock
 import sys
 import os
-from apply_form.uncheck_follow_company import uncheck_follow_company
+from apply_form.uncheck_follow_company import (
+    UNCHECK_FOLLOW_COMPANY_SCRIPT,
+    uncheck_follow_company,
+)
 
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))
@@ -12,48 +15,34 @@ sys.path.insert(
 class TestUncheckFollowCompany:
 
     @pytest.mark.asyncio
-    async def test_uncheck_follow_company_when_checked(self):
-        """Test unchecking the follow company checkbox when it's checked."""
+    async def test_uncheck_follow_company_single_evaluate(self):
+        """Test that the checkbox is read and unchecked in one round-trip."""
         mock_page = AsyncMock()
-        mock_checkbox = AsyncMock()
-        mock_page.query_selector.return_value = mock_checkbox
-        mock_page.evaluate.return_value = True  # Checkbox is checked
 
         await uncheck_follow_company(mock_page)
 
-        mock_page.query_selector.assert_called_once_with(
-            '.jobs-easy-apply-modal input[type="checkbox"][id*="follow-company-checkbox"]'
+        mock_page.evaluate.assert_called_once_with(
+            UNCHECK_FOLLOW_COMPANY_SCRIPT,
+            '.jobs-easy-apply-modal input[type="checkbox"][id*="follow-company-checkbox"]',
         )
-        mock_page.evaluate.assert_called_once_with("el => el.checked", mock_checkbox)
-        mock_checkbox.click.assert_called_once()
+        mock_page.query_selector.assert_not_called()
+        mock_page.click.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_uncheck_follow_company_when_not_checked(self):
-        """Test that nothing happens when the follow company checkbox is not checked."""
+    async def test_uncheck_follow_company_uses_snapshot_state(self):
+        """Test that a checked snapshot still unchecks in one round-trip."""
         mock_page = AsyncMock()
-        mock_checkbox = AsyncMock()
-        mock_page.query_selector.return_value = mock_checkbox
-        mock_page.evaluate.return_value = False  # Checkbox is not checked
 
-        await uncheck_follow_company(mock_page)
+        await uncheck_follow_company(mock_page, is_checked=True)
 
-        mock_page.query_selector.assert_called_once_with(
-            '.jobs-easy-apply-modal input[type="checkbox"][id*="follow-company-checkbox"]'
-        )
-        mock_page.evaluate.assert_called_once_with("el => el.checked", mock_checkbox)
-        # Should not click since it's not checked
-        mock_checkbox.click.assert_not_called()
+        mock_page.evaluate.assert_called_once()
+        mock_page.query_selector.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_uncheck_follow_company_checkbox_not_found(self):
-        """Test handling when the follow company checkbox is not found."""
+    async def test_uncheck_follow_company_snapshot_unchecked(self):
+        """Test that nothing is sent to the page when the snapshot says it is unchecked."""
         mock_page = AsyncMock()
-        mock_page.query_selector.return_value = None  # Checkbox not found
 
-        await uncheck_follow_company(mock_page)
+        await uncheck_follow_company(mock_page, is_checked=False)
 
-        mock_page.query_selector.assert_called_once_with(
-            '.jobs-easy-apply-modal input[type="checkbox"][id*="follow-company-checkbox"]'
-        )
-        # Should not evaluate or click since checkbox is None
         mock_page.evaluate.assert_not_called()
@@ -2,7 +2,16 @@ import pytest
 from unittest.mock import AsyncMock
 import sys
 import os
-from apply_form.wait_for_no_error import wait_for_no_error
+from playwright.async_api import (
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
+)
+from apply_form.wait_for_no_error import (
+    ERROR_SELECTOR,
+    NO_ERROR_SCRIPT,
+    NO_ERROR_TIMEOUT_MS,
+    wait_for_no_error,
+)
 
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))
@@ -18,7 +27,29 @@ class TestWaitForNoError:
 
         await wait_for_no_error(mock_page)
 
-        mock_page.wait_for_function.assert_called_once_with(
-            '() => !document.querySelector(\'div[id*="error"] div[class*="error"]\')',
-            timeout=1000,
+        mock_page.evaluate.assert_called_once_with(
+            NO_ERROR_SCRIPT, [ERROR_SELECTOR, NO_ERROR_TIMEOUT_MS]
+        )
+        mock_page.wait_for_function.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_no_error_timeout(self):
+        """Test that a lingering error element surfaces as a Playwright timeout."""
+        mock_page = AsyncMock()
+        mock_page.evaluate.side_effect = PlaywrightError(
+            "Error: wait_for_no_error timeout"
         )
+
+        with pytest.raises(PlaywrightTimeoutError):
+            await wait_for_no_error(mock_page)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_no_error_other_errors_propagate(self):
+        """Test that unrelated evaluate failures are re-raised unchanged."""
+        mock_page = AsyncMock()
+        mock_page.evaluate.side_effect = PlaywrightError("Target closed")
+
+        with pytest.raises(PlaywrightError) as exc_info:
+            await wait_for_no_error(mock_page)
+
+        assert not isinstance(exc_info.value, PlaywrightTimeoutError)
@@ -1,13 +1,29 @@
+import datetime
 import pytest
 import sqlite3
 from unittest.mock import patch, MagicMock
 from core.database import (
+    SCHEMA_VERSION,
+    close_shared_connections,
+    get_db_connection,
+    count_todays_applications,
+    STATEMENT_CACHE_SIZE,
+    _in_clause,
+    _pad_in_clause_params,
+    get_existing_vacancy_ids,
+    get_vacancies_by_ids,
+    Vacancy,
+    get_vacancy_by_id,
     init_db,
+    setup_database,
     save_discovered_jobs,
     get_jobs_to_enrich,
     update_job_status,
+    update_job_statuses,
     save_enrichment_data,
     get_enriched_jobs,
+    record_run_timestamp,
+    get_last_run_timestamp,
 )
 
 @pytest.fixture
@@ -53,3 +69,273 @@ class TestDatabaseUnit:
         assert len(enriched) == 1
         assert enriched[0][4] == "New description"
         assert enriched[0][0] == 1
+
+    def test_get_existing_vacancy_ids(self, db_conn):
+        """Tests that only ids already stored are returned, for any batch size."""
+        jobs = [(i, f"/link{i}", f"Title{i}", "Company") for i in range(1, 21)]
+        save_discovered_jobs(jobs, db_conn)
+
+        assert get_existing_vacancy_ids([3, 99], db_conn) == {3}
+        assert get_existing_vacancy_ids(list(range(15, 30)), db_conn) == set(range(15, 21))
+        assert get_existing_vacancy_ids([], db_conn) == set()
+
+    def test_pad_in_clause_params_uses_power_of_two_buckets(self):
+        """Tests that IN (...) batches share a small set of statement shapes."""
+        assert _pad_in_clause_params([1, 2]) == [1, 2] + [2] * 6
+        assert len(_pad_in_clause_params(list(range(9)))) == 16
+        assert len(_pad_in_clause_params(list(range(16)))) == 16
+        assert len(_pad_in_clause_params(list(range(100)))) == 128
+
+    def test_in_clause_switches_to_json_each_for_large_sets(self, db_conn):
+        """Tests that large id sets use one JSON parameter and still match correctly."""
+        assert _in_clause([1, 2]) == ("(?,?,?,?,?,?,?,?)", [1, 2, 2, 2, 2, 2, 2, 2])
+
+        ids = list(range(1, 2001))
+        in_clause, params = _in_clause(ids)
+        assert in_clause == "(SELECT value FROM json_each(?))"
+        assert len(params) == 1
+
+        save_discovered_jobs([(i, "/l", "T", "C") for i in (5, 1500, 3000)], db_conn)
+        assert get_existing_vacancy_ids(ids, db_conn) == {5, 1500}
+        assert set(get_vacancies_by_ids(ids, db_conn)) == {5, 1500}
+
+    def test_setup_database_sizes_statement_cache(self):
+        """Tests that the connection is opened with the module's statement cache size."""
+        with patch("core.database.sqlite3.connect", wraps=sqlite3.connect) as mock_connect:
+            conn = setup_database(":memory:")
+        conn.close()
+
+        assert mock_connect.call_args.kwargs["cached_statements"] == STATEMENT_CACHE_SIZE
+
+    def test_update_job_statuses(self, db_conn):
+        """Tests updating several statuses in one call; only applied jobs get applide_at."""
+        jobs = [(1, "/link1", "Title1", "Company1"), (2, "/link2", "Title2", "Company2")]
+        save_discovered_jobs(jobs, db_conn)
+
+        update_job_statuses([(1, "applied"), (2, "skipped_filter")], db_conn)
+
+        cursor = db_conn.cursor()
+        cursor.execute("SELECT id, status, applide_at IS NOT NULL FROM vacancies ORDER BY id")
+        assert cursor.fetchall() == [(1, "applied", 1), (2, "skipped_filter", 0)]
+
+    def test_setup_database_enables_wal(self, tmp_path):
+        """Tests that file databases are opened in WAL mode with NORMAL sync."""
+        conn = setup_database(str(tmp_path / "jobs.db"))
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        finally:
+            conn.close()
+
+    def test_setup_database_synchronous_off(self, tmp_path):
+        """Tests that fsync can be disabled explicitly for throwaway databases."""
+        conn = setup_database(str(tmp_path / "jobs.db"), synchronous_off=True)
+        try:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
+        finally:
+            conn.close()
+
+    def test_init_db_migrates_legacy_schema_once(self):
+        """Tests that missing columns are added once and the schema version recorded."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            "CREATE TABLE vacancies (id INTEGER PRIMARY KEY, title TEXT NOT NULL, "
+            "company TEXT NOT NULL, link TEXT NOT NULL, "
+            "status TEXT NOT NULL DEFAULT 'discovered', created_at TIMESTAMP NOT NULL, "
+            "company_headquarters TEXT)"
+        )
+        conn.commit()
+
+        init_db(conn)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(vacancies)")}
+        assert {"company_specialties", "company_founded", "applide_at"} <= columns
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+        # A second startup finds the schema current and runs no migration
+        mock_migrate = MagicMock()
+        with patch("core.database._MIGRATIONS", (mock_migrate,)):
+            init_db(conn)
+        mock_migrate.assert_not_called()
+        conn.close()
+
+    def test_init_db_migrates_text_timestamps_to_epoch(self):
+        """Tests that ISO text timestamps of older databases become epoch seconds."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            "CREATE TABLE vacancies (id INTEGER PRIMARY KEY, title TEXT NOT NULL, "
+            "company TEXT NOT NULL, link TEXT NOT NULL, "
+            "status TEXT NOT NULL DEFAULT 'discovered', created_at TIMESTAMP NOT NULL)"
+        )
+        applied = datetime.datetime(2026, 3, 1, 9, 30, 15)
+        conn.execute(
+            "INSERT INTO vacancies (id, title, company, link, created_at) "
+            "VALUES (1, 't', 'c', 'l', ?)",
+            (applied.isoformat(" "),),
+        )
+        conn.commit()
+
+        init_db(conn)
+
+        assert conn.execute("SELECT created_at FROM vacancies").fetchone() == (
+            int(applied.timestamp()),
+        )
+        conn.close()
+
+    def test_init_db_fresh_database_is_current(self, db_conn):
+        """Tests that a new database is created at the current schema version."""
+        assert db_conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert not db_conn.in_transaction
+        indexes = {
+            row[0]
+            for row in db_conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'vacancies' "
+                "AND name LIKE 'idx_%'"
+            )
+        }
+        assert indexes == {"idx_vacancies_status_id", "idx_vacancies_status_applied_at"}
+
+    def test_get_vacancies_by_ids(self, db_conn):
+        """Tests fetching full rows for several ids at once, keyed by id."""
+        jobs = [(1, "/link1", "Title1", "Company1"), (2, "/link2", "Title2", "Company2")]
+        save_discovered_jobs(jobs, db_conn)
+
+        vacancies = get_vacancies_by_ids([2, 1, 42], db_conn)
+
+        assert set(vacancies) == {1, 2}
+        assert vacancies[2].title == "Title2"
+        assert vacancies[1].status == "discovered"
+        assert get_vacancies_by_ids([], db_conn) == {}
+        # The connection keeps returning plain tuples to other callers
+        assert db_conn.row_factory is None
+
+    def test_count_todays_applications(self, db_conn):
+        """Tests that only jobs applied to today are counted, whenever they were found."""
+        now = int(datetime.datetime.now().timestamp())
+        yesterday = now - 24 * 60 * 60
+        db_conn.executemany(
+            "INSERT INTO vacancies (id, title, company, link, status, created_at, applide_at) "
+            "VALUES (?, 't', 'c', 'l', ?, ?, ?)",
+            [
+                (1, "applied", now, now),
+                (2, "applied", yesterday, now),  # discovered earlier, applied today
+                (3, "applied", now, yesterday),
+                (4, "enriched", now, None),
+            ],
+        )
+
+        assert count_todays_applications(db_conn) == 2
+
+    def test_status_queries_use_indexes(self, db_conn):
+        """Tests that status scans and the daily count are served by indexes."""
+        def plan(sql, params=()):
+            return " ".join(row[-1] for row in db_conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+        assert "idx_vacancies_status_id" in plan(
+            "SELECT id FROM vacancies WHERE status = 'enriched' ORDER BY id DESC"
+        )
+        assert "idx_vacancies_status_applied_at" in plan(
+            "SELECT COUNT(*) FROM vacancies WHERE status = 'applied' AND applide_at >= ? AND applide_at < ?",
+            (1767225600, 1767312000),
+        )
+
+    def test_get_db_connection_reuses_connection(self, tmp_path):
+        """Tests that one connection per db file is shared and rolled back on errors."""
+        db_file = str(tmp_path / "jobs.db")
+        try:
+            with get_db_connection(db_file) as first:
+                init_db(first)
+            with get_db_connection(db_file) as second:
+                assert second is first
+
+            with pytest.raises(RuntimeError):
+                with get_db_connection(db_file) as conn:
+                    conn.execute(
+                        "INSERT INTO vacancies (id, title, company, link, created_at) "
+                        "VALUES (1, 't', 'c', 'l', '2026-01-01')"
+                    )
+                    raise RuntimeError("boom")
+
+            assert first.execute("SELECT COUNT(*) FROM vacancies").fetchone()[0] == 0
+        finally:
+            close_shared_connections()
+
+    def test_get_vacancy_by_id_keeps_connection_row_factory(self, db_conn):
+        """Tests that reading one vacancy does not change other queries."""
+        save_discovered_jobs([(1, "/link1", "Title1", "Company1")], db_conn)
+
+        assert get_vacancy_by_id(1, db_conn).title == "Title1"
+        assert get_vacancy_by_id(2, db_conn) is None
+        assert db_conn.row_factory is None
+        assert isinstance(get_jobs_to_enrich(db_conn)[0], tuple)
+
+    def test_get_vacancy_by_id_returns_named_columns(self, db_conn):
+        """Tests that vacancy fields are mapped by column name, not table position."""
+        save_discovered_jobs([(1, "/link1", "Title1", "Company1")], db_conn)
+
+        vacancy = get_vacancy_by_id(1, db_conn)
+
+        assert isinstance(vacancy, Vacancy)
+        assert (vacancy.id, vacancy.link, vacancy.company) == (1, "/link1", "Company1")
+        assert vacancy.company_founded == 0
+        assert vacancy.get("title") == "Title1"
+        assert vacancy.get("description", "n/a") is None
+        assert vacancy.get("no_such_column", "n/a") == "n/a"
+
+    def test_save_discovered_jobs_returns_inserted_ids(self, db_conn):
+        """Tests that only newly inserted ids are returned and existing rows are kept."""
+        save_discovered_jobs([(1, "/link1", "Title1", "Company1")], db_conn)
+        update_job_status(1, "enriched", db_conn)
+
+        inserted = save_discovered_jobs(
+            [(1, "/other", "Other", "Other"), (2, "/link2", "Title2", "Company2")], db_conn
+        )
+
+        assert inserted == {2}
+        assert get_vacancy_by_id(1, db_conn).status == "enriched"
+        vacancy = get_vacancy_by_id(2, db_conn)
+        assert (vacancy.link, vacancy.title, vacancy.company) == (
+            "/link2", "Title2", "Company2"
+        )
+        assert save_discovered_jobs([], db_conn) == set()
+
+    def test_setup_database_writes_in_explicit_transactions(self, tmp_path):
+        """Tests that the main connection autocommits and bulk writes are atomic."""
+        conn = setup_database(str(tmp_path / "jobs.db"))
+        try:
+            assert conn.isolation_level is None
+            save_discovered_jobs([(1, "/link1", "Title1", "Company1")], conn)
+            assert not conn.in_transaction
+
+            # A failing batch leaves no partial update behind
+            with pytest.raises(sqlite3.Error):
+                update_job_statuses([(1, "applied"), (1, None)], conn)
+            assert not conn.in_transaction
+            assert get_vacancy_by_id(1, conn).status == "discovered"
+        finally:
+            conn.close()
+
+    def test_migration_analyzes_new_indexes(self, db_conn):
+        """Tests that the planner has statistics once the schema is migrated."""
+        stat_tables = db_conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchall()
+        assert stat_tables == [("sqlite_stat1",)]
+
+    def test_run_timestamps_round_trip(self, db_conn):
+        """Tests that run times are stored as epoch seconds and read back as datetimes."""
+        assert get_last_run_timestamp(db_conn) is None
+
+        record_run_timestamp(db_conn)
+
+        stored = db_conn.execute("SELECT run_timestamp FROM run_history").fetchone()[0]
+        assert isinstance(stored, int)
+        assert get_last_run_timestamp(db_conn) == datetime.datetime.fromtimestamp(stored)
+
+    def test_record_run_timestamp_optimizes_database(self):
+        """Tests that a finished run refreshes the planner statistics."""
+        conn = MagicMock()
+
+        record_run_timestamp(conn)
+
+        conn.commit.assert_called_once()
+        conn.execute.assert_called_once_with("PRAGMA optimize")
@@ -1,4 +1,7 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -167,3 +170,121 @@ def test_modal_flow_resources_loading():
     assert learning_config.confidence_threshold == pytest.approx(
         modal_config.learning.confidence_threshold
     )
+
+
+def test_resources_warmup_loads_everything_up_front():
+    resources = ModalFlowResources(
+        modal_flow_config=_build_modal_flow_config(),
+        llm_config=_build_llm_settings(),
+        logger=logging.getLogger("modal-test"),
+    )
+
+    resources.warmup()
+
+    assert resources._profile is not None
+    assert resources._rule_store is not None
+    assert resources._normalizer is not None
+    assert "learning_config" in resources.__dict__
+
+
+def test_concurrent_access_builds_one_rule_store(monkeypatch):
+    resources = ModalFlowResources(
+        modal_flow_config=_build_modal_flow_config(),
+        llm_config=_build_llm_settings(),
+        logger=logging.getLogger("modal-test"),
+    )
+    created = []
+
+    def slow_rule_store(path):
+        # Widen the window in which a second reader could start its own load
+        time.sleep(0.05)
+        store = MagicMock()
+        created.append(store)
+        return store
+
+    monkeypatch.setattr("core.form_filler.modal_flow_resources.RuleStore", slow_rule_store)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        stores = list(pool.map(lambda _: resources.rule_store, range(4)))
+
+    assert len(created) == 1
+    assert all(store is created[0] for store in stores)
+
+
+def test_learning_config_is_built_once_until_reset():
+    resources = ModalFlowResources(
+        modal_flow_config=_build_modal_flow_config(),
+        llm_config=_build_llm_settings(),
+        logger=logging.getLogger("modal-test"),
+    )
+
+    learning_config = resources.learning_config
+    assert resources.learning_config is learning_config
+    with pytest.raises(FrozenInstanceError):
+        learning_config.confidence_threshold = 0.1
+
+    resources.reset()
+    assert resources.learning_config is not learning_config
+
+
+def test_job_payload_is_built_once():
+    job_context = JobApplicationContext(
+        job_id=1,
+        job_url="https://example.com/jobs/1",
+        job_title="Engineer",
+        should_submit=False,
+        job_description="Build things",
+        metadata={"company": "Example"},
+    )
+
+    payload = job_context.to_job_payload()
+
+    assert payload == {
+        "job_id": 1,
+        "job_url": "https://example.com/jobs/1",
+        "job_title": "Engineer",
+        "job_description": "Build things",
+        "company": "Example",
+    }
+    assert job_context.to_job_payload() is payload
+    with pytest.raises(FrozenInstanceError):
+        job_context.job_title = "Other"
+    assert not hasattr(job_context, "__dict__")
+
+
+@pytest.mark.asyncio
+async def test_fill_binds_job_context_for_structured_logs(monkeypatch):
+    import structlog
+
+    resources = ModalFlowResources(
+        modal_flow_config=_build_modal_flow_config(),
+        llm_config=_build_llm_settings(),
+        logger=logging.getLogger("modal-test"),
+    )
+    dummy_app_config = SimpleNamespace(
+        modal_flow=_build_modal_flow_config(),
+        llm=_build_llm_settings(),
+        form_data=_build_form_data(),
+    )
+    coordinator = FormFillCoordinator(
+        app_config=dummy_app_config,
+        resources=resources,
+        logger=logging.getLogger("modal-test"),
+    )
+    bound_during_fill = {}
+
+    async def capture_context(self, page, app_config, job_context, **kwargs):
+        bound_during_fill.update(structlog.contextvars.get_contextvars())
+        return FillResult(completed=True, submitted=False, validation_errors=[], mode="modal_flow")
+
+    monkeypatch.setattr(ModalFlowFormFiller, "fill", capture_context)
+
+    await coordinator.fill(
+        MagicMock(),
+        JobApplicationContext(
+            job_id=7, job_url="https://example.com/job", job_title="Job", should_submit=False
+        ),
+    )
+
+    assert bound_during_fill == {"job_id": 7, "job_url": "https://example.com/job"}
+    assert "job_id" not in structlog.contextvars.get_contextvars()
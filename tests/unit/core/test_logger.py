@@ -46,3 +46,84 @@ def test_logging_setup_produces_correct_log_record(caplog):
     # The record.created attribute is a Unix timestamp.
     assert record.created >= pre_log_time, "The log record's timestamp should be after the pre-log time."
     assert record.created <= time.time(), "The log record's timestamp should be before the current time."
+
+
+def test_structlog_calls_below_level_skip_processors():
+    """
+    Tests that structured log calls below the configured level return before
+    any processor runs.
+    """
+    import structlog
+    from unittest.mock import MagicMock
+
+    wrapper_class = structlog.get_config()["wrapper_class"]
+    processor = MagicMock()
+    bound = wrapper_class(MagicMock(), processors=[processor], context={})
+
+    bound.log(logging.getLogger().getEffectiveLevel() - 1, "hidden")
+
+    processor.assert_not_called()
+
+
+def test_file_handler_buffers_until_error(tmp_path):
+    """
+    Tests that file records are written in batches, with errors flushed at once.
+    """
+    from core.logger import _build_file_handler
+
+    log_file = tmp_path / "app.log"
+    handler = _build_file_handler(log_file, logging.Formatter("%(message)s"))
+    file_handler = handler.target
+    try:
+        handler.handle(logging.makeLogRecord({"msg": "first", "levelno": logging.INFO}))
+        assert log_file.read_text() == ""
+
+        handler.handle(logging.makeLogRecord({"msg": "boom", "levelno": logging.ERROR}))
+        assert log_file.read_text().splitlines() == ["first", "boom"]
+    finally:
+        handler.close()
+        file_handler.close()
+
+
+def test_records_are_written_by_the_listener_thread():
+    """
+    Tests that the root logger only enqueues records and the console and file
+    handlers run behind the queue listener.
+    """
+    import logging.handlers
+    from core import logger as logger_module
+
+    root_handlers = logging.getLogger().handlers
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in root_handlers)
+    listener = logger_module._listener
+    assert listener is not None
+    assert any(isinstance(h, logging.StreamHandler) for h in listener.handlers)
+    assert not set(listener.handlers) & set(root_handlers)
+
+
+def test_get_structured_logger_is_memoized():
+    """
+    Tests that a structured logger is created once per name.
+    """
+    from core.logger import get_structured_logger
+
+    assert get_structured_logger("memo.test") is get_structured_logger("memo.test")
+    assert get_structured_logger("memo.test") is not get_structured_logger("memo.other")
+
+
+def test_structlog_event_becomes_stdlib_record(caplog):
+    """
+    Tests that a structured event is handed to standard logging as a record
+    carrying the event as its message and the bound fields as attributes.
+    """
+    from core.logger import get_structured_logger
+
+    structured = get_structured_logger("structlog.record.test").bind(selector="submit")
+    with caplog.at_level(logging.INFO):
+        structured.warning("selector_operation_retry", attempt=2)
+
+    record = caplog.records[-1]
+    assert record.name == "structlog.record.test"
+    assert record.levelno == logging.WARNING
+    assert record.getMessage() == "selector_operation_retry"
+    assert (record.selector, record.attempt) == ("submit", 2)
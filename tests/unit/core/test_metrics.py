@@ -11,7 +11,7 @@ from tempfile import TemporaryDirectory
 from dataclasses import dataclass, replace
 from pathlib import Path
 
-from core.metrics import MetricsCollector, get_metrics_collector
+from core.metrics import MetricsCollector, P2Quantile, get_metrics_collector
 from config import config, AppConfig
 
 
@@ -111,7 +111,32 @@ class TestMetricsCollector:
         assert metrics["failures"] == 0
         assert metrics["retries"] == 1
         assert metrics["total_duration_ms"] == 50.0
+
+    def test_record_selector_executions_batch(self, metrics_collector):
+        """Test recording all attempts of one operation in a single call."""
+        metrics_collector.record_selector_executions(
+            "test_selector",
+            [("retry", 50.0, 1, "Timeout"), ("failure", 120.0, 2, "Timeout")],
+            {"job_id": "12345"},
+        )
+
+        metrics = metrics_collector.selector_metrics["test_selector"]
+        assert metrics["total_executions"] == 2
+        assert metrics["retries"] == 1
+        assert metrics["failures"] == 1
+        assert metrics["total_duration_ms"] == 170.0
+        assert list(metrics["durations"]) == [50.0, 120.0]
+        assert [error["attempt"] for error in metrics["errors"]] == [2]
         
+    def test_record_blocked_call(self, metrics_collector):
+        """Test counting calls refused by an open circuit breaker."""
+        metrics_collector.record_blocked_call("test_selector")
+        metrics_collector.record_blocked_call("test_selector")
+
+        metrics = metrics_collector.get_selector_metrics("test_selector")
+        assert metrics["blocked_calls"] == 2
+        assert metrics["total_executions"] == 0
+
     def test_record_circuit_breaker_state_change(self, metrics_collector):
         """Test recording a circuit breaker state change."""
         # Record a state change from closed to open
@@ -136,6 +161,16 @@ class TestMetricsCollector:
         # Verify trip count didn't change
         assert metrics_collector.selector_metrics["test_selector"]["circuit_breaker_trips"] == 1
         
+    def test_circuit_breaker_strips_only_the_name_prefix(self, metrics_collector):
+        """Test that only the leading "selector_" of a breaker name is removed."""
+        metrics_collector.record_circuit_breaker_state_change(
+            breaker_name="selector_modal_selector_close",
+            old_state="closed",
+            new_state="open"
+        )
+
+        assert set(metrics_collector.selector_metrics) == {"modal_selector_close"}
+        
     def test_record_job_application(self, metrics_collector):
         """Test recording a job application."""
         # Record a successful job application
@@ -259,7 +294,20 @@ class TestMetricsCollector:
         # Verify only the last 5 durations were kept
         durations = metrics_collector.selector_metrics["test_selector"]["durations"]
         assert len(durations) == 5
-        assert durations == [500.0, 600.0, 700.0, 800.0, 900.0]
+        assert list(durations) == [500.0, 600.0, 700.0, 800.0, 900.0]
+
+    def test_p95_covers_samples_beyond_the_window(self, metrics_collector):
+        """Test that p95 is estimated from every execution, not only kept samples."""
+        for i in range(1, 201):
+            metrics_collector.record_selector_execution(
+                selector_name="test_selector",
+                status="success",
+                duration_ms=float(i)
+            )
+
+        metrics = metrics_collector.get_selector_metrics("test_selector")
+
+        assert metrics["p95_duration_ms"] == pytest.approx(190.0, abs=5.0)
         
     def test_max_errors(self, metrics_collector):
         """Test that errors are limited to max_errors."""
@@ -277,6 +325,17 @@ class TestMetricsCollector:
         assert len(errors) == 3
         assert [e["error"] for e in errors] == ["Error 2", "Error 3", "Error 4"]
         
+    def test_record_selector_execution_does_not_take_the_lock(self, metrics_collector):
+        """Test that recording an execution stays off the collector-wide lock."""
+        metrics_collector.lock = MagicMock()
+
+        metrics_collector.record_selector_execution(
+            selector_name="test_selector", status="failure", duration_ms=100.0
+        )
+
+        metrics_collector.lock.__enter__.assert_not_called()
+        assert metrics_collector.selector_metrics["test_selector"]["failures"] == 1
+
     def test_export_metrics_to_json(self, metrics_collector, app_config):
         """Test exporting metrics to a JSON file."""
         # Record some metrics
@@ -304,6 +363,93 @@ class TestMetricsCollector:
                 assert "selectors" in data["aggregated_metrics"]
                 assert "test_selector" in data["aggregated_metrics"]["selectors"]
 
+    def test_success_rate_is_rounded_only_on_export(self, metrics_collector, tmp_path):
+        """Test that reads return raw rates and exports round them for display."""
+        for status in ("success", "failure", "failure"):
+            metrics_collector.record_selector_execution(
+                selector_name="test_selector", status=status, duration_ms=100.0
+            )
+
+        rate = metrics_collector.get_selector_metrics("test_selector")["success_rate"]
+        assert rate == pytest.approx(100 / 3)
+
+        metrics_file_path = tmp_path / "metrics.json"
+        metrics_collector.export_metrics_to_json(str(metrics_file_path))
+        exported = json.loads(metrics_file_path.read_text())
+        selector = exported["aggregated_metrics"]["selectors"]["test_selector"]
+        assert selector["success_rate"] == 33.33
+
+
+class TestP2Quantile:
+    """Tests for the streaming quantile estimator."""
+
+    def test_empty_estimate(self):
+        assert P2Quantile(0.95).value() is None
+
+    def test_exact_below_five_samples(self):
+        estimator = P2Quantile(0.95)
+        for sample in (300.0, 100.0, 200.0):
+            estimator.add(sample)
+        assert estimator.value() == 300.0
+
+    def test_estimate_converges(self):
+        estimator = P2Quantile(0.95)
+        # A deterministic shuffle of 1..1000
+        for i in range(1000):
+            estimator.add(float((i * 389) % 1000 + 1))
+        assert estimator.value() == pytest.approx(950.0, rel=0.02)
+
+
+def test_export_metrics_to_json_without_orjson(metrics_collector, tmp_path):
+    """Test that the export falls back to compact stdlib JSON without orjson."""
+    metrics_collector.record_selector_execution(
+        selector_name="test_selector", status="success", duration_ms=100.0
+    )
+    metrics_file_path = tmp_path / "metrics.json"
+
+    with patch("core.metrics.orjson", None):
+        metrics_collector.export_metrics_to_json(str(metrics_file_path))
+
+    content = metrics_file_path.read_text()
+    assert "\n" not in content
+    assert "test_selector" in json.loads(content)["aggregated_metrics"]["selectors"]
+
+
+def test_export_creates_directory_once(metrics_collector, tmp_path):
+    """Test that repeated exports to one directory create it only once."""
+    metrics_file_path = tmp_path / "nested" / "metrics.json"
+
+    with patch("core.metrics.os.makedirs", wraps=os.makedirs) as mock_makedirs:
+        metrics_collector.export_metrics_to_json(str(metrics_file_path))
+        metrics_collector.export_metrics_to_json(str(metrics_file_path))
+
+    mock_makedirs.assert_called_once_with(str(metrics_file_path.parent), exist_ok=True)
+    assert metrics_file_path.exists()
+
+
+def test_selector_metrics_are_recomputed_only_when_changed(metrics_collector):
+    """Test that unchanged selectors reuse their derived metrics between reads."""
+    for name in ("selector1", "selector2"):
+        metrics_collector.record_selector_execution(
+            selector_name=name, status="success", duration_ms=100.0
+        )
+    metrics_collector.get_selector_metrics()
+
+    with patch.object(
+        metrics_collector,
+        "_calculate_derived_metrics_for_selector",
+        wraps=metrics_collector._calculate_derived_metrics_for_selector,
+    ) as mock_calculate:
+        metrics_collector.record_selector_execution(
+            selector_name="selector2", status="failure", duration_ms=300.0
+        )
+        metrics = metrics_collector.get_selector_metrics()
+        metrics_collector.get_selector_metrics()
+
+    mock_calculate.assert_called_once_with("selector2")
+    assert metrics["selector1"]["total_executions"] == 1
+    assert metrics["selector2"]["failures"] == 1
+
 
 def test_get_metrics_collector():
     """Test the singleton metrics collector."""
@@ -315,3 +461,41 @@ def test_get_metrics_collector():
         # Verify they are the same object
         assert collector1 is collector2
 
+
+
+def test_last_execution_time_is_reported_as_utc_iso(metrics_collector):
+    """Test that the monotonic execution time is reported as wall-clock UTC."""
+    before = int(time.time())
+    metrics_collector.record_selector_execution(
+        selector_name="test_selector", status="success", duration_ms=10.0
+    )
+
+    reported = metrics_collector.get_selector_metrics("test_selector")["last_execution_time"]
+
+    after = int(time.time())
+    candidates = {
+        time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        for second in range(before - 1, after + 1)
+    }
+    assert reported in candidates
+
+
+def test_get_metrics_collector_creates_one_instance_across_threads():
+    """Test that concurrent first calls share a single collector."""
+    import threading
+
+    with patch("core.metrics._instance", None), patch("structlog.get_logger"):
+        barrier = threading.Barrier(8)
+        collectors = []
+
+        def get_collector():
+            barrier.wait()
+            collectors.append(get_metrics_collector())
+
+        threads = [threading.Thread(target=get_collector) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len({id(collector) for collector in collectors}) == 1
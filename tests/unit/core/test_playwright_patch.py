@@ -0,0 +1,70 @@
+"""
+Unit tests for the lightweight Playwright stack capture patch.
+"""
+
+from unittest.mock import patch
+
+from playwright._impl import _connection
+
+from core import playwright_patch
+from core.playwright_patch import (
+    _build_lightweight_capture_stack_trace,
+    install_lightweight_stack_capture,
+)
+
+
+class TestLightweightStackCapture:
+    """Tests for the stack capture replacement."""
+
+    def test_capture_returns_api_name_without_frames(self):
+        """Test that the captured trace keeps the shape Playwright expects."""
+
+        capture = _build_lightweight_capture_stack_trace(
+            "<mapping>", _connection._PLAYWRIGHT_MODULE_PATH
+        )
+
+        def caller():
+            return capture()
+
+        trace = caller()
+
+        assert trace["frames"] == []
+        assert trace["title"] is None
+        assert "apiName" in trace
+
+    def test_capture_reports_outermost_api_boundary(self):
+        """Test that nested API calls are named after the outermost one, like upstream."""
+        # Code objects compiled with a filename under the given "package" path
+        # stand in for Playwright internals
+        namespace = {}
+        exec(compile(
+            "def outer_api(user_code):\n    return user_code()\n"
+            "def inner_api(capture):\n    return capture()\n",
+            "/fake_playwright/api.py",
+            "exec",
+        ), namespace)
+        capture = _build_lightweight_capture_stack_trace("<mapping>", "/fake_playwright")
+
+        def user_callback():
+            return namespace["inner_api"](lambda: capture())
+
+        trace = namespace["outer_api"](user_callback)
+
+        assert trace["apiName"] == "outer_api"
+
+    def test_install_replaces_hook_once(self):
+        """Test that installing swaps the private hook and is idempotent."""
+        with patch.object(_connection, "_capture_stack_trace"), \
+                patch.object(playwright_patch, "_installed", False):
+            assert install_lightweight_stack_capture() is True
+            hook = _connection._capture_stack_trace
+            assert hook.__qualname__.startswith("_build_lightweight_capture_stack_trace")
+            assert install_lightweight_stack_capture() is True
+            assert _connection._capture_stack_trace is hook
+
+    def test_install_skips_when_hook_missing(self):
+        """Test that Playwright is left untouched if the hook does not exist."""
+        with patch.object(_connection, "_capture_stack_trace", None), \
+                patch.object(playwright_patch, "_installed", False):
+            assert install_lightweight_stack_capture() is False
+            assert _connection._capture_stack_trace is None
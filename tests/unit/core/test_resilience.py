@@ -2,12 +2,18 @@
 Unit tests for the resilience module.
 """
 
+import gc
+from contextlib import contextmanager
+import weakref
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import time
 from typing import Any, Dict
 from dataclasses import dataclass, field
+import pybreaker
 from pybreaker import CircuitBreakerError
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
 from core.resilience import (
     SelectorCircuitBreaker, 
@@ -16,7 +22,10 @@ from core.resilience import (
     ResilienceExecutor,
     get_circuit_breaker_manager,
     get_selector_executor,
-    get_resilience_executor
+    get_resilience_executor,
+    _ms_with_two_decimals,
+    BackoffTable,
+    SelectorRetrySettings,
 )
 from config import AppConfig
 
@@ -72,6 +81,10 @@ def circuit_breaker_manager(mock_metrics_collector):
         recovery_timeout: int = 5
         expected_exception: type = Exception
 
+        @property
+        def excluded_exceptions(self):
+            return (self.expected_exception,)
+
     @dataclass
     class MockSelectorRetryOverrideConfig:
         overrides: Dict[str, Any] = field(default_factory=dict)
@@ -89,20 +102,19 @@ def circuit_breaker_manager(mock_metrics_collector):
 
 class MockBreaker:
     """Mock circuit breaker for testing."""
-    
+
     def __init__(self, should_fail=False):
         """Initialize with failure flag."""
         self.should_fail = should_fail
         self.call_count = 0
     
-    def __call__(self, fn):
-        """Return a callable that wraps the function."""
-        async def wrapper(*args, **kwargs):
-            self.call_count += 1
-            if self.should_fail:
-                raise CircuitBreakerError("Circuit breaker open")
-            return await fn(*args, **kwargs)
-        return wrapper
+    @contextmanager
+    def calling(self):
+        """Guard a block like pybreaker's calling(), refusing it when failing."""
+        self.call_count += 1
+        if self.should_fail:
+            raise CircuitBreakerError("Circuit breaker open")
+        yield
 
 
 @pytest.fixture
@@ -186,7 +198,16 @@ class TestSelectorCircuitBreaker:
         # Verify the breaker configuration
         assert breaker1.fail_max == 3
         assert breaker1.reset_timeout == 5
-        
+        assert breaker1.excluded_exceptions == (Exception,)
+
+    def test_get_selector_logger_binds_once(self, circuit_breaker_manager):
+        """Test that the per-selector logger is bound once and reused."""
+        logger1 = circuit_breaker_manager.get_selector_logger("test_selector")
+        logger2 = circuit_breaker_manager.get_selector_logger("test_selector")
+
+        assert logger1 is logger2
+        circuit_breaker_manager.logger.bind.assert_called_once_with(selector="test_selector")
+
     def test_get_all_states(self, circuit_breaker_manager):
         """Test getting the state of all circuit breakers."""
         # Create two breakers
@@ -204,6 +225,16 @@ class TestSelectorCircuitBreaker:
         assert states["selector1"] == "closed"
         assert states["selector2"] == "closed"
 
+    def test_get_all_states_follows_state_changes(self, circuit_breaker_manager):
+        """Test that the state mirror is updated by the breaker listeners."""
+        breaker = circuit_breaker_manager.get_breaker("selector1")
+
+        breaker.open()
+        assert circuit_breaker_manager.get_all_states() == {"selector1": "open"}
+
+        breaker.close()
+        assert circuit_breaker_manager.get_all_states() == {"selector1": "closed"}
+
 
 @pytest.mark.asyncio
 class TestSelectorExecutor:
@@ -214,9 +245,11 @@ class TestSelectorExecutor:
         # Call the method
         await selector_executor.click("test_selector")
         
-        # Verify page methods were called
-        mock_page.wait_for_selector.assert_called_once()
-        mock_page.click.assert_called_once()
+        # The click waits for the element itself; no separate wait round trip
+        mock_page.wait_for_selector.assert_not_called()
+        mock_page.click.assert_called_once_with(
+            "test_selector", timeout=selector_executor.app_config.performance.selector_timeout
+        )
         
     async def test_click_with_retry(self, selector_executor, mock_page):
         """Test click operation with retry on failure."""
@@ -227,31 +260,125 @@ class TestSelectorExecutor:
             nonlocal fail_count
             fail_count += 1
             if fail_count <= 2:
-                raise Exception("Simulated failure")
+                raise PlaywrightError("Simulated failure")
             
-        # Patch the wait_for_selector method to fail twice then succeed
-        mock_page.wait_for_selector.side_effect = fail_twice
+        # Patch the click method to fail twice then succeed
+        mock_page.click.side_effect = fail_twice
         
         # Call the method (should retry and succeed on 3rd attempt)
         await selector_executor.click("test_selector")
         
         # Verify it was called 3 times (2 failures + 1 success)
         assert fail_count == 3
-        # Verify click was called once (on the success)
-        mock_page.click.assert_called_once()
+        assert mock_page.click.call_count == 3
+
+    async def test_attempts_are_recorded_in_one_metrics_call(
+        self, selector_executor, mock_page, mock_metrics_collector
+    ):
+        """Test that all attempts of an operation reach the collector together."""
+        mock_page.click.side_effect = [PlaywrightError("Simulated failure"), None]
+
+        await selector_executor.click("test_selector")
+
+        mock_metrics_collector.record_selector_executions.assert_called_once()
+        selector_name, executions, _ = (
+            mock_metrics_collector.record_selector_executions.call_args.args
+        )
+        assert selector_name == "test_selector"
+        assert [(status, attempt) for status, _, attempt, _ in executions] == [
+            ("retry", 1), ("success", 2)
+        ]
         
     async def test_click_max_retries_exceeded(self, selector_executor, mock_page):
         """Test click operation when max retries are exceeded."""
         # Make all attempts fail
-        mock_page.wait_for_selector.side_effect = Exception("Simulated failure")
+        mock_page.click.side_effect = PlaywrightError("Simulated failure")
         
         # Call the method (should raise an exception)
-        with pytest.raises(Exception, match="Simulated failure"):
+        with pytest.raises(PlaywrightError, match="Simulated failure"):
             await selector_executor.click("test_selector")
         
-        # Verify page.click was never called
-        mock_page.click.assert_not_called()
+        # Verify every attempt was made
+        assert mock_page.click.call_count == 3
+
+    async def test_terminal_failure_is_logged_once(self, selector_executor, mock_page):
+        """Test that an operation failing every attempt emits one error event."""
+        mock_page.click.side_effect = PlaywrightError("Simulated failure")
+        op_logger = selector_executor.circuit_breaker_manager.get_selector_logger.return_value
+
+        with pytest.raises(PlaywrightError):
+            await selector_executor.click("test_selector")
+
+        op_logger.error.assert_called_once()
+        assert op_logger.error.call_args.args == ("selector_operation_failed_all_retries",)
+        assert op_logger.warning.call_count == 2
+
+    async def test_click_does_not_retry_non_playwright_errors(self, selector_executor, mock_page):
+        """Test that errors outside Playwright fail on the first attempt."""
+        mock_page.click.side_effect = ValueError("bug")
+
+        with pytest.raises(ValueError, match="bug"):
+            await selector_executor.click("test_selector")
+
+        mock_page.click.assert_called_once()
     
+    async def test_is_visible_waits_once_without_resilience(
+        self, selector_executor, mock_page, mock_metrics_collector
+    ):
+        """Test that a negative visibility check is a single wait, not a retried operation."""
+        mock_page.wait_for_selector.side_effect = PlaywrightTimeoutError("Timeout")
+
+        assert await selector_executor.is_visible("test_selector") is False
+
+        mock_page.wait_for_selector.assert_called_once_with(
+            "test_selector", timeout=1000, state="visible"
+        )
+        selector_executor.circuit_breaker_manager.get_breaker.assert_not_called()
+        mock_metrics_collector.record_selector_executions.assert_not_called()
+
+    async def test_is_visible_true_when_element_shows(self, selector_executor, mock_page):
+        """Test that a visible element is reported as visible."""
+        assert await selector_executor.is_visible("test_selector") is True
+
+    async def test_selector_plan_built_once_per_selector(self, selector_executor, mock_page):
+        """Test that repeated operations reuse the selector's plan and retry policy."""
+        await selector_executor.click("test_selector")
+        plan = selector_executor._selector_plan("test_selector")
+
+        await selector_executor.click("test_selector")
+
+        assert selector_executor._selector_plan("test_selector") is plan
+        assert list(selector_executor._selector_plans) == ["test_selector"]
+        selector_executor.circuit_breaker_manager.get_breaker.assert_called_once_with(
+            "test_selector"
+        )
+
+    async def test_context_not_bound_for_quiet_success(self, selector_executor, mock_page):
+        """Test that per-call context is only bound when something is logged."""
+        op_logger = selector_executor.circuit_breaker_manager.get_selector_logger.return_value
+        op_logger.is_enabled_for.return_value = False
+
+        with patch("core.resilience.bind_context") as mock_bind:
+            await selector_executor.click("test_selector", context={"job_id": 1})
+
+        mock_bind.assert_not_called()
+        op_logger.is_enabled_for.assert_called_once()
+
+    async def test_resolved_config_merges_overrides(self, selector_executor, mock_page):
+        """Test that selector overrides are merged over the defaults."""
+        selector_executor.app_config.selector_retry_overrides.overrides["flaky"] = {
+            "max_attempts": 1
+        }
+        mock_page.click.side_effect = PlaywrightError("Simulated failure")
+
+        with pytest.raises(PlaywrightError):
+            await selector_executor.click("flaky")
+
+        mock_page.click.assert_called_once()
+        settings = selector_executor._selector_plans["flaky"].settings
+        assert settings.max_attempts == 1
+        assert settings.initial_wait == 0.01
+
     async def test_circuit_breaker_open(self, selector_executor, mock_page):
         """Test operation when circuit breaker is open."""
         # Get the mock breaker manager
@@ -264,6 +391,108 @@ class TestSelectorExecutor:
         with pytest.raises(CircuitBreakerError, match="Circuit breaker open"):
             await selector_executor.click("test_selector")
 
+        # An open breaker is not retried
+        assert manager.get_breaker.return_value.call_count == 1
+
+    async def test_async_failures_open_the_breaker(
+        self, selector_executor, mock_metrics_collector
+    ):
+        """Test that failures raised while awaiting the operation count toward fail_max."""
+        breaker = pybreaker.CircuitBreaker(fail_max=2)
+        selector_executor.circuit_breaker_manager.get_breaker.return_value = breaker
+        operation = AsyncMock(side_effect=PlaywrightError("boom"))
+
+        # The second failure trips the breaker, which ends the retries
+        with pytest.raises(CircuitBreakerError):
+            await selector_executor.execute_operation("test_selector", operation)
+
+        assert operation.await_count == 2
+        assert breaker.current_state == pybreaker.STATE_OPEN
+        assert breaker.fail_counter == 2
+        # The call that trips the breaker ran, so it is a failure, not a blocked call
+        mock_metrics_collector.record_blocked_call.assert_not_called()
+
+    async def test_async_failures_reach_the_listener(
+        self, selector_executor, circuit_breaker_listener, mock_logger
+    ):
+        """Test that each failed async attempt is reported to the breaker listener."""
+        breaker = pybreaker.CircuitBreaker(fail_max=5, listeners=[circuit_breaker_listener])
+        selector_executor.circuit_breaker_manager.get_breaker.return_value = breaker
+        operation = AsyncMock(side_effect=PlaywrightError("boom"))
+
+        with pytest.raises(PlaywrightError):
+            await selector_executor.execute_operation("test_selector", operation)
+
+        failure_counts = [
+            call.kwargs["failure_count"] for call in mock_logger.error.call_args_list
+        ]
+        assert failure_counts == [1, 2, 3]
+        assert mock_logger.error.call_args.kwargs["threshold"] == 5
+
+    async def test_open_breaker_fails_before_the_operation(
+        self, selector_executor, mock_page, mock_metrics_collector
+    ):
+        """Test that a breaker still inside its reset timeout refuses the call up front."""
+        breaker = pybreaker.CircuitBreaker(reset_timeout=60)
+        breaker.open()
+        selector_executor.circuit_breaker_manager.get_breaker.return_value = breaker
+
+        with pytest.raises(CircuitBreakerError):
+            await selector_executor.click("test_selector")
+
+        mock_page.click.assert_not_called()
+        mock_metrics_collector.record_blocked_call.assert_called_once_with("test_selector")
+        mock_metrics_collector.record_selector_executions.assert_not_called()
+
+    async def test_open_breaker_lets_a_call_through_after_reset_timeout(
+        self, selector_executor, mock_page
+    ):
+        """Test that an expired open breaker is left to pybreaker to half-open."""
+        breaker = pybreaker.CircuitBreaker(reset_timeout=0)
+        breaker.open()
+        selector_executor.circuit_breaker_manager.get_breaker.return_value = breaker
+
+        await selector_executor.click("test_selector")
+
+        mock_page.click.assert_called_once()
+
+
+def test_ms_with_two_decimals():
+    """Test that monotonic_ns durations are logged as milliseconds with two decimals."""
+    assert _ms_with_two_decimals(12_345_678) == 12.34
+    assert _ms_with_two_decimals(0) == 0
+
+
+def test_backoff_table_matches_wait_exponential():
+    """Test that the tabulated backoff follows tenacity's exponential schedule."""
+    from tenacity import wait_exponential
+
+    settings = SelectorRetrySettings(
+        max_attempts=6, initial_wait=0.5, max_wait=5, exponential_base=2, use_jitter=False
+    )
+    backoff = BackoffTable(settings)
+    reference = wait_exponential(multiplier=0.5, min=0.5, max=5, exp_base=2)
+
+    for attempt_number in range(1, 6):
+        retry_state = MagicMock(attempt_number=attempt_number)
+        assert backoff(retry_state) == reference(retry_state)
+    assert backoff.delays == (0.5, 1.0, 2.0, 4.0, 5)
+
+
+@pytest.mark.parametrize("debug_enabled", [False, True])
+def test_retry_policy_attaches_attempt_logs_only_for_debug(debug_enabled):
+    """Test that tenacity's attempt log hooks are skipped when DEBUG is off."""
+    from tenacity import after_nothing, before_nothing
+
+    settings = SelectorRetrySettings(
+        max_attempts=3, initial_wait=0.01, max_wait=0.05, exponential_base=2, use_jitter=False
+    )
+    with patch("core.resilience.logger.isEnabledFor", return_value=debug_enabled):
+        policy = SelectorExecutor._build_retry_policy(settings, BackoffTable(settings))
+
+    assert (policy.before is not before_nothing) is debug_enabled
+    assert (policy.after is not after_nothing) is debug_enabled
+
 
 def test_get_circuit_breaker_manager(monkeypatch):
     """Test the singleton circuit breaker manager."""
@@ -306,6 +535,26 @@ async def test_get_selector_executor(mock_page, monkeypatch):
                 assert executor1 is not executor3
 
 
+def test_get_selector_executor_releases_collected_pages(monkeypatch):
+    """Test that a cached executor neither keeps its page alive nor outlives it."""
+    registry = weakref.WeakKeyDictionary()
+    monkeypatch.setattr("core.resilience._selector_executor", registry)
+
+    with patch("core.resilience.get_structured_logger"):
+        with patch("core.resilience.get_metrics_collector"):
+            with patch("core.resilience.get_circuit_breaker_manager"):
+                monkeypatch.setattr("core.resilience.config", MagicMock(spec=AppConfig))
+                page = AsyncMock()
+                executor = get_selector_executor(page)
+                assert executor.page is page
+
+                del page
+                gc.collect()
+
+                assert len(registry) == 0
+                assert executor.page is None
+
+
 class TestResilienceExecutor:
     """Tests for the ResilienceExecutor class."""
     
@@ -423,6 +672,13 @@ class TestResilienceExecutor:
                     mock_operation.assert_called_once()
                     # Cleanup should not be called if operation succeeds
                     mock_cleanup.assert_not_called()
+
+                    # The workflow overrides are resolved once and then reused
+                    mock_config.selector_retry_overrides.overrides = {
+                        "workflow": {"max_attempts": 1}
+                    }
+                    await executor.execute_workflow_with_retry("test_workflow", mock_operation)
+                    assert executor._workflow_retry() == (3, 0.1, 2)
     
     @pytest.mark.asyncio
     async def test_query_selector_with_retry(self, mock_page, monkeypatch):
@@ -6,6 +6,7 @@ from core.utils import (
     ask_user,
     # wait,
     wait_for_any_selector,
+    SelectorCache,
     # check_any_selector_present
 )
 
@@ -51,6 +52,32 @@ class TestAskUser:
 #         mock_time.sleep.assert_called_once_with(0.5)  # 500 ms = 0.5 seconds
 
 
+class TestSelectorCache:
+    """Test suite for SelectorCache."""
+
+    def test_reuses_locator_per_page_and_key(self):
+        """Test that a locator is created once per page and selector key."""
+        cache = SelectorCache({"fieldset": "form fieldset"})
+        mock_page = MagicMock()
+
+        first = cache.get(mock_page, "fieldset")
+        second = cache.get(mock_page, "fieldset")
+
+        assert first is second
+        mock_page.locator.assert_called_once_with("form fieldset")
+
+    def test_separate_locators_per_page(self):
+        """Test that different pages get their own locators."""
+        cache = SelectorCache({"fieldset": "form fieldset"})
+        page_a, page_b = MagicMock(), MagicMock()
+
+        cache.get(page_a, "fieldset")
+        cache.get(page_b, "fieldset")
+
+        page_a.locator.assert_called_once_with("form fieldset")
+        page_b.locator.assert_called_once_with("form fieldset")
+
+
 class TestWaitForAnySelector:
     """Test suite for wait_for_any_selector function."""
 
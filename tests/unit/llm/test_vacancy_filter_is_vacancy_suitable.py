@@ -177,3 +177,21 @@ async def test_is_vacancy_suitable_threshold_logic(
     assert final_log.match_percentage == match_percentage
     assert final_log.threshold == threshold
     assert final_log.result_status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_is_vacancy_suitable_uses_given_vacancy_data(
+    mock_db_get_vacancy,
+    mock_db_save_skill_match,
+    mock_read_resume,
+    mock_calculate_skill_match,
+    app_config,
+    mock_db_connection,
+):
+    """Test that a vacancy row supplied by the caller is not fetched again."""
+    vacancy = {"id": 7, "description": "A job."}
+
+    await is_vacancy_suitable(vacancy["id"], app_config, vacancy)
+
+    mock_db_get_vacancy.assert_not_called()
+    assert mock_calculate_skill_match.call_args.args[:2] == (7, "A job.")
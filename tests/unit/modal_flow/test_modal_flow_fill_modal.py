@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from modal_flow.modal_flow import ModalFlowRunner
+
+
+HANDLERS = (
+    "_handle_radio_groups",
+    "_handle_checkboxes",
+    "_handle_comboboxes",
+    "_handle_number_inputs",
+    "_handle_textboxes",
+)
+
+
+@pytest.fixture
+def runner():
+    runner = object.__new__(ModalFlowRunner)
+    runner.logger = MagicMock(spec=logging.Logger)
+    runner._document_uploader = MagicMock()
+    for name in HANDLERS:
+        setattr(runner, name, AsyncMock())
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_fill_modal_overlaps_upload_with_field_handlers(runner):
+    """Test that documents upload while fields are filled and finish before return."""
+    calls = []
+    upload_started = asyncio.Event()
+
+    async def upload(modal):
+        upload_started.set()
+        await asyncio.sleep(0)
+        calls.append("upload")
+
+    async def radios(modal, is_same_dialog=False):
+        # The upload must already be in flight while the first fields are handled
+        await upload_started.wait()
+        calls.append("radios")
+
+    runner._document_uploader.handle_modal = AsyncMock(side_effect=upload)
+    runner._handle_radio_groups.side_effect = radios
+
+    await runner._fill_modal(MagicMock())
+
+    assert "upload" in calls
+    for name in HANDLERS:
+        getattr(runner, name).assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fill_modal_cancels_upload_when_a_handler_fails(runner):
+    """Test that a failing field handler does not leave the upload running."""
+    upload_cancelled = asyncio.Event()
+
+    async def upload(modal):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            upload_cancelled.set()
+            raise
+
+    async def failing_radios(modal, is_same_dialog=False):
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    runner._document_uploader.handle_modal = AsyncMock(side_effect=upload)
+    runner._handle_radio_groups.side_effect = failing_radios
+
+    with pytest.raises(RuntimeError):
+        await runner._fill_modal(MagicMock())
+    await asyncio.sleep(0)
+
+    assert upload_cancelled.is_set()
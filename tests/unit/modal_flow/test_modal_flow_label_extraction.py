@@ -138,3 +138,17 @@ async def test_label_for_fallback_to_field_when_all_fail(modal_flow_runner):
     assert result == "field"
     modal_flow_runner._extract_label_from_siblings.assert_called_once_with(mock_element)
 
+
+
+@pytest.mark.asyncio
+async def test_label_for_resolves_direct_label_in_one_evaluate(modal_flow_runner):
+    """Test that aria/label[for] text is read with a single evaluate call."""
+    mock_element = MagicMock(spec=Locator)
+    mock_element.get_attribute = AsyncMock(return_value=None)
+    mock_element.evaluate = AsyncMock(return_value="  Years of Python  ")
+
+    result = await modal_flow_runner._label_for(mock_element)
+
+    assert result == "Years of Python"
+    mock_element.evaluate.assert_called_once()
+    mock_element.get_attribute.assert_not_called()
@@ -1,6 +1,7 @@
 """Unit tests for rule generation integration in RulesEngine."""
 
 import logging
+from dataclasses import replace
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from pathlib import Path
@@ -369,7 +370,9 @@ class TestRuleGenerationIntegration:
     ):
         """Test that rule is not processed when confidence is below threshold."""
         # Update learning config with higher threshold
-        rules_engine.learning_config.confidence_threshold = 0.95
+        rules_engine.learning_config = replace(
+            rules_engine.learning_config, confidence_threshold=0.95
+        )
         
         llm_decision = LLMDecision(
             decision="check",
@@ -4,7 +4,7 @@ from playwright.async_api import Page, Error as PlaywrightError, TimeoutError
 import sqlite3
 from dataclasses import dataclass
 
-from core.database import init_db
+from core.database import get_vacancies_by_ids, init_db, save_discovered_jobs
 from phases.processing import _is_job_suitable, _process_single_job, run_processing_phase
 
 
@@ -212,3 +212,138 @@ class TestRunProcessingPhase:
         await run_processing_phase(AsyncMock(), 0, True, app_config)
 
         mock_process_job.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("phases.processing.get_enriched_jobs")
+    @patch("phases.processing._is_job_suitable", new_callable=AsyncMock)
+    @patch("phases.processing._process_single_job", new_callable=AsyncMock)
+    @patch("phases.processing.wait", new_callable=AsyncMock)
+    @patch("phases.processing.FormFillCoordinator")
+    @patch("phases.processing.ModalFlowResources")
+    async def test_run_processing_phase_prefetches_next_suitability(
+        self,
+        mock_modal_resources,
+        mock_form_fill_coordinator,
+        mock_wait,
+        mock_process_job,
+        mock_is_suitable,
+        mock_get_jobs,
+        app_config,
+    ):
+        """The next job's suitability check is already started while applying."""
+        jobs = [(1, "l", "t1", "c", "d"), (2, "l", "t2", "c", "d")]
+        mock_get_jobs.return_value = jobs
+        mock_is_suitable.return_value = True
+        app_config.job_limits.max_jobs_to_process = 2
+        mock_form_fill_coordinator.return_value = MagicMock()
+        checks_started_while_applying = []
+
+        async def process_job(context, job_data, *args, suitability=None, **kwargs):
+            checks_started_while_applying.append(mock_is_suitable.call_count)
+            return await suitability
+
+        mock_process_job.side_effect = process_job
+
+        await run_processing_phase(AsyncMock(), 0, True, app_config)
+
+        # While job 1 is applied, the check for job 2 has been started too
+        assert checks_started_while_applying == [2, 2]
+        # Rows not stored in the db are passed as None and fetched by the filter
+        mock_is_suitable.assert_any_await(1, "t1", "d", app_config, None)
+        mock_is_suitable.assert_any_await(2, "t2", "d", app_config, None)
+
+    @pytest.mark.asyncio
+    @patch("phases.processing.get_enriched_jobs")
+    @patch("phases.processing._is_job_suitable", new_callable=AsyncMock)
+    @patch("phases.processing._process_single_job", new_callable=AsyncMock)
+    @patch("phases.processing.wait", new_callable=AsyncMock)
+    @patch("phases.processing.FormFillCoordinator")
+    @patch("phases.processing.ModalFlowResources")
+    async def test_run_processing_phase_no_prefetch_past_daily_limit(
+        self,
+        mock_modal_resources,
+        mock_form_fill_coordinator,
+        mock_wait,
+        mock_process_job,
+        mock_is_suitable,
+        mock_get_jobs,
+        app_config,
+    ):
+        """No check is prefetched for a job the daily limit would leave unapplied."""
+        mock_get_jobs.return_value = [(1, "l", "t1", "c", "d"), (2, "l", "t2", "c", "d")]
+        mock_is_suitable.return_value = True
+        app_config.general_settings.max_applications_per_day = 1
+        mock_form_fill_coordinator.return_value = MagicMock()
+
+        async def process_job(context, job_data, *args, suitability=None, **kwargs):
+            return await suitability
+
+        mock_process_job.side_effect = process_job
+
+        await run_processing_phase(AsyncMock(), 0, True, app_config)
+
+        mock_process_job.assert_awaited_once()
+        mock_is_suitable.assert_awaited_once_with(1, "t1", "d", app_config, None)
+
+    @pytest.mark.asyncio
+    @patch("phases.processing.get_enriched_jobs")
+    @patch("phases.processing._is_job_suitable", new_callable=AsyncMock)
+    @patch("phases.processing.update_job_status")
+    @patch("phases.processing.update_job_statuses")
+    @patch("phases.processing.wait", new_callable=AsyncMock)
+    @patch("phases.processing.FormFillCoordinator")
+    @patch("phases.processing.ModalFlowResources")
+    async def test_run_processing_phase_batches_filter_skips(
+        self,
+        mock_modal_resources,
+        mock_form_fill_coordinator,
+        mock_wait,
+        mock_update_statuses,
+        mock_update_status,
+        mock_is_suitable,
+        mock_get_jobs,
+        app_config,
+    ):
+        """Filter skips of a pass are written together instead of one commit each."""
+        mock_get_jobs.return_value = [(1, "l", "t1", "c", "d"), (2, "l", "t2", "c", "d")]
+        mock_is_suitable.return_value = False
+        app_config.job_limits.max_jobs_to_process = 2
+        mock_form_fill_coordinator.return_value = MagicMock()
+
+        await run_processing_phase(AsyncMock(), 0, True, app_config)
+
+        mock_update_status.assert_not_called()
+        mock_update_statuses.assert_any_call(
+            [(1, "skipped_filter"), (2, "skipped_filter")], app_config.session.db_conn
+        )
+
+    @pytest.mark.asyncio
+    @patch("phases.processing.get_enriched_jobs")
+    @patch("phases.processing._is_job_suitable", new_callable=AsyncMock)
+    @patch("phases.processing.wait", new_callable=AsyncMock)
+    @patch("phases.processing.FormFillCoordinator")
+    @patch("phases.processing.ModalFlowResources")
+    async def test_run_processing_phase_loads_vacancies_in_one_query(
+        self,
+        mock_modal_resources,
+        mock_form_fill_coordinator,
+        mock_wait,
+        mock_is_suitable,
+        mock_get_jobs,
+        app_config,
+    ):
+        """The suitability checks receive the stored rows loaded up front."""
+        save_discovered_jobs([(1, "l", "t1", "c"), (2, "l", "t2", "c")], app_config.session.db_conn)
+        mock_get_jobs.return_value = [(1, "l", "t1", "c", "d"), (2, "l", "t2", "c", "d")]
+        mock_is_suitable.return_value = False
+        app_config.job_limits.max_jobs_to_process = 2
+        mock_form_fill_coordinator.return_value = MagicMock()
+
+        with patch(
+            "phases.processing.get_vacancies_by_ids", wraps=get_vacancies_by_ids
+        ) as mock_get_vacancies:
+            await run_processing_phase(AsyncMock(), 0, True, app_config)
+
+        mock_get_vacancies.assert_called_once_with([1, 2], app_config.session.db_conn)
+        passed_rows = [call.args[4] for call in mock_is_suitable.await_args_list]
+        assert [row.title for row in passed_rows] == ["t1", "t2"]